@@ -0,0 +1,24 @@
+from .cairo1_test_suite_parser import ProtostarCasm, parse_hex_words
+
+CASM_JSON = {
+    "prime": "0x800000000000011000000000000000000000000000000000000000000000001",
+    "bytecode": [
+        "0xa0680017fff8000",
+        "0x7",
+        "0x800000000000011000000000000000000000000000000000000000000000000",
+    ],
+    "hints": [[0, ["memory[ap] = segments.add()"]]],
+    "test_entry_points": [{"name": "test_simple", "offset": 0}],
+}
+
+
+def test_parsing_hex_words():
+    assert parse_hex_words(["0x0", "0x7", "0xff"]) == [0, 7, 255]
+
+
+def test_loading_casm():
+    casm = ProtostarCasm.from_json(CASM_JSON)
+
+    assert casm.program.prime == 2**251 + 17 * 2**192 + 1
+    assert casm.program.data == [0xA0680017FFF8000, 7, 2**251 + 17 * 2**192]
+    assert casm.offset_map == {"test_simple": 0}
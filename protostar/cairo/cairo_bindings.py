@@ -1,4 +1,5 @@
 import json
+from importlib import metadata
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -21,6 +22,20 @@ class TestCollectorOutput:
     test_names: list[str]
 
 
+def get_bindings_fingerprint() -> str:
+    """
+    Identifies the build of the bindings. Local builds don't bump the version,
+    so the fingerprint covers the installed module file as well.
+    """
+    try:
+        version = metadata.version("cairo-python-bindings")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    module_path = Path(cairo_python_bindings.__file__)  # pyright: ignore
+    stat = module_path.stat()
+    return f"{version}:{module_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
 def compile_starknet_contract_to_casm_from_path(
     input_path: Path,
     output_path: Optional[Path] = None,
@@ -38,8 +38,8 @@ class CairoRunnerFacade:
         with self.new_runner() as function_runner:
             self.run_as_main(
                 function_runner,
+                offset,
                 *args,
-                entrypoint=offset,
                 hint_locals=hint_locals or {},
                 static_locals={
                     "__find_element_max_size": 2**20,
@@ -67,6 +67,7 @@ class CairoRunnerFacade:
     ):
         """
         Runs the program from the given entrypoint.
+        Arguments are felts, which are passed after the builtins.
 
         Additional params:
         typed_args - If true, the arguments are given as Cairo typed NamedTuple generated
@@ -93,6 +94,10 @@ class CairoRunnerFacade:
                 stack += [0]
             else:
                 stack += builtin_runner.initial_stack()
+        for arg in args:
+            stack.append(
+                arg % function_runner.program.prime if apply_modulo_to_args else arg
+            )
         end = function_runner.initialize_function_entrypoint(
             entrypoint=entrypoint, args=stack
         )
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Callable, Dict, Tuple
+
+from starkware.cairo.lang.vm.virtual_machine_base import VirtualMachineBase
+
+
+@dataclass(frozen=True)
+class HintCodeCacheStats:
+    compilations_count: int = 0
+    saved_compilations_count: int = 0
+
+    def __add__(self, other: "HintCodeCacheStats") -> "HintCodeCacheStats":
+        return HintCodeCacheStats(
+            compilations_count=self.compilations_count + other.compilations_count,
+            saved_compilations_count=self.saved_compilations_count
+            + other.saved_compilations_count,
+        )
+
+    def format(self) -> str:
+        return (
+            f"hint compilations: {self.compilations_count}, "
+            f"saved: {self.saved_compilations_count}"
+        )
+
+
+class HintCodeCache:
+    """
+    Code objects of compiled hints, reused by all Cairo VMs in the process.
+    The VM names each hint after its position in the program and uses the name to locate errors,
+    so a code object is reused only for the same name and the same source code.
+    """
+
+    def __init__(self) -> None:
+        self._filename_and_source_to_code: Dict[Tuple[str, str], CodeType] = {}
+        self.compilations_count = 0
+        self.saved_compilations_count = 0
+
+    def get_or_compile(
+        self, source: str, filename: str, compile_hint: Callable[[], CodeType]
+    ) -> CodeType:
+        key = (filename, source)
+        code = self._filename_and_source_to_code.get(key)
+        if code is not None:
+            self.saved_compilations_count += 1
+            return code
+
+        code = compile_hint()
+        self.compilations_count += 1
+        self._filename_and_source_to_code[key] = code
+        return code
+
+    def pop_stats(self) -> HintCodeCacheStats:
+        """
+        Returns counts since the previous call, so a worker reports each compilation once.
+        """
+        stats = HintCodeCacheStats(
+            compilations_count=self.compilations_count,
+            saved_compilations_count=self.saved_compilations_count,
+        )
+        self.compilations_count = 0
+        self.saved_compilations_count = 0
+        return stats
+
+
+hint_code_cache = HintCodeCache()
+
+_compile_hint_without_cache = VirtualMachineBase.compile_hint
+
+
+def _compile_hint(
+    vm: VirtualMachineBase, source: str, filename: str, hint_index: int, pc: Any
+) -> CodeType:
+    return hint_code_cache.get_or_compile(
+        source,
+        filename,
+        lambda: _compile_hint_without_cache(
+            vm, source, filename, hint_index=hint_index, pc=pc
+        ),
+    )
+
+
+def install_hint_code_cache() -> None:
+    """
+    Makes all Cairo VMs created in this process use the `hint_code_cache`.
+    """
+    VirtualMachineBase.compile_hint = _compile_hint  # type: ignore
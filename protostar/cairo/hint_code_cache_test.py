@@ -0,0 +1,31 @@
+from .hint_code_cache import HintCodeCache, HintCodeCacheStats
+
+
+def test_hint_is_compiled_once_per_filename_and_source():
+    hint_code_cache = HintCodeCache()
+
+    def compile_hint(source: str, filename: str):
+        return hint_code_cache.get_or_compile(
+            source, filename, lambda: compile(source, filename, mode="exec")
+        )
+
+    code = compile_hint("x = 1", "<hint0>")
+
+    assert compile_hint("x = 1", "<hint0>") is code
+    assert compile_hint("x = 1", "<hint1>") is not code
+    assert compile_hint("x = 2", "<hint0>") is not code
+    assert hint_code_cache.pop_stats() == HintCodeCacheStats(
+        compilations_count=3, saved_compilations_count=1
+    )
+    assert compile_hint("x = 1", "<hint0>") is code
+    assert hint_code_cache.pop_stats() == HintCodeCacheStats(
+        compilations_count=0, saved_compilations_count=1
+    )
+
+
+def test_formatting_stats():
+    stats = HintCodeCacheStats(
+        compilations_count=1, saved_compilations_count=1
+    ) + HintCodeCacheStats(compilations_count=2)
+
+    assert stats.format() == "hint compilations: 3, saved: 1"
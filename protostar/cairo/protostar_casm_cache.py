@@ -0,0 +1,69 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+from protostar.self.cache_io import CacheIO
+
+from .cairo1_test_suite_parser import ProtostarCasm
+
+ProtostarCasmCacheKey = str
+
+
+class ProtostarCasmCache:
+    """
+    Persistent cache of test suites compiled from Sierra to CASM, stored as built programs with offsets
+    of test cases, so a warm run neither calls the compiler nor parses CASM.
+    An entry is addressed by the Sierra program, compiled test cases and the build of the bindings.
+    """
+
+    _CACHE_NAMESPACE = "casm"
+    _FORMAT_VERSION = "1"
+
+    def __init__(self, project_root_path: Path, bindings_fingerprint: str):
+        self._project_root_path = project_root_path
+        self._bindings_fingerprint = bindings_fingerprint
+        self._cache_io: Optional[CacheIO] = None
+
+    def build_key(
+        self, named_tests: list[str], sierra_output: str
+    ) -> ProtostarCasmCacheKey:
+        digest = hashlib.sha256()
+        for part in [
+            self._FORMAT_VERSION,
+            cairo_lang_version,
+            self._bindings_fingerprint,
+            *named_tests,
+        ]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(sierra_output.encode("utf-8"))
+        return digest.hexdigest()
+
+    def read(self, key: ProtostarCasmCacheKey) -> Optional[ProtostarCasm]:
+        try:
+            serialized = self._get_cache_io().read_bytes(self._get_entry_name(key))
+            if serialized is None:
+                return None
+            protostar_casm = pickle.loads(serialized)
+            if not isinstance(protostar_casm, ProtostarCasm):
+                return None
+            return protostar_casm
+        # A corrupted entry must never break testing, the test suite is compiled again instead.
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def write(self, key: ProtostarCasmCacheKey, protostar_casm: ProtostarCasm) -> None:
+        self._get_cache_io().write_bytes(
+            self._get_entry_name(key), pickle.dumps(protostar_casm)
+        )
+
+    def _get_cache_io(self) -> CacheIO:
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+        return self._cache_io
+
+    def _get_entry_name(self, key: ProtostarCasmCacheKey) -> str:
+        return f"{self._CACHE_NAMESPACE}/{key}"
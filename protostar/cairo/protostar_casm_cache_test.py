@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from .cairo1_test_suite_parser import ProtostarCasm
+from .protostar_casm_cache import ProtostarCasmCache
+
+CASM_JSON = {
+    "prime": "0x800000000000011000000000000000000000000000000000000000000000001",
+    "bytecode": ["0x208b7fff7fff7ffe"],
+    "hints": [[0, ["memory[ap] = 1"]]],
+    "test_entry_points": [{"name": "test_ok", "offset": 0}],
+}
+
+
+def test_cached_casm_is_read_back(tmp_path: Path):
+    cache = ProtostarCasmCache(tmp_path, bindings_fingerprint="1.0.0")
+    key = cache.build_key(["test_ok"], "sierra")
+    protostar_casm = ProtostarCasm.from_json(CASM_JSON)
+
+    assert cache.read(key) is None
+
+    cache.write(key, protostar_casm)
+    cached_protostar_casm = cache.read(key)
+
+    assert cached_protostar_casm is not None
+    assert cached_protostar_casm.offset_map == {"test_ok": 0}
+    assert cached_protostar_casm.program.data == protostar_casm.program.data
+    assert cached_protostar_casm.program.hints == protostar_casm.program.hints
+
+
+def test_key_depends_on_tests_sierra_and_bindings(tmp_path: Path):
+    cache = ProtostarCasmCache(tmp_path, bindings_fingerprint="1.0.0")
+    key = cache.build_key(["test_ok"], "sierra")
+
+    assert key == cache.build_key(["test_ok"], "sierra")
+    assert key != cache.build_key(["test_ok", "test_other"], "sierra")
+    assert key != cache.build_key(["test_ok"], "other sierra")
+    assert key != ProtostarCasmCache(
+        tmp_path, bindings_fingerprint="1.0.1"
+    ).build_key(["test_ok"], "sierra")
@@ -1,5 +1,7 @@
+import hashlib
+import os
 from pathlib import Path
-from typing import List, Iterable
+from typing import List, Iterable, Optional
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
@@ -7,7 +9,8 @@ from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
 
 import protostar.cairo.cairo_bindings as cairo1
 from protostar.testing import TestCollector
-from protostar.testing.test_collector import TestSuiteInfo
+from protostar.testing.test_collection_cache import TestCollectionCache
+from protostar.testing.test_collector import SuiteFunctions, TestSuiteInfo
 from protostar.testing.test_suite import Cairo1TestSuite, TestSuite, TestCase
 
 
@@ -16,17 +19,85 @@ class Cairo1TestCollectionException(Exception):
 
 
 class Cairo1TestCollector(TestCollector):
-    def __init__(self, cairo_path: list[str]):
+    _CACHE_FORMAT_VERSION = "1"
+
+    def __init__(
+        self,
+        cairo_path: list[str],
+        processes_count: int = 1,
+        project_root_path: Optional[Path] = None,
+    ):
+        """
+        With `project_root_path`, test names and Sierra outputs of collected test suites are cached
+        in the project, until the test suite or any Cairo file in the Cairo path changes.
+        """
         super().__init__(
-            get_suite_function_names=self.collect_cairo1_tests_and_cache_outputs
+            get_suite_functions=self.collect_cairo1_tests_and_cache_outputs,
+            processes_count=processes_count,
+            test_collection_cache=TestCollectionCache(
+                project_root_path, build_key=self.build_test_suite_cache_key
+            )
+            if project_root_path is not None
+            else None,
         )
         self._cairo_path = cairo_path
         self._cairo_1_test_path_to_sierra_output: dict[Path, str] = {}
+        self._cairo_path_fingerprint: Optional[str] = None
+        self._dir_path_to_fingerprint: dict[Path, str] = {}
+
+    def build_test_suite_cache_key(self, file_path: Path) -> str:
+        """
+        Cairo 1 modules are resolved by the compiler, so instead of tracking dependencies of the test suite,
+        the key covers modification times of all Cairo files next to the test suite and in the Cairo path.
+        """
+        digest = hashlib.sha256()
+        for part in [
+            self._CACHE_FORMAT_VERSION,
+            self._get_cairo_path_fingerprint(),
+            self._get_dir_fingerprint(file_path.parent),
+        ]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(file_path.read_bytes())
+        return digest.hexdigest()
+
+    def _get_cairo_path_fingerprint(self) -> str:
+        if self._cairo_path_fingerprint is None:
+            self._cairo_path_fingerprint = self._build_files_fingerprint(
+                [Path(cp) for cp in self._cairo_path]
+            )
+        return self._cairo_path_fingerprint
+
+    def _get_dir_fingerprint(self, dir_path: Path) -> str:
+        if dir_path not in self._dir_path_to_fingerprint:
+            self._dir_path_to_fingerprint[dir_path] = self._build_files_fingerprint(
+                [dir_path]
+            )
+        return self._dir_path_to_fingerprint[dir_path]
+
+    @staticmethod
+    def _build_files_fingerprint(dir_paths: List[Path]) -> str:
+        file_paths: set[Path] = set()
+        for dir_path in dir_paths:
+            for root, dir_names, file_names in os.walk(dir_path):
+                dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+                file_paths.update(
+                    Path(root, file_name).resolve()
+                    for file_name in file_names
+                    if file_name.endswith(".cairo") or file_name.endswith(".toml")
+                )
+
+        digest = hashlib.sha256()
+        for file_path in sorted(file_paths):
+            stat = file_path.stat()
+            digest.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}\0".encode())
+        return digest.hexdigest()
 
     def collect_cairo1_tests_and_cache_outputs(
         self,
         file_path: Path,
-    ) -> List[str]:
+    ) -> SuiteFunctions:
+        # TODO: Collect all test suites in a single call, once the bindings can collect many files at once.
         try:
             collector_output = cairo1.collect_tests(
                 file_path,
@@ -43,10 +114,32 @@ class Cairo1TestCollector(TestCollector):
         self._cairo_1_test_path_to_sierra_output[
             file_path
         ] = collector_output.sierra_output
-        return [
-            namespaced_test_name.split("::")[-1]
-            for namespaced_test_name in collector_output.test_names
-        ]
+        # Cairo 1 test functions don't accept parameters.
+        return SuiteFunctions(
+            function_names=[
+                namespaced_test_name.split("::")[-1]
+                for namespaced_test_name in collector_output.test_names
+            ]
+        )
+
+    def _build_collection_cache_entry(
+        self, test_suite_path: Path, suite_functions: SuiteFunctions
+    ) -> dict:
+        return {
+            **super()._build_collection_cache_entry(test_suite_path, suite_functions),
+            "sierra_output": self._cairo_1_test_path_to_sierra_output[test_suite_path],
+        }
+
+    def _restore_collection_cache_entry(
+        self, test_suite_path: Path, entry: dict
+    ) -> bool:
+        sierra_output = entry.get("sierra_output")
+        if not sierra_output or not super()._restore_collection_cache_entry(
+            test_suite_path, entry
+        ):
+            return False
+        self._cairo_1_test_path_to_sierra_output[test_suite_path] = sierra_output
+        return True
 
     def _build_test_suite_from_test_suite_info(
         self, test_suite_info: TestSuiteInfo
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from .cairo1_test_collector import Cairo1TestCollector
+
+
+def test_directory_fingerprint_is_built_once_per_directory(
+    tmp_path: Path, mocker: MockerFixture
+):
+    tests_path = tmp_path / "tests"
+    tests_path.mkdir()
+    test_suite_paths = [tests_path / f"test_{index}.cairo" for index in range(3)]
+    for test_suite_path in test_suite_paths:
+        test_suite_path.write_text(f"// {test_suite_path.name}", encoding="utf-8")
+    test_collector = Cairo1TestCollector(cairo_path=[str(tmp_path / "src")])
+    build_files_fingerprint = mocker.spy(
+        Cairo1TestCollector, "_build_files_fingerprint"
+    )
+
+    keys = [
+        test_collector.build_test_suite_cache_key(test_suite_path)
+        for test_suite_path in test_suite_paths
+    ]
+
+    assert len(set(keys)) == len(test_suite_paths)
+    assert build_files_fingerprint.call_count == 2
@@ -9,6 +9,9 @@ from starkware.cairo.lang.compiler.program import Program
 
 from protostar.cairo import CairoCompiler, CairoCompilerConfig
 from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+from protostar.cairo.protostar_casm_cache import ProtostarCasmCache
+from protostar.cairo.hint_code_cache import install_hint_code_cache
+from protostar.cairo_testing.cairo_hint_local_factory import CairoSuiteHintLocals
 from protostar.cairo_testing.execution_environments.cairo_setup_execution_environment import (
     CairoSetupExecutionEnvironment,
 )
@@ -22,7 +25,7 @@ from protostar.compiler import (
     ProjectCompilerConfig,
 )
 from protostar.configuration_file import ConfigurationFileFactory
-from protostar.starknet import ReportedException
+from protostar.starknet import CompilationCache, ReportedException
 from protostar.protostar_exception import ProtostarException
 from protostar.testing import (
     UnexpectedBrokenTestSuiteResult,
@@ -70,6 +73,9 @@ class Cairo1TestRunner:
         gas_estimation_enabled: bool = False,
     ):
         self._gas_estimation_enabled = gas_estimation_enabled
+        self._protostar_casm_cache = ProtostarCasmCache(
+            project_root_path, bindings_fingerprint=cairo1.get_bindings_fingerprint()
+        )
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
         include_paths = include_paths or []
@@ -89,6 +95,7 @@ class Cairo1TestRunner:
             configuration_file=configuration_file,
             default_config=project_compiler_config,
             project_cairo_path_builder=self.project_cairo_path_builder,
+            compilation_cache=CompilationCache(project_root_path),
         )
 
         project_cairo_path = (
@@ -105,21 +112,25 @@ class Cairo1TestRunner:
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
-        asyncio.run(
-            cls(
-                include_paths=args.include_paths,
-                project_root_path=args.project_root_path,
-                profiling=args.profiling,
-                cwd=args.cwd,
-                shared_tests_state=args.shared_tests_state,
-                active_profile_name=args.active_profile_name,
-                gas_estimation_enabled=args.gas_estimation_enabled,
-            ).run_test_suite(
-                test_suite=args.test_suite,
-                testing_seed=args.testing_seed,
-                max_steps=args.max_steps,
+        install_hint_code_cache()
+        try:
+            asyncio.run(
+                cls(
+                    include_paths=args.include_paths,
+                    project_root_path=args.project_root_path,
+                    profiling=args.profiling,
+                    cwd=args.cwd,
+                    shared_tests_state=args.shared_tests_state,
+                    active_profile_name=args.active_profile_name,
+                    gas_estimation_enabled=args.gas_estimation_enabled,
+                ).run_test_suite(
+                    test_suite=args.test_suite,
+                    testing_seed=args.testing_seed,
+                    max_steps=args.max_steps,
+                )
             )
-        )
+        finally:
+            args.shared_tests_state.flush()
 
     async def _build_execution_state(self, test_config: TestConfig):
         return await CairoTestExecutionState.from_test_config(
@@ -190,16 +201,7 @@ class Cairo1TestRunner:
             )
             test_execution_state = await self._build_execution_state(test_config)
 
-            casm_json = cairo1.compile_protostar_sierra_to_casm(
-                named_tests=[
-                    test_case.test_fn_name for test_case in test_suite.test_cases
-                ],
-                input_data=test_suite.sierra_output,
-            )
-
-            assert casm_json, f"No CASM was emitted for {test_suite.test_path}"
-
-            protostar_casm = ProtostarCasm.from_json(casm_json)
+            protostar_casm = self._compile_test_suite(test_suite)
 
             test_suite.add_offsets_to_cases(offset_map=protostar_casm.offset_map)
 
@@ -207,8 +209,33 @@ class Cairo1TestRunner:
                 test_suite=test_suite,
                 program=protostar_casm.program,
                 test_execution_state=test_execution_state,
+                suite_hint_locals=CairoSuiteHintLocals(test_execution_state),
             )
 
+    def _compile_test_suite(self, test_suite: Cairo1TestSuite) -> ProtostarCasm:
+        """
+        Chunks of a split test suite are compiled for the same test functions,
+        so workers running sibling chunks load the program from the same cache entry.
+        """
+        named_tests = test_suite.compiled_test_fn_names
+        cache_key = self._protostar_casm_cache.build_key(
+            named_tests=named_tests, sierra_output=test_suite.sierra_output
+        )
+        protostar_casm = self._protostar_casm_cache.read(cache_key)
+        if protostar_casm is not None:
+            return protostar_casm
+
+        casm_json = cairo1.compile_protostar_sierra_to_casm(
+            named_tests=named_tests,
+            input_data=test_suite.sierra_output,
+        )
+
+        assert casm_json, f"No CASM was emitted for {test_suite.test_path}"
+
+        protostar_casm = ProtostarCasm.from_json(casm_json)
+        self._protostar_casm_cache.write(cache_key, protostar_casm)
+        return protostar_casm
+
     @contextmanager
     def suite_exception_handling(self, test_suite: TestSuite):
         try:
@@ -237,12 +264,14 @@ class Cairo1TestRunner:
         test_suite: TestSuite,
         program: Program,
         test_execution_state: CairoTestExecutionState,
+        suite_hint_locals: CairoSuiteHintLocals,
     ) -> None:
         for test_case in test_suite.test_cases:
             test_result = await self._invoke_test_case(
                 test_case=test_case,
                 program=program,
                 initial_state=test_execution_state,
+                suite_hint_locals=suite_hint_locals,
             )
             self.shared_tests_state.put_result(test_result)
 
@@ -251,6 +280,7 @@ class Cairo1TestRunner:
         initial_state: CairoTestExecutionState,
         test_case: TestCase,
         program: Program,
+        suite_hint_locals: CairoSuiteHintLocals,
     ) -> TestResult:
         state: CairoTestExecutionState = initial_state.fork()
         assert isinstance(
@@ -270,6 +300,7 @@ class Cairo1TestRunner:
         test_execution_environment = CairoTestExecutionEnvironment(
             state=state,
             program=program,
+            suite_hint_locals=suite_hint_locals,
         )
         return await Cairo1TestCaseRunner(
             function_executor=test_execution_environment,
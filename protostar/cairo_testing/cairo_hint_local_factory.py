@@ -1,7 +1,7 @@
 # pylint: disable=duplicate-code
 from typing import List
 
-from protostar.cairo import HintLocal
+from protostar.cairo import HintLocal, HintLocalsDict
 from protostar.cairo_testing import CairoTestExecutionState
 from protostar.cheatable_starknet.callable_hint_locals import (
     StoreHintLocal,
@@ -40,6 +40,7 @@ from protostar.cheatable_starknet.controllers.expect_events_controller import (
 )
 from protostar.compiler import ProjectCompiler
 from protostar.testing import Hook
+from protostar.testing.test_context import TestContextHintLocal
 
 
 class CairoSharedHintLocalFactory:
@@ -54,13 +55,49 @@ class CairoSharedHintLocalFactory:
         self.project_compiler = project_compiler
         self._test_finish_hook = test_finish_hook
         self._test_execution_state = test_execution_state
+        self._block_info_controller = BlockInfoController(
+            cheatable_state=cheatable_state
+        )
+        self._contracts_controller = ContractsController(
+            cheatable_state=cheatable_state
+        )
+        self._storage_controller = StorageController(cheatable_state=cheatable_state)
+        self._expect_call_controller = ExpectCallController(
+            test_finish_hook=test_finish_hook,
+            cheatable_state=test_execution_state.cheatable_state,
+        )
+        self._expect_events_controller = ExpectEventsController(
+            test_finish_hook=test_finish_hook,
+            test_execution_state=test_execution_state,
+            cheatable_state=test_execution_state.cheatable_state,
+        )
 
-    def build_hint_locals(self) -> List[HintLocal]:
-        block_info_controller = BlockInfoController(
-            cheatable_state=self.cheatable_state
+    def rebind(
+        self, test_execution_state: CairoTestExecutionState, test_finish_hook: Hook
+    ) -> None:
+        """
+        Points hint locals built by this factory to another test execution state and finish hook.
+        """
+        self.cheatable_state = test_execution_state.cheatable_state
+        self._test_finish_hook = test_finish_hook
+        self._test_execution_state = test_execution_state
+        self._block_info_controller.rebind(cheatable_state=self.cheatable_state)
+        self._contracts_controller.rebind(cheatable_state=self.cheatable_state)
+        self._storage_controller.rebind(cheatable_state=self.cheatable_state)
+        self._expect_call_controller.rebind(
+            test_finish_hook=test_finish_hook,
+            cheatable_state=self.cheatable_state,
         )
-        contracts_controller = ContractsController(cheatable_state=self.cheatable_state)
-        storage_controller = StorageController(cheatable_state=self.cheatable_state)
+        self._expect_events_controller.rebind(
+            test_finish_hook=test_finish_hook,
+            test_execution_state=test_execution_state,
+            cheatable_state=self.cheatable_state,
+        )
+
+    def build_hint_locals(self) -> List[HintLocal]:
+        block_info_controller = self._block_info_controller
+        contracts_controller = self._contracts_controller
+        storage_controller = self._storage_controller
 
         declare_cairo0_cheatcode = DeclareCairo0HintLocal(
             project_compiler=self.project_compiler,
@@ -73,10 +110,7 @@ class CairoSharedHintLocalFactory:
             contracts_controller=contracts_controller,
         )
 
-        expect_call_controller = ExpectCallController(
-            test_finish_hook=self._test_finish_hook,
-            cheatable_state=self._test_execution_state.cheatable_state,
-        )
+        expect_call_controller = self._expect_call_controller
 
         return [
             WarpHintLocal(block_info_controller=block_info_controller),
@@ -101,13 +135,7 @@ class CairoSharedHintLocalFactory:
             InvokeHintLocal(contracts_controller=contracts_controller),
             StoreHintLocal(storage_controller=storage_controller),
             LoadHintLocal(storage_controller=storage_controller),
-            ExpectEventsHintLocal(
-                controller=ExpectEventsController(
-                    test_finish_hook=self._test_finish_hook,
-                    test_execution_state=self._test_execution_state,
-                    cheatable_state=self._test_execution_state.cheatable_state,
-                ),
-            ),
+            ExpectEventsHintLocal(controller=self._expect_events_controller),
             MockCallHintLocal(controller=contracts_controller),
             ExpectCallHintLocal(controller=expect_call_controller),
             AssertExpectCallHintLocal(controller=expect_call_controller),
@@ -128,3 +156,37 @@ class CairoTestHintLocalFactory:
 
     def build_hint_locals(self) -> list[HintLocal]:
         return self._shared_hint_local_factory.build_hint_locals()
+
+
+class CairoSuiteHintLocals:
+    """
+    Hint locals of Cairo 1 test cases, built once per test suite.
+    Each test case rebinds them to its own forked state and finish hook.
+    """
+
+    def __init__(self, test_execution_state: CairoTestExecutionState):
+        self._shared_hint_local_factory = CairoSharedHintLocalFactory(
+            cheatable_state=test_execution_state.cheatable_state,
+            project_compiler=test_execution_state.project_compiler,
+            test_execution_state=test_execution_state,
+            test_finish_hook=Hook(),
+        )
+        self._hint_locals: HintLocalsDict = {
+            hint_local.name: hint_local.build()
+            for hint_local in CairoTestHintLocalFactory(
+                shared_hint_local_factory=self._shared_hint_local_factory
+            ).build_hint_locals()
+        }
+
+    def bind(
+        self, test_execution_state: CairoTestExecutionState, test_finish_hook: Hook
+    ) -> HintLocalsDict:
+        self._shared_hint_local_factory.rebind(
+            test_execution_state=test_execution_state,
+            test_finish_hook=test_finish_hook,
+        )
+        context_hint_local = TestContextHintLocal(test_execution_state.context)
+        return {
+            **self._hint_locals,
+            context_hint_local.name: context_hint_local.build(),
+        }
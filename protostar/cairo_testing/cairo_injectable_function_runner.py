@@ -44,7 +44,7 @@ class CairoInjectableFunctionRunner:
     ):
         with self.vm_exception_handling():
             self._cairo_runner_facade.run_from_offset(
-                offset=offset, hint_locals=self._hint_locals, *args, **kwargs
+                offset, *args, hint_locals=self._hint_locals, **kwargs
             )
             if self._cairo_runner_facade.did_panic():
                 raise SimpleReportedException(
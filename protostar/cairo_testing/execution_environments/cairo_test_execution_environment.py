@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from starkware.cairo.lang.compiler.program import Program
 
@@ -14,6 +14,7 @@ from .cairo_execution_environment import CairoExecutionEnvironment
 from ..cairo_hint_local_factory import (
     CairoTestHintLocalFactory,
     CairoSharedHintLocalFactory,
+    CairoSuiteHintLocals,
 )
 
 
@@ -22,7 +23,12 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
         self,
         state: CairoTestExecutionState,
         program: Program,
+        suite_hint_locals: Optional[CairoSuiteHintLocals] = None,
     ):
+        """
+        `suite_hint_locals` are rebound to the `state` instead of building new hint locals.
+        """
+        self._suite_hint_locals = suite_hint_locals
         self._finish_hook = (
             Hook()
         )  # assigned before super call, because _get_hint_locals uses this hook
@@ -48,6 +54,11 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
                 await self.run_cairo_function(function_identifier, *args, **kwargs)
 
     def _get_hint_locals(self, state: CairoTestExecutionState) -> HintLocalsDict:
+        if self._suite_hint_locals is not None:
+            return self._suite_hint_locals.bind(
+                test_execution_state=state, test_finish_hook=self._finish_hook
+            )
+
         hint_locals: HintLocalsDict = {}
         cheatcode_factory = CairoTestHintLocalFactory(
             shared_hint_local_factory=CairoSharedHintLocalFactory(
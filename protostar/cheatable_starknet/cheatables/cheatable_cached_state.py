@@ -14,6 +14,7 @@ from typing_extensions import Self
 
 from protostar.cheatable_starknet.controllers.expect_events_controller import Event
 from protostar.starknet.address import Address
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
 from protostar.cheatable_starknet.controllers.block_info import BlockInfoController
 from protostar.starknet.selector import Selector
 from protostar.starknet.types import ClassHashType
@@ -35,17 +36,32 @@ class CheatableCachedState(CachedState):
             contract_class_cache=contract_class_cache,
         )
 
-        self._target_address_to_pranked_address: dict[Address, Address] = {}
+        # Maps with immutable values are copied on write, so copying the state doesn't depend on their size.
+        self._target_address_to_pranked_address: CopyOnWriteDict[
+            Address, Address
+        ] = CopyOnWriteDict()
         self.mocked_calls: dict[Address, dict[Selector, CairoData]] = {}
-        self.event_selector_to_name_map: Dict[int, str] = {}
+        self.event_selector_to_name_map: CopyOnWriteDict[
+            int, str
+        ] = CopyOnWriteDict()
         self.emitted_events: list[Event] = []
-        self.event_name_to_contract_abi_map: Dict[str, AbiType] = {}
-        self.class_hash_to_contract_abi_map: Dict[ClassHashType, AbiType] = {}
-        self.contract_address_to_class_hash_map: Dict[Address, ClassHashType] = {}
+        self.event_name_to_contract_abi_map: CopyOnWriteDict[
+            str, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_abi_map: CopyOnWriteDict[
+            ClassHashType, AbiType
+        ] = CopyOnWriteDict()
+        self.contract_address_to_class_hash_map: CopyOnWriteDict[
+            Address, ClassHashType
+        ] = CopyOnWriteDict()
         self.expected_contract_calls: dict[Address, list[ExpectedCall]] = {}
 
-        self.contract_address_to_block_timestamp: dict[Address, int] = {}
-        self.contract_address_to_block_number: dict[Address, int] = {}
+        self.contract_address_to_block_timestamp: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
+        self.contract_address_to_block_number: CopyOnWriteDict[
+            Address, int
+        ] = CopyOnWriteDict()
 
     def add_mocked_response(
         self,
@@ -85,28 +101,28 @@ class CheatableCachedState(CachedState):
         )
 
         copied._target_address_to_pranked_address = (
-            self._target_address_to_pranked_address.copy()
+            self._target_address_to_pranked_address.fork()
         )
         copied.mocked_calls = self.mocked_calls.copy()
 
-        copied.event_selector_to_name_map = self.event_selector_to_name_map.copy()
+        copied.event_selector_to_name_map = self.event_selector_to_name_map.fork()
 
         copied.event_name_to_contract_abi_map = (
-            self.event_name_to_contract_abi_map.copy()
+            self.event_name_to_contract_abi_map.fork()
         )
         copied.class_hash_to_contract_abi_map = (
-            self.class_hash_to_contract_abi_map.copy()
+            self.class_hash_to_contract_abi_map.fork()
         )
         copied.contract_address_to_class_hash_map = (
-            self.contract_address_to_class_hash_map.copy()
+            self.contract_address_to_class_hash_map.fork()
         )
         copied.expected_contract_calls = self.expected_contract_calls.copy()
 
         copied.contract_address_to_block_timestamp = (
-            self.contract_address_to_block_timestamp.copy()
+            self.contract_address_to_block_timestamp.fork()
         )
         copied.contract_address_to_block_number = (
-            self.contract_address_to_block_number.copy()
+            self.contract_address_to_block_number.fork()
         )
         copied.emitted_events = self.emitted_events.copy()
 
@@ -116,10 +132,9 @@ class CheatableCachedState(CachedState):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent._target_address_to_pranked_address = {
-            **parent._target_address_to_pranked_address,
-            **self._target_address_to_pranked_address,
-        }
+        self._target_address_to_pranked_address.apply(
+            parent._target_address_to_pranked_address
+        )
 
         parent.mocked_calls = {**parent.mocked_calls}
 
@@ -133,36 +148,22 @@ class CheatableCachedState(CachedState):
             else:
                 parent.mocked_calls[address] = self.mocked_calls[address]
 
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
-
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
-
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
+        self.event_selector_to_name_map.apply(parent.event_selector_to_name_map)
+        self.event_name_to_contract_abi_map.apply(parent.event_name_to_contract_abi_map)
+        self.class_hash_to_contract_abi_map.apply(parent.class_hash_to_contract_abi_map)
+        self.contract_address_to_class_hash_map.apply(
+            parent.contract_address_to_class_hash_map
+        )
         parent.expected_contract_calls = {
             **parent.expected_contract_calls,
             **self.expected_contract_calls,
         }
-        parent.contract_address_to_block_timestamp = {
-            **parent.contract_address_to_block_timestamp,
-            **self.contract_address_to_block_timestamp,
-        }
-        parent.contract_address_to_block_number = {
-            **parent.contract_address_to_block_number,
-            **self.contract_address_to_block_number,
-        }
+        self.contract_address_to_block_timestamp.apply(
+            parent.contract_address_to_block_timestamp
+        )
+        self.contract_address_to_block_number.apply(
+            parent.contract_address_to_block_number
+        )
         parent.emitted_events = [
             *parent.emitted_events,
             *self.emitted_events,
@@ -1,8 +1,9 @@
 # pylint: disable=duplicate-code
 import logging
+from collections import OrderedDict
 import re
 from dataclasses import dataclass
-from typing import Optional, Tuple, cast
+from typing import ClassVar, Optional, Tuple, cast
 from copy import deepcopy
 
 from starkware.starknet.business_logic.execution.objects import (
@@ -35,7 +36,11 @@ from starkware.starkware_utils.error_handling import (
     StarkException,
     wrap_with_stark_exception,
 )
-from starkware.starknet.services.api.contract_class import EntryPointType
+from starkware.starknet.services.api.contract_class import (
+    ContractClass,
+    ContractEntryPoint,
+    EntryPointType,
+)
 
 from protostar.starknet import Address
 from protostar.cheatable_starknet.controllers.transaction_revert_exception import (
@@ -57,6 +62,23 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     max_steps: Optional[int] = None
     "``None`` means default Cairo value."
 
+    MAX_VALIDATED_CONTRACT_CLASSES: ClassVar[int] = 128
+    MAX_SELECTED_ENTRY_POINTS: ClassVar[int] = 1024
+
+    validated_contract_classes: ClassVar[
+        "OrderedDict[bytes, ContractClass]"
+    ] = OrderedDict()
+    """
+    Recently used contract classes, which passed validation, by class hash.
+    A class hash identifies the contract class, so the cache is shared by all states in the process.
+    Only the most recently used classes are kept, so a long-lived worker doesn't keep classes of every run.
+    """
+
+    selected_entry_points: ClassVar[
+        "OrderedDict[Tuple[bytes, EntryPointType, int], ContractEntryPoint]"
+    ] = OrderedDict()
+    "Recently used entry points of validated contract classes by class hash, entry point type and selector."
+
     @classmethod
     def create_for_protostar(
         cls,
@@ -103,12 +125,14 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                 message="Fraud attempt blocked.",
             )
 
-        contract_class = state.get_contract_class(class_hash=class_hash)
-        contract_class.validate()
-
-        entry_point = self._get_selected_entry_point(
+        # region Modified Starknet code.
+        contract_class = self._get_validated_contract_class(
+            state=state, class_hash=class_hash
+        )
+        entry_point = self._get_cached_selected_entry_point(
             contract_class=contract_class, class_hash=class_hash
         )
+        # endregion
 
         # Run the specified contract entry point with given calldata.
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
@@ -221,6 +245,51 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         return runner, syscall_handler
 
+    @staticmethod
+    def _get_validated_contract_class(
+        state: SyncState, class_hash: bytes
+    ) -> ContractClass:
+        contract_class = CheatableExecuteEntryPoint.validated_contract_classes.get(
+            class_hash
+        )
+        if contract_class is not None:
+            CheatableExecuteEntryPoint.validated_contract_classes.move_to_end(
+                class_hash
+            )
+            return contract_class
+
+        contract_class = state.get_contract_class(class_hash=class_hash)
+        contract_class.validate()
+        CheatableExecuteEntryPoint.validated_contract_classes[
+            class_hash
+        ] = contract_class
+        while (
+            len(CheatableExecuteEntryPoint.validated_contract_classes)
+            > CheatableExecuteEntryPoint.MAX_VALIDATED_CONTRACT_CLASSES
+        ):
+            CheatableExecuteEntryPoint.validated_contract_classes.popitem(last=False)
+        return contract_class
+
+    def _get_cached_selected_entry_point(
+        self, contract_class: ContractClass, class_hash: bytes
+    ) -> ContractEntryPoint:
+        key = (class_hash, self.entry_point_type, self.entry_point_selector)
+        entry_point = CheatableExecuteEntryPoint.selected_entry_points.get(key)
+        if entry_point is not None:
+            CheatableExecuteEntryPoint.selected_entry_points.move_to_end(key)
+            return entry_point
+
+        entry_point = self._get_selected_entry_point(
+            contract_class=contract_class, class_hash=class_hash
+        )
+        CheatableExecuteEntryPoint.selected_entry_points[key] = entry_point
+        while (
+            len(CheatableExecuteEntryPoint.selected_entry_points)
+            > CheatableExecuteEntryPoint.MAX_SELECTED_ENTRY_POINTS
+        ):
+            CheatableExecuteEntryPoint.selected_entry_points.popitem(last=False)
+        return entry_point
+
     async def execute_for_testing(
         self,
         state: State,
@@ -15,6 +15,9 @@ class BlockInfoController:
     def __init__(self, cheatable_state: "CheatableCachedState"):
         self.cheatable_state = cheatable_state
 
+    def rebind(self, cheatable_state: "CheatableCachedState"):
+        self.cheatable_state = cheatable_state
+
     def get_for_contract(self, contract_address: Address) -> BlockInfo:
         block_info = self.cheatable_state.block_info
 
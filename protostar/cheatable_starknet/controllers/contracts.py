@@ -6,13 +6,8 @@ from typing import List, Optional, cast
 from starkware.starknet.business_logic.execution.objects import CallType
 from starkware.starknet.business_logic.execution.objects import Event as StarknetEvent
 from starkware.python.utils import to_bytes, from_bytes
-from starkware.starknet.business_logic.transaction.objects import InternalDeclare
-from starkware.starknet.public.abi import AbiType, CONSTRUCTOR_ENTRY_POINT_SELECTOR
-from starkware.starknet.services.api.gateway.transaction import (
-    DEFAULT_DECLARE_SENDER_ADDRESS,
-)
+from starkware.starknet.public.abi import CONSTRUCTOR_ENTRY_POINT_SELECTOR
 from starkware.starknet.testing.contract import DeclaredClass
-from starkware.starknet.testing.contract_utils import get_abi, EventManager
 from starkware.starknet.business_logic.execution.execute_entry_point import (
     ExecuteEntryPoint,
 )
@@ -29,6 +24,10 @@ from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
     CheatableCachedState,
 )
 from protostar.cheatable_starknet.controllers.expect_events_controller import Event
+from protostar.starknet.declarable_contract import (
+    DeclarableContract,
+    declarable_contract_cache,
+)
 from protostar.starknet.selector import Selector
 from protostar.starknet.address import Address
 from protostar.starknet.data_transformer import (
@@ -75,6 +74,9 @@ class ContractsController:
     def __init__(self, cheatable_state: "CheatableCachedState"):
         self.cheatable_state = cheatable_state
 
+    def rebind(self, cheatable_state: "CheatableCachedState"):
+        self.cheatable_state = cheatable_state
+
     async def _transform_calldata_to_cairo_data_by_addr(
         self,
         contract_address: Address,
@@ -118,23 +120,17 @@ class ContractsController:
         contract_class: ContractClass,
     ):
         starknet_config = StarknetGeneralConfig()
-        tx = InternalDeclare.create(
-            contract_class=contract_class,
-            chain_id=starknet_config.chain_id.value,
-            sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
-            max_fee=0,
-            version=0,
-            signature=[],
-            nonce=0,
+        declarable_contract = declarable_contract_cache.get(
+            contract_class, chain_id=starknet_config.chain_id.value
         )
+        tx = declarable_contract.declare_tx
 
         with self.cheatable_state.copy_and_apply() as state_copy:
             await tx.apply_state_updates(
                 state=state_copy, general_config=starknet_config
             )
 
-        abi = get_abi(contract_class=contract_class)
-        self._add_event_abi_to_state(abi)
+        self._add_event_abi_to_state(declarable_contract)
         class_hash = tx.class_hash
         assert class_hash is not None
         await self.cheatable_state.set_contract_class(class_hash, contract_class)
@@ -148,18 +144,17 @@ class ContractsController:
 
         return DeclaredClass(
             class_hash=class_hash,
-            abi=get_abi(contract_class=contract_class),
+            abi=declarable_contract.abi,
         )
 
-    def _add_event_abi_to_state(self, abi: AbiType):
-        event_manager = EventManager(abi=abi)
+    def _add_event_abi_to_state(self, declarable_contract: DeclarableContract):
         self.cheatable_state.update_event_selector_to_name_map(
-            # pylint: disable=protected-access
-            event_manager._selector_to_name
+            declarable_contract.event_selector_to_name_map
         )
-        # pylint: disable=protected-access
-        for event_name in event_manager._selector_to_name.values():
-            self.cheatable_state.event_name_to_contract_abi_map[event_name] = abi
+        for event_name in declarable_contract.event_selector_to_name_map.values():
+            self.cheatable_state.event_name_to_contract_abi_map[
+                event_name
+            ] = declarable_contract.abi
 
     async def deploy_prepared(self, prepared: PreparedContract) -> DeployedContract:
         await self.cheatable_state.deploy_contract(
@@ -38,6 +38,15 @@ class ExpectCallController:
         self._cheatable_state = cheatable_state
         self._test_finish_hook.on(self.assert_no_expected_calls_left)
 
+    def rebind(
+        self,
+        test_finish_hook: "Hook",
+        cheatable_state: "CheatableCachedState",
+    ) -> None:
+        self._test_finish_hook = test_finish_hook
+        self._cheatable_state = cheatable_state
+        self._test_finish_hook.on(self.assert_no_expected_calls_left)
+
     def add_expected_call(self, expected_call: ExpectedCall):
         contract_address = Address(int(expected_call.address))
         if self._cheatable_state.expected_contract_calls.get(contract_address):
@@ -68,6 +68,17 @@ class ExpectEventsController:
         self._cheatable_state = cheatable_state
         self._test_finish_hook.on(self.compare_expected_and_actual_results)
 
+    def rebind(
+        self,
+        test_finish_hook: "Hook",
+        test_execution_state: "CairoTestExecutionState",
+        cheatable_state: "CheatableCachedState",
+    ) -> None:
+        self._test_execution_state = test_execution_state
+        self._test_finish_hook = test_finish_hook
+        self._cheatable_state = cheatable_state
+        self._test_finish_hook.on(self.compare_expected_and_actual_results)
+
     def add_expected_events(self, expected_events: list[Event]):
         self._test_execution_state.expected_events_list.append(expected_events)
 
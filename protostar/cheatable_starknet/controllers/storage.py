@@ -12,6 +12,9 @@ class StorageController:
     def __init__(self, cheatable_state: "CheatableCachedState"):
         self._cheatable_state = cheatable_state
 
+    def rebind(self, cheatable_state: "CheatableCachedState"):
+        self._cheatable_state = cheatable_state
+
     async def store(
         self,
         target_contract_address: int,
@@ -1,3 +1,4 @@
+import multiprocessing
 from argparse import Namespace
 from pathlib import Path
 from typing import List, Optional
@@ -155,7 +156,11 @@ A glob or globs to a directory or a test suite, for example:
             disable_hint_validation=True,
             include_paths=include_paths,
         )
-        test_collector = Cairo1TestCollector(compiler_config.include_paths)
+        test_collector = Cairo1TestCollector(
+            compiler_config.include_paths,
+            processes_count=multiprocessing.cpu_count(),
+            project_root_path=self._project_root_path,
+        )
         test_collector_result = test_collector.collect(
             targets=targets,
             ignored_targets=ignored_targets,
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from protostar.io import StructuredMessage, LogColorProvider
-from protostar.testing import FailedTestCaseResult
+from protostar.testing import FailedFuzzTestCaseResult, FailedTestCaseResult
 
 from .formatters import (
     format_execution_time_human,
@@ -61,7 +61,7 @@ class FailedTestCaseResultMessage(StructuredMessage):
         return "".join(result)
 
     def format_dict(self) -> dict:
-        return {
+        result = {
             "type": "test",
             "message_type": "test_case_result",
             "test_type": "failed_test_case",
@@ -73,3 +73,9 @@ class FailedTestCaseResultMessage(StructuredMessage):
             "exception": str(self.failed_test_case_result.exception),
             "stdout": str(self.failed_test_case_result.captured_stdout),
         }
+        if (
+            isinstance(self.failed_test_case_result, FailedFuzzTestCaseResult)
+            and self.failed_test_case_result.fuzz_stats
+        ):
+            result["fuzz_stats"] = self.failed_test_case_result.fuzz_stats.to_dict()
+        return result
@@ -78,6 +78,10 @@ class PassedFuzzTestCaseResultMessage(StructuredMessage):
                         )
                     )
 
+        fuzz_stats = self.passed_fuzz_test_case_result.fuzz_stats
+        if fuzz_stats:
+            second_line_elements.append(fmt.colorize("GRAY", fuzz_stats.format()))
+
         stdout_elements = format_stdout(
             captured_stdout=self.passed_fuzz_test_case_result.captured_stdout,
             log_color_provider=fmt,
@@ -111,4 +115,7 @@ class PassedFuzzTestCaseResultMessage(StructuredMessage):
         }
         if self.passed_fuzz_test_case_result.fuzz_runs_count:
             result["fuzz_runs"] = str(self.passed_fuzz_test_case_result.fuzz_runs_count)
+        fuzz_stats = self.passed_fuzz_test_case_result.fuzz_stats
+        if fuzz_stats:
+            result["fuzz_stats"] = fuzz_stats.to_dict()
         return result
@@ -87,6 +87,11 @@ class TestingSummaryResultMessage(StructuredMessage):
                 count=self.slowest_tests_to_report_count,
             )
             result_arr.append(item)
+            if self.testing_summary.hint_code_cache_stats is not None:
+                result_arr.append(
+                    fmt.bold("Hint code cache: ")
+                    + self.testing_summary.hint_code_cache_stats.format()
+                )
 
         header = fmt.bold("Test suites: ")
         header_size = len(header)
@@ -1,5 +1,7 @@
+import multiprocessing
 import os
 from argparse import Namespace
+from functools import partial
 from pathlib import Path
 from typing import List, Optional
 
@@ -16,22 +18,33 @@ from protostar.protostar_exception import ProtostarException
 from protostar.self.cache_io import CacheIO
 from protostar.self.protostar_directory import ProtostarDirectory
 from protostar.starknet.pass_managers import (
-    StarknetPassManagerFactory,
     TestCollectorPassManagerFactory,
+    TestSuitePassMangerFactory,
 )
-from protostar.starknet import StarknetCompiler
+from protostar.starknet import CompilationCache, StarknetCompiler
 from protostar.cairo import CairoCompilerConfig
 from protostar.testing import (
+    TestCollectionCache,
     TestCollector,
     TestingSummary,
     TestRunner,
     TestScheduler,
     determine_testing_seed,
+    get_suite_functions_from_abi,
 )
 from protostar.io.output import Messenger
 
 from .messages import TestCollectorResultMessage
 from .test_command_cache import TestCommandCache
+from .test_server import (
+    TestServer,
+    TestServerClient,
+    TestServerCollectionResponse,
+    TestServerErrorResponse,
+    TestServerRejectionResponse,
+    TestServerRequest,
+    TestServerResultsSource,
+)
 from ...cairo_testing.cairo1_test_collector import Cairo1TestCollector
 from ...cairo_testing.cairo1_test_runner import Cairo1TestRunner
 
@@ -136,6 +149,34 @@ A glob or globs to a directory or a test suite, for example:
                 type="int",
                 description="Set Cairo execution step limit.",
             ),
+            ProtostarArgument(
+                name="fuzz-shards",
+                type="int",
+                description=(
+                    "Split examples of each fuzz or parameterized test case between given number of worker processes."
+                ),
+                default=1,
+            ),
+            ProtostarArgument(
+                name="fuzz-time-budget",
+                type="float",
+                description=(
+                    "Stop fuzzing each fuzz test case after the given number of seconds, "
+                    "even if it hasn't run `max_examples` examples yet. Fuzz test cases "
+                    "can set their own budget with the `fuzz_time_budget` cheatcode."
+                ),
+            ),
+            ProtostarArgument(
+                name="cache-setup-states",
+                type="bool",
+                description=(
+                    "Store states of test suites after running `__setup__` in `.protostar_cache` "
+                    "and reuse them in later runs. A stored state is discarded when the test suite, "
+                    "contracts it deploys, the configuration file, the seed or other testing options "
+                    "change. Changes not visible to Protostar, e.g. files or environment variables "
+                    "read by the setup hook, don't discard it."
+                ),
+            ),
             ProtostarArgument(
                 name="report-slowest-tests",
                 type="int",
@@ -153,29 +194,78 @@ A glob or globs to a directory or a test suite, for example:
                 type="bool",
                 description="Show gas estimation for each test case. Estimations might be inaccurate.",
             ),
+            ProtostarArgument(
+                name="server",
+                type="bool",
+                description=(
+                    "Start a test server, which keeps workers, compiled test suites and their states "
+                    "after setup in memory. Subsequent `protostar test` runs in the project are executed "
+                    "by the server, as long as it is running."
+                ),
+            ),
         ]
 
-    async def run(self, args: Namespace) -> TestingSummary:
+    async def run(self, args: Namespace) -> Optional[TestingSummary]:
+        if args.server:
+            TestServer(
+                test_command=self,
+                project_root_path=self._project_root_path,
+                cwd=self._cwd,
+                active_profile_name=self._active_profile_name,
+            ).serve()
+            return None
+
+        if args.fuzz_shards < 1:
+            raise ProtostarException("The number of fuzz shards must be positive.")
+        if args.fuzz_time_budget is not None and args.fuzz_time_budget <= 0:
+            raise ProtostarException("The fuzz time budget must be positive.")
         if not vars(args).get("json"):
             args.json = None
         messenger = self._messenger_factory.from_args(args)
         cache = TestCommandCache(CacheIO(self._project_root_path))
-        summary = await self.test(
-            targets=cache.obtain_targets(args.target, args.last_failed),
-            ignored_targets=args.ignore,
-            cairo_path=args.cairo_path,
-            disable_hint_validation=args.disable_hint_validation,
-            profiling=args.profiling,
+        targets = cache.obtain_targets(args.target, args.last_failed)
+        summary = self._test_in_server(
+            TestServerRequest(
+                cwd=self._cwd,
+                active_profile_name=self._active_profile_name,
+                targets=targets,
+                ignored_targets=args.ignore,
+                cairo_path=args.cairo_path,
+                disable_hint_validation=args.disable_hint_validation,
+                profiling=args.profiling,
+                safe_collecting=args.safe_collecting,
+                exit_first=args.exit_first,
+                seed=args.seed,
+                max_steps=args.max_steps,
+                gas_estimation_enabled=args.estimate_gas,
+                fuzz_shards_count=args.fuzz_shards,
+                fuzz_time_budget=args.fuzz_time_budget,
+                cache_setup_states=args.cache_setup_states,
+            ),
             no_progress_bar=args.no_progress_bar,
-            safe_collecting=args.safe_collecting,
-            exit_first=args.exit_first,
-            seed=args.seed,
-            max_steps=args.max_steps,
             slowest_tests_to_report_count=args.report_slowest_tests,
-            gas_estimation_enabled=args.estimate_gas,
             messenger=messenger,
-            use_cairo1_test_runner=False,
         )
+        if summary is None:
+            summary = await self.test(
+                targets=targets,
+                ignored_targets=args.ignore,
+                cairo_path=args.cairo_path,
+                disable_hint_validation=args.disable_hint_validation,
+                profiling=args.profiling,
+                no_progress_bar=args.no_progress_bar,
+                safe_collecting=args.safe_collecting,
+                exit_first=args.exit_first,
+                seed=args.seed,
+                max_steps=args.max_steps,
+                slowest_tests_to_report_count=args.report_slowest_tests,
+                gas_estimation_enabled=args.estimate_gas,
+                fuzz_shards_count=args.fuzz_shards,
+                fuzz_time_budget=args.fuzz_time_budget,
+                cache_setup_states=args.cache_setup_states,
+                messenger=messenger,
+                use_cairo1_test_runner=False,
+            )
         cache.write_failed_tests_to_cache(summary)
 
         summary.assert_all_passed()
@@ -197,7 +287,73 @@ A glob or globs to a directory or a test suite, for example:
         max_steps: Optional[int] = None,
         slowest_tests_to_report_count: int = 0,
         gas_estimation_enabled: bool = False,
+        fuzz_shards_count: int = 1,
+        fuzz_time_budget: Optional[float] = None,
+        cache_setup_states: bool = False,
     ) -> TestingSummary:
+        include_paths = self.build_include_paths(
+            cairo_path=cairo_path, use_cairo1_test_runner=use_cairo1_test_runner
+        )
+        testing_seed = determine_testing_seed(seed)
+        test_collector_result = self.collect_tests(
+            targets=targets,
+            ignored_targets=ignored_targets,
+            include_paths=include_paths,
+            safe_collecting=safe_collecting,
+            use_cairo1_test_runner=use_cairo1_test_runner,
+        )
+        testing_summary = self._create_testing_summary(
+            test_collector_result=test_collector_result,
+            testing_seed=testing_seed,
+            profiling=profiling,
+            messenger=messenger,
+        )
+
+        if test_collector_result.test_cases_count > 0:
+            live_logger = TestingLiveLogger(
+                testing_summary=testing_summary,
+                no_progress_bar=no_progress_bar,
+                exit_first=exit_first,
+                slowest_tests_to_report_count=slowest_tests_to_report_count,
+                project_root_path=self._project_root_path,
+                write=messenger,
+            )
+            if use_cairo1_test_runner:
+                worker = Cairo1TestRunner.worker
+            else:
+                worker = TestRunner.worker
+
+            TestScheduler(live_logger=live_logger, worker=worker).run(
+                include_paths=include_paths,
+                test_collector_result=test_collector_result,
+                disable_hint_validation=disable_hint_validation,
+                profiling=profiling,
+                exit_first=exit_first,
+                testing_seed=testing_seed,
+                max_steps=max_steps,
+                project_root_path=self._project_root_path,
+                active_profile_name=self._active_profile_name,
+                cwd=self._cwd,
+                gas_estimation_enabled=gas_estimation_enabled,
+                fuzz_shards_count=fuzz_shards_count,
+                fuzz_time_budget=fuzz_time_budget,
+                cache_setup_states=cache_setup_states,
+                on_exit_first=lambda: messenger(
+                    TestingSummaryResultMessage(
+                        test_collector_result=test_collector_result,
+                        testing_summary=testing_summary,
+                        slowest_tests_to_report_count=slowest_tests_to_report_count,
+                    )
+                ),
+            )
+
+        return testing_summary
+
+    def build_include_paths(
+        self,
+        cairo_path: Optional[List[Path]],
+        use_cairo1_test_runner: bool = False,
+    ) -> List[str]:
         include_paths = [
             str(path)
             for path in self._project_cairo_path_builder.build_project_cairo_path_list(
@@ -216,15 +372,16 @@ A glob or globs to a directory or a test suite, for example:
             include_paths.append(
                 str(self._protostar_directory.protostar_test_only_cairo_packages_path)
             )
+        return include_paths
 
-        factory = (
-            StarknetPassManagerFactory
-            if safe_collecting
-            else TestCollectorPassManagerFactory
-        )
-
-        testing_seed = determine_testing_seed(seed)
-
+    def collect_tests(
+        self,
+        targets: List[str],
+        ignored_targets: Optional[List[str]],
+        include_paths: List[str],
+        safe_collecting: bool,
+        use_cairo1_test_runner: bool = False,
+    ) -> TestCollector.Result:
         with ActivityIndicator(
             self._log_color_provider.colorize("GRAY", "Collecting tests")
         ):
@@ -233,22 +390,51 @@ A glob or globs to a directory or a test suite, for example:
                 include_paths=include_paths,
             )
             if use_cairo1_test_runner:
-                test_collector = Cairo1TestCollector(compiler_config.include_paths)
+                test_collector = Cairo1TestCollector(
+                    compiler_config.include_paths,
+                    processes_count=multiprocessing.cpu_count(),
+                    project_root_path=self._project_root_path,
+                )
             else:
+                # Safe collecting compiles test suites the same way the test runner does,
+                # so workers read them from the compilation cache instead of compiling them again.
                 starknet_compiler = StarknetCompiler(
                     config=compiler_config,
-                    pass_manager_factory=factory,
+                    pass_manager_factory=TestSuitePassMangerFactory
+                    if safe_collecting
+                    else TestCollectorPassManagerFactory,
+                    compilation_cache=CompilationCache(self._project_root_path),
                 )
                 test_collector = TestCollector(
-                    get_suite_function_names=starknet_compiler.get_function_names
+                    get_suite_functions=partial(
+                        get_suite_functions_from_abi,
+                        partial(
+                            starknet_compiler.get_functions_abi_from_compiled_contract,
+                            add_debug_info=True,
+                        )
+                        if safe_collecting
+                        else starknet_compiler.get_functions_abi,
+                    ),
+                    processes_count=multiprocessing.cpu_count(),
+                    test_collection_cache=TestCollectionCache(
+                        self._project_root_path,
+                        build_key=starknet_compiler.build_cache_key,
+                    ),
                 )
 
-            test_collector_result = test_collector.collect(
+            return test_collector.collect(
                 targets=targets,
                 ignored_targets=ignored_targets,
                 default_test_suite_glob=str(self._project_root_path),
             )
 
+    def _create_testing_summary(
+        self,
+        test_collector_result: TestCollector.Result,
+        testing_seed: int,
+        profiling: bool,
+        messenger: Messenger,
+    ) -> TestingSummary:
         if profiling and test_collector_result.test_cases_count > 1:
             raise ProtostarException(
                 "Only one test case can be profiled at the time. Please specify path to a single test case."
@@ -256,45 +442,63 @@ A glob or globs to a directory or a test suite, for example:
 
         messenger(TestCollectorResultMessage(test_collector_result))
 
-        testing_summary = TestingSummary(
+        return TestingSummary(
             initial_test_results=test_collector_result.broken_test_suites,  # type: ignore
             testing_seed=testing_seed,
             test_collector_result=test_collector_result,
         )
 
-        if test_collector_result.test_cases_count > 0:
-            live_logger = TestingLiveLogger(
-                testing_summary=testing_summary,
-                no_progress_bar=no_progress_bar,
-                exit_first=exit_first,
-                slowest_tests_to_report_count=slowest_tests_to_report_count,
-                project_root_path=self._project_root_path,
-                write=messenger,
-            )
-            if use_cairo1_test_runner:
-                worker = Cairo1TestRunner.worker
-            else:
-                worker = TestRunner.worker
+    def _test_in_server(
+        self,
+        request: TestServerRequest,
+        no_progress_bar: bool,
+        slowest_tests_to_report_count: int,
+        messenger: Messenger,
+    ) -> Optional[TestingSummary]:
+        """
+        Runs tests in the test server of the project.
+        Returns `None` if the server is not running or can't run the tests.
+        """
+        connection = TestServerClient(self._project_root_path).connect()
+        if connection is None:
+            return None
+        with connection:
+            try:
+                connection.send(request)
+                response = connection.recv()
+            except (OSError, EOFError):
+                return None
+            if isinstance(response, TestServerRejectionResponse):
+                return None
+            if isinstance(response, TestServerErrorResponse):
+                raise response.exception
+            assert isinstance(response, TestServerCollectionResponse)
 
-            TestScheduler(live_logger=live_logger, worker=worker).run(
-                include_paths=include_paths,
+            test_collector_result = response.test_collector_result
+            testing_summary = self._create_testing_summary(
                 test_collector_result=test_collector_result,
-                disable_hint_validation=disable_hint_validation,
-                profiling=profiling,
-                exit_first=exit_first,
-                testing_seed=testing_seed,
-                max_steps=max_steps,
-                project_root_path=self._project_root_path,
-                active_profile_name=self._active_profile_name,
-                cwd=self._cwd,
-                gas_estimation_enabled=gas_estimation_enabled,
-                on_exit_first=lambda: messenger(
+                testing_seed=response.testing_seed,
+                profiling=request.profiling,
+                messenger=messenger,
+            )
+            if request.exit_first and test_collector_result.broken_test_suites:
+                messenger(
                     TestingSummaryResultMessage(
                         test_collector_result=test_collector_result,
                         testing_summary=testing_summary,
                         slowest_tests_to_report_count=slowest_tests_to_report_count,
                     )
-                ),
-            )
-
-        return testing_summary
+                )
+            elif test_collector_result.test_cases_count > 0:
+                TestingLiveLogger(
+                    testing_summary=testing_summary,
+                    no_progress_bar=no_progress_bar,
+                    exit_first=request.exit_first,
+                    slowest_tests_to_report_count=slowest_tests_to_report_count,
+                    project_root_path=self._project_root_path,
+                    write=messenger,
+                ).log(
+                    TestServerResultsSource(connection, test_collector_result),
+                    test_collector_result,
+                )
+            return testing_summary
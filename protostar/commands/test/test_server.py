@@ -0,0 +1,345 @@
+import hashlib
+import logging
+import os
+import secrets
+import socket
+import tempfile
+from dataclasses import dataclass
+from multiprocessing.connection import (
+    AuthenticationError,
+    Client,
+    Connection,
+    Listener,
+)
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from protostar.cairo.hint_code_cache import HintCodeCacheStats
+from protostar.configuration_file import ConfigurationFileFactory
+from protostar.protostar_exception import ProtostarException
+from protostar.self.cache_io import CacheIO
+from protostar.testing import (
+    AcceptableResult,
+    BrokenTestSuiteResult,
+    SharedTestsState,
+    TestCollector,
+    TestResult,
+    TestRunner,
+    TestScheduler,
+    TestWorkerPool,
+    determine_testing_seed,
+)
+from protostar.testing.testing_seed import Seed
+
+if TYPE_CHECKING:
+    from .test_command import TestCommand
+
+TEST_SERVER_CACHE_NAME = "test_server"
+
+
+@dataclass(frozen=True)
+class TestServerRequest:
+    cwd: Path
+    active_profile_name: Optional[str]
+    targets: List[str]
+    ignored_targets: Optional[List[str]]
+    cairo_path: Optional[List[Path]]
+    disable_hint_validation: bool
+    profiling: bool
+    safe_collecting: bool
+    exit_first: bool
+    seed: Optional[int]
+    max_steps: Optional[int]
+    gas_estimation_enabled: bool
+    fuzz_shards_count: int
+    fuzz_time_budget: Optional[float]
+    cache_setup_states: bool
+
+
+@dataclass(frozen=True)
+class TestServerCollectionResponse:
+    test_collector_result: TestCollector.Result
+    testing_seed: Seed
+
+
+@dataclass(frozen=True)
+class TestServerResultResponse:
+    test_result: TestResult
+    hint_code_cache_stats: HintCodeCacheStats
+
+
+@dataclass(frozen=True)
+class TestServerRejectionResponse:
+    reason: str
+
+
+@dataclass(frozen=True)
+class TestServerErrorResponse:
+    exception: ProtostarException
+
+
+class TestServerUnavailableException(ProtostarException):
+    pass
+
+
+class TestServer:
+    """
+    Long-running process, which keeps warm worker processes for test runs requested by `protostar test`.
+    Workers keep compiled test suites and their post-setup states as long as no Cairo file
+    in the project changes, so re-running tests skips compilation and setup.
+    """
+
+    def __init__(
+        self,
+        test_command: "TestCommand",
+        project_root_path: Path,
+        cwd: Path,
+        active_profile_name: Optional[str],
+    ):
+        self._test_command = test_command
+        self._project_root_path = project_root_path
+        self._cwd = cwd
+        self._active_profile_name = active_profile_name
+        self._worker_pool: Optional[TestWorkerPool] = None
+
+    def serve(self) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ProtostarException(
+                "Test server is not supported on this operating system."
+            )
+        if TestServerClient(self._project_root_path).connect() is not None:
+            raise ProtostarException(
+                "Test server is already running for this project."
+            )
+
+        address = get_test_server_address(self._project_root_path)
+        if os.path.exists(address):
+            # A leftover of a test server, which was not shut down gracefully.
+            os.unlink(address)
+        authkey = secrets.token_bytes(32)
+        cache_io = CacheIO(self._project_root_path)
+        with Listener(address, family="AF_UNIX", authkey=authkey) as listener:
+            cache_io.write(
+                TEST_SERVER_CACHE_NAME,
+                {"address": address, "authkey": authkey.hex(), "pid": os.getpid()},
+            )
+            logging.info("Test server is listening for `protostar test` runs.")
+            try:
+                while True:
+                    self._accept(listener)
+            except KeyboardInterrupt:
+                logging.info("Test server stopped.")
+            finally:
+                cache_io.write(TEST_SERVER_CACHE_NAME, {})
+                if self._worker_pool is not None:
+                    self._worker_pool.terminate()
+
+    def _accept(self, listener: Listener) -> None:
+        try:
+            connection = listener.accept()
+        except (AuthenticationError, OSError, EOFError):
+            return
+        with connection:
+            try:
+                self._handle(connection, connection.recv())
+            except (OSError, EOFError):
+                # The client disconnected, e.g. after the first failed test case.
+                pass
+
+    def _handle(self, connection: Connection, request: TestServerRequest) -> None:
+        if (request.cwd, request.active_profile_name) != (
+            self._cwd,
+            self._active_profile_name,
+        ):
+            connection.send(
+                TestServerRejectionResponse(
+                    reason="Test server runs in a different directory or with a different profile."
+                )
+            )
+            return
+
+        try:
+            include_paths = self._test_command.build_include_paths(
+                cairo_path=request.cairo_path
+            )
+            testing_seed = determine_testing_seed(request.seed)
+            test_collector_result = self._test_command.collect_tests(
+                targets=request.targets,
+                ignored_targets=request.ignored_targets,
+                include_paths=include_paths,
+                safe_collecting=request.safe_collecting,
+            )
+        except ProtostarException as ex:
+            connection.send(TestServerErrorResponse(exception=ex))
+            return
+        connection.send(
+            TestServerCollectionResponse(
+                test_collector_result=test_collector_result,
+                testing_seed=testing_seed,
+            )
+        )
+
+        if (
+            test_collector_result.test_cases_count == 0
+            or (request.profiling and test_collector_result.test_cases_count > 1)
+            or (request.exit_first and test_collector_result.broken_test_suites)
+        ):
+            return
+
+        TestScheduler(
+            live_logger=TestResultsForwarder(connection),
+            worker=TestRunner.worker,
+        ).run(
+            include_paths=include_paths,
+            test_collector_result=test_collector_result,
+            disable_hint_validation=request.disable_hint_validation,
+            profiling=request.profiling,
+            exit_first=request.exit_first,
+            testing_seed=testing_seed,
+            max_steps=request.max_steps,
+            project_root_path=self._project_root_path,
+            active_profile_name=self._active_profile_name,
+            cwd=self._cwd,
+            gas_estimation_enabled=request.gas_estimation_enabled,
+            on_exit_first=lambda: None,
+            worker_pool=self._get_worker_pool(),
+            fuzz_shards_count=request.fuzz_shards_count,
+            fuzz_time_budget=request.fuzz_time_budget,
+            cache_setup_states=request.cache_setup_states,
+            run_id=build_test_run_id(
+                file_paths=[
+                    self._get_configuration_file_path(),
+                    *(
+                        test_suite.test_path
+                        for test_suite in test_collector_result.test_suites
+                    ),
+                ],
+                parameters=[
+                    include_paths,
+                    request.disable_hint_validation,
+                    request.profiling,
+                    request.max_steps,
+                    request.gas_estimation_enabled,
+                ],
+            ),
+        )
+
+    def _get_configuration_file_path(self) -> Path:
+        return ConfigurationFileFactory(
+            cwd=self._cwd, active_profile_name=self._active_profile_name
+        ).create().get_filepath()
+
+    def _get_worker_pool(self) -> TestWorkerPool:
+        if self._worker_pool is None or self._worker_pool.terminated:
+            self._worker_pool = TestWorkerPool()
+        return self._worker_pool
+
+
+class TestResultsForwarder:
+    """
+    Sends test results to the client of the test server instead of logging them.
+    The client decides when to stop, e.g. on the first failed test case, by closing the connection.
+    """
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+
+    def log(
+        self,
+        shared_tests_state: SharedTestsState,
+        test_collector_result: TestCollector.Result,
+    ) -> None:
+        tests_left_n = test_collector_result.test_cases_count
+        while tests_left_n > 0:
+            test_result = shared_tests_state.get_result()
+            hint_code_cache_stats = shared_tests_state.get_hint_code_cache_stats()
+            self._connection.send(
+                TestServerResultResponse(
+                    test_result=test_result,
+                    hint_code_cache_stats=hint_code_cache_stats,
+                )
+            )
+            if isinstance(test_result, BrokenTestSuiteResult):
+                tests_left_n -= len(test_result.test_case_names)
+            else:
+                tests_left_n -= 1
+
+
+class TestServerClient:
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+
+    def connect(self) -> Optional[Connection]:
+        """
+        Returns a connection to the test server of the project, or `None` if the server is not running.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        endpoint = CacheIO(self._project_root_path).read(TEST_SERVER_CACHE_NAME)
+        if not endpoint:
+            return None
+        try:
+            return Client(
+                endpoint["address"],
+                family="AF_UNIX",
+                authkey=bytes.fromhex(endpoint["authkey"]),
+            )
+        except (AuthenticationError, OSError, EOFError, KeyError, ValueError):
+            return None
+
+
+class TestServerResultsSource:
+    """
+    Receives test results sent by `TestResultsForwarder` on the client side.
+    """
+
+    def __init__(
+        self, connection: Connection, test_collector_result: TestCollector.Result
+    ):
+        self._connection = connection
+        self._any_failed_or_broken = len(test_collector_result.broken_test_suites) > 0
+        self._hint_code_cache_stats = HintCodeCacheStats()
+
+    def get_result(self) -> TestResult:
+        try:
+            response: TestServerResultResponse = self._connection.recv()
+        except (OSError, EOFError) as ex:
+            raise TestServerUnavailableException(
+                "Test server closed the connection before all tests finished."
+            ) from ex
+        self._hint_code_cache_stats = response.hint_code_cache_stats
+        if not isinstance(response.test_result, AcceptableResult):
+            self._any_failed_or_broken = True
+        return response.test_result
+
+    def any_failed_or_broken(self) -> bool:
+        return self._any_failed_or_broken
+
+    def get_hint_code_cache_stats(self) -> HintCodeCacheStats:
+        return self._hint_code_cache_stats
+
+
+def get_test_server_address(project_root_path: Path) -> str:
+    # Unix socket paths are limited to ~100 characters, so the socket can't be placed inside the project.
+    project_id = hashlib.sha256(
+        str(project_root_path.resolve()).encode("utf-8")
+    ).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"protostar-test-{project_id}.sock")
+
+
+def build_test_run_id(file_paths: Iterable[Path], parameters: list) -> str:
+    """
+    Returns an identifier, which changes whenever any of given files or parameters changes.
+    Workers of the test server reuse post-setup states of test suites only within runs with the same identifier.
+    Only the configuration file and collected test suites are checked, so the identifier is cheap to build
+    regardless of the size of the project. Workers check modules imported by test suites and contracts
+    compiled during setups themselves, before reusing a state.
+    """
+    digest = hashlib.sha256(repr(parameters).encode("utf-8"))
+    for file_path in sorted({file_path.resolve() for file_path in file_paths}):
+        if not file_path.exists():
+            digest.update(f"{file_path}:missing\0".encode())
+            continue
+        stat = file_path.stat()
+        digest.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}\0".encode())
+    return digest.hexdigest()
@@ -0,0 +1,356 @@
+# pylint: disable=protected-access
+import itertools
+import os
+import socket
+import threading
+from multiprocessing.connection import Listener
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.cairo.hint_code_cache import HintCodeCacheStats
+from protostar.protostar_exception import ProtostarException
+from protostar.self.cache_io import CacheIO
+from protostar.testing import (
+    BrokenTestSuiteResult,
+    FailedTestCaseResult,
+    PassedTestCaseResult,
+    TestCollector,
+    TestResult,
+)
+from protostar.testing.test_environment_exceptions import ReportedException
+from protostar.testing.test_suite import TestCase, TestSuite
+
+from .test_server import (
+    TEST_SERVER_CACHE_NAME,
+    TestResultsForwarder,
+    TestServer,
+    TestServerClient,
+    TestServerErrorResponse,
+    TestServerRejectionResponse,
+    TestServerRequest,
+    TestServerResultsSource,
+    TestServerUnavailableException,
+    build_test_run_id,
+    get_test_server_address,
+)
+
+AUTHKEY = b"test-server-test"
+
+
+def test_run_id_changes_when_file_changes(tmp_path: Path):
+    cairo_file_path = tmp_path / "test_main.cairo"
+    cairo_file_path.write_text("func main() {}", encoding="utf-8")
+    run_id = build_test_run_id(file_paths=[cairo_file_path], parameters=[])
+
+    assert build_test_run_id(file_paths=[cairo_file_path], parameters=[]) == run_id
+
+    cairo_file_path.write_text("func main() { ret; }", encoding="utf-8")
+    os.utime(cairo_file_path, ns=(0, 0))
+
+    assert build_test_run_id(file_paths=[cairo_file_path], parameters=[]) != run_id
+
+
+def test_run_id_changes_when_file_is_created(tmp_path: Path):
+    configuration_file_path = tmp_path / "protostar.toml"
+    run_id = build_test_run_id(file_paths=[configuration_file_path], parameters=[])
+
+    configuration_file_path.write_text("", encoding="utf-8")
+
+    assert (
+        build_test_run_id(file_paths=[configuration_file_path], parameters=[])
+        != run_id
+    )
+
+
+def test_run_id_ignores_not_given_files(tmp_path: Path):
+    cairo_file_path = tmp_path / "test_main.cairo"
+    cairo_file_path.write_text("", encoding="utf-8")
+    run_id = build_test_run_id(file_paths=[cairo_file_path], parameters=[])
+
+    (tmp_path / "main.cairo").write_text("", encoding="utf-8")
+
+    assert build_test_run_id(file_paths=[cairo_file_path], parameters=[]) == run_id
+
+
+def test_run_id_changes_when_parameters_change():
+    assert build_test_run_id(file_paths=[], parameters=[None]) != build_test_run_id(
+        file_paths=[], parameters=[100]
+    )
+
+
+def test_address_does_not_depend_on_project_path_length(tmp_path: Path):
+    long_project_path = tmp_path / ("project" * 20)
+
+    assert len(get_test_server_address(long_project_path)) == len(
+        get_test_server_address(tmp_path)
+    )
+
+
+@pytest.fixture(name="listener")
+def listener_fixture(tmp_path: Path) -> Iterator[Listener]:
+    address = str(tmp_path / "server.sock")
+    with Listener(address, family="AF_UNIX", authkey=AUTHKEY) as listener:
+        CacheIO(tmp_path).write(
+            TEST_SERVER_CACHE_NAME, {"address": address, "authkey": AUTHKEY.hex()}
+        )
+        yield listener
+
+
+class ServerThread(threading.Thread):
+    def __init__(self, target: Callable[[], None]):
+        super().__init__(daemon=True)
+        self._serve = target
+        self.exception: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            self._serve()
+        except BaseException as ex:  # pylint: disable=broad-except
+            self.exception = ex
+
+    def finish(self) -> None:
+        self.join(timeout=10)
+        assert not self.is_alive()
+        if self.exception is not None:
+            raise self.exception
+
+
+class FakeSharedTestsState:
+    def __init__(self, test_results: Iterable[TestResult]):
+        self._test_results = iter(test_results)
+
+    def get_result(self) -> TestResult:
+        return next(self._test_results)
+
+    def get_hint_code_cache_stats(self) -> HintCodeCacheStats:
+        return HintCodeCacheStats(compilations_count=1)
+
+
+def build_request(cwd: Path, active_profile_name: Optional[str]) -> TestServerRequest:
+    return TestServerRequest(
+        cwd=cwd,
+        active_profile_name=active_profile_name,
+        targets=["."],
+        ignored_targets=None,
+        cairo_path=None,
+        disable_hint_validation=False,
+        profiling=False,
+        safe_collecting=False,
+        exit_first=False,
+        seed=None,
+        max_steps=None,
+        gas_estimation_enabled=False,
+        fuzz_shards_count=1,
+        fuzz_time_budget=None,
+        cache_setup_states=False,
+    )
+
+
+def build_test_collector_result(test_cases_count: int) -> TestCollector.Result:
+    test_path = Path("test_file.cairo")
+    return TestCollector.Result(
+        test_suites=[
+            TestSuite(
+                test_path=test_path,
+                test_cases=[
+                    TestCase(test_path=test_path, test_fn_name=f"test_{i}")
+                    for i in range(test_cases_count)
+                ],
+            )
+        ]
+    )
+
+
+def build_passed_result(test_case_name: str) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=Path("test_file.cairo"),
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=0.0,
+        execution_resources=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "cwd_name, active_profile_name", [("other", None), ("project", "devnet")]
+)
+def test_rejecting_request_from_different_directory_or_profile(
+    tmp_path: Path,
+    listener: Listener,
+    mocker: MockerFixture,
+    cwd_name: str,
+    active_profile_name: Optional[str],
+):
+    test_command = mocker.MagicMock()
+    server = TestServer(
+        test_command,
+        project_root_path=tmp_path,
+        cwd=tmp_path / "project",
+        active_profile_name=None,
+    )
+    server_thread = ServerThread(lambda: server._accept(listener))
+    server_thread.start()
+
+    connection = TestServerClient(tmp_path).connect()
+    assert connection is not None
+    with connection:
+        connection.send(build_request(tmp_path / cwd_name, active_profile_name))
+        response = connection.recv()
+    server_thread.finish()
+
+    assert isinstance(response, TestServerRejectionResponse)
+    test_command.collect_tests.assert_not_called()
+
+
+def test_sending_collection_error(
+    tmp_path: Path, listener: Listener, mocker: MockerFixture
+):
+    test_command = mocker.MagicMock()
+    test_command.collect_tests.side_effect = ProtostarException("Invalid target.")
+    server = TestServer(
+        test_command, project_root_path=tmp_path, cwd=tmp_path, active_profile_name=None
+    )
+    server_thread = ServerThread(lambda: server._accept(listener))
+    server_thread.start()
+
+    connection = TestServerClient(tmp_path).connect()
+    assert connection is not None
+    with connection:
+        connection.send(build_request(tmp_path, active_profile_name=None))
+        response = connection.recv()
+    server_thread.finish()
+
+    assert isinstance(response, TestServerErrorResponse)
+    assert response.exception.message == "Invalid target."
+
+
+def test_streaming_all_test_results(tmp_path: Path, listener: Listener):
+    test_collector_result = build_test_collector_result(test_cases_count=5)
+    test_results = [
+        build_passed_result("test_0"),
+        BrokenTestSuiteResult(
+            file_path=Path("test_file.cairo"),
+            test_case_names=["test_1", "test_2"],
+            exception=ProtostarException("Broken setup."),
+        ),
+        FailedTestCaseResult(
+            file_path=Path("test_file.cairo"),
+            test_case_name="test_3",
+            captured_stdout={},
+            execution_time=0.0,
+            exception=ReportedException(),
+        ),
+        build_passed_result("test_4"),
+    ]
+
+    def forward_test_results():
+        with listener.accept() as server_connection:
+            TestResultsForwarder(server_connection).log(
+                FakeSharedTestsState(test_results),  # type: ignore
+                test_collector_result,
+            )
+
+    server_thread = ServerThread(forward_test_results)
+    server_thread.start()
+
+    connection = TestServerClient(tmp_path).connect()
+    assert connection is not None
+    with connection:
+        results_source = TestServerResultsSource(connection, test_collector_result)
+        received_test_results = [results_source.get_result() for _ in test_results]
+        server_thread.finish()
+
+        with pytest.raises(TestServerUnavailableException):
+            results_source.get_result()
+
+    assert [type(test_result) for test_result in received_test_results] == [
+        type(test_result) for test_result in test_results
+    ]
+    assert results_source.any_failed_or_broken()
+    assert results_source.get_hint_code_cache_stats() == HintCodeCacheStats(
+        compilations_count=1
+    )
+
+
+def test_server_handles_client_disconnecting_on_exit_first(
+    tmp_path: Path, listener: Listener, monkeypatch: pytest.MonkeyPatch
+):
+    test_collector_result = build_test_collector_result(test_cases_count=100_000)
+    server = TestServer(
+        test_command=None,  # type: ignore
+        project_root_path=tmp_path,
+        cwd=tmp_path,
+        active_profile_name=None,
+    )
+
+    def forward_many_test_results(connection, request):
+        TestResultsForwarder(connection).log(
+            FakeSharedTestsState(  # type: ignore
+                build_passed_result(f"test_{i}") for i in itertools.count()
+            ),
+            test_collector_result,
+        )
+
+    monkeypatch.setattr(server, "_handle", forward_many_test_results)
+    server_thread = ServerThread(lambda: server._accept(listener))
+    server_thread.start()
+
+    connection = TestServerClient(tmp_path).connect()
+    assert connection is not None
+    with connection:
+        connection.send(build_request(tmp_path, active_profile_name=None))
+        TestServerResultsSource(connection, test_collector_result).get_result()
+
+    server_thread.finish()
+
+
+def test_client_ignores_server_with_different_authkey(
+    tmp_path: Path, listener: Listener
+):
+    CacheIO(tmp_path).write(
+        TEST_SERVER_CACHE_NAME,
+        {"address": listener.address, "authkey": b"other-authkey".hex()},
+    )
+    server = TestServer(
+        test_command=None,  # type: ignore
+        project_root_path=tmp_path,
+        cwd=tmp_path,
+        active_profile_name=None,
+    )
+    server_thread = ServerThread(lambda: server._accept(listener))
+    server_thread.start()
+
+    assert TestServerClient(tmp_path).connect() is None
+    server_thread.finish()
+
+
+def test_serving_after_server_was_not_shut_down_gracefully(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    CacheIO(tmp_path).write(
+        TEST_SERVER_CACHE_NAME,
+        {"address": str(tmp_path / "gone.sock"), "authkey": AUTHKEY.hex()},
+    )
+    address = get_test_server_address(tmp_path)
+    with socket.socket(socket.AF_UNIX) as stale_socket:
+        stale_socket.bind(address)
+    assert os.path.exists(address)
+    server = TestServer(
+        test_command=None,  # type: ignore
+        project_root_path=tmp_path,
+        cwd=tmp_path,
+        active_profile_name=None,
+    )
+    assert TestServerClient(tmp_path).connect() is None
+
+    def stop(_listener: Listener):
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(server, "_accept", stop)
+    server.serve()
+
+    assert not os.path.exists(address)
+    assert CacheIO(tmp_path).read(TEST_SERVER_CACHE_NAME) == {}
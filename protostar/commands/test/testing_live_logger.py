@@ -9,7 +9,7 @@ from protostar.testing.test_scheduler import make_path_relative_if_possible
 from protostar.testing import (
     AcceptableResult,
     BrokenTestSuiteResult,
-    SharedTestsState,
+    TestResultsSourceProtocol,
     TestingSummary,
     TestResult,
 )
@@ -41,7 +41,7 @@ class TestingLiveLogger:
 
     def log(
         self,
-        shared_tests_state: SharedTestsState,
+        shared_tests_state: TestResultsSourceProtocol,
         test_collector_result: "TestCollector.Result",
     ) -> None:
         if isinstance(self._write, HumanMessenger):
@@ -70,7 +70,7 @@ class TestingLiveLogger:
 
     def _log(
         self,
-        shared_tests_state: SharedTestsState,
+        shared_tests_state: TestResultsSourceProtocol,
         test_collector_result: "TestCollector.Result",
         progress_bar: Optional[bar] = None,
     ):
@@ -113,6 +113,9 @@ class TestingLiveLogger:
         finally:
             if progress_bar:
                 progress_bar.close()
+            self.testing_summary.hint_code_cache_stats = (
+                shared_tests_state.get_hint_code_cache_stats()
+            )
             self._write(
                 TestingSummaryResultMessage(
                     test_collector_result=test_collector_result,
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
@@ -15,6 +15,8 @@ from protostar.compiler.project_cairo_path_builder import LinkedLibrariesBuilder
 from protostar.configuration_file.configuration_file import ConfigurationFile
 from protostar.protostar_exception import ProtostarException
 from protostar.starknet import (
+    CompilationCache,
+    CompilationCacheKey,
     StarknetPassManagerFactory,
     StarknetCompiler,
     StarknetCompilerConfig,
@@ -24,6 +26,8 @@ from protostar.starknet import (
 ContractName = str
 ContractSourcePath = Path
 ContractIdentifier = Union[ContractName, ContractSourcePath]
+CompiledContractKey = Tuple[Tuple[str, ...], Tuple[str, ...], bool, bool]
+StarknetCompilerKey = Tuple[Tuple[str, ...], bool]
 
 
 @dataclass
@@ -40,13 +44,17 @@ class ProjectCompiler:
         project_cairo_path_builder: LinkedLibrariesBuilder,
         configuration_file: ConfigurationFile,
         default_config: Optional[ProjectCompilerConfig] = None,
+        compilation_cache: Optional[CompilationCache] = None,
     ):
         self._project_root_path = project_root_path
+        self._compilation_cache = compilation_cache
         self._project_cairo_path_builder = project_cairo_path_builder
         self.configuration_file = configuration_file
         self._default_config = default_config or ProjectCompilerConfig(
             relative_cairo_path=[]
         )
+        self._starknet_compilers: Dict[StarknetCompilerKey, StarknetCompiler] = {}
+        self._compiled_contracts: Dict[CompiledContractKey, ContractClass] = {}
 
     def _compile_contract(
         self,
@@ -118,18 +126,67 @@ class ProjectCompiler:
         self, contract_paths: List[Path], config: Optional[ProjectCompilerConfig] = None
     ) -> ContractClass:
         current_config = config or self._default_config
+        include_paths = self._build_str_cairo_path_list(
+            current_config.relative_cairo_path
+        )
+        compiled_contract_key: CompiledContractKey = (
+            tuple(str(path.resolve()) for path in contract_paths),
+            tuple(include_paths),
+            current_config.hint_validation_disabled,
+            current_config.debugging_info_attached,
+        )
+        if compiled_contract_key in self._compiled_contracts:
+            return self._compiled_contracts[compiled_contract_key]
 
-        return StarknetCompiler(
-            config=StarknetCompilerConfig(
-                include_paths=self._build_str_cairo_path_list(
-                    current_config.relative_cairo_path
-                ),
-                disable_hint_validation=current_config.hint_validation_disabled,
-            ),
-            pass_manager_factory=StarknetPassManagerFactory,
+        contract_class = self._get_starknet_compiler(
+            include_paths=include_paths,
+            disable_hint_validation=current_config.hint_validation_disabled,
         ).compile_contract(
             *contract_paths, add_debug_info=current_config.debugging_info_attached
         )
+        self._compiled_contracts[compiled_contract_key] = contract_class
+        return contract_class
+
+    def get_compiled_contract_keys(self) -> List[CompiledContractKey]:
+        """
+        Returns keys of contracts compiled by this compiler, which identify compilation inputs.
+        """
+        return list(self._compiled_contracts)
+
+    def build_compilation_cache_key(
+        self, compiled_contract_key: CompiledContractKey
+    ) -> Optional[CompilationCacheKey]:
+        """
+        Returns a key identifying the output of compiling the contract by contents of its files.
+        """
+        (
+            contract_paths,
+            include_paths,
+            hint_validation_disabled,
+            debugging_info_attached,
+        ) = compiled_contract_key
+        return self._get_starknet_compiler(
+            include_paths=list(include_paths),
+            disable_hint_validation=hint_validation_disabled,
+        ).build_cache_key(
+            *[Path(path) for path in contract_paths],
+            add_debug_info=debugging_info_attached,
+        )
+
+    def _get_starknet_compiler(
+        self, include_paths: List[str], disable_hint_validation: bool
+    ) -> StarknetCompiler:
+        starknet_compiler_key = (tuple(include_paths), disable_hint_validation)
+        if starknet_compiler_key not in self._starknet_compilers:
+            self._starknet_compilers[starknet_compiler_key] = StarknetCompiler(
+                config=StarknetCompilerConfig(
+                    include_paths=include_paths,
+                    disable_hint_validation=disable_hint_validation,
+                ),
+                pass_manager_factory=StarknetPassManagerFactory,
+                compilation_cache=self._compilation_cache,
+            )
+        return self._starknet_compilers[starknet_compiler_key]
 
     @staticmethod
     def _check_source_file_exists(source_path: Path) -> None:
@@ -48,6 +48,7 @@ from protostar.io import InputRequester, log_color_provider
 from protostar.protostar_cli import ProtostarCLI
 from protostar.self import ProtostarCompatibilityWithProjectChecker
 from protostar.self.protostar_directory import ProtostarDirectory, VersionManager
+from protostar.starknet import CompilationCache
 from protostar.starknet_gateway import GatewayFacadeFactory
 from protostar.upgrader import (
     LatestVersionCacheTOML,
@@ -100,6 +101,7 @@ def build_di_container(
         project_root_path=project_root_path,
         project_cairo_path_builder=project_cairo_path_builder,
         configuration_file=configuration_file,
+        compilation_cache=CompilationCache(project_root_path),
     )
 
     gateway_facade_factory = GatewayFacadeFactory(
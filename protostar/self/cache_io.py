@@ -1,11 +1,15 @@
 from typing import Optional
 import json
+import os
+import time
 from pathlib import Path
 
 
 class CacheIO:
     _CACHE_DIR_NAME = ".protostar_cache"
     _EXTENSION = ".json"
+    _BINARY_EXTENSION = ".bin"
+    _PRUNING_MARKER_NAME = ".pruned"
 
     def __init__(self, project_root_path: Path):
         self._cache_path = project_root_path / Path(self._CACHE_DIR_NAME)
@@ -13,10 +17,8 @@ class CacheIO:
         self._gitignore_path = Path(self._cache_path / ".gitignore")
 
     def write(self, name: str, value: dict) -> None:
-        if not self._gitignore_path.exists():
-            self._gitignore_path.write_text("*\n", encoding="utf-8")
-        Path(self._cache_path / (name + self._EXTENSION)).write_text(
-            json.dumps(value), encoding="utf-8"
+        self._write_file(
+            name + self._EXTENSION, json.dumps(value).encode(encoding="utf-8")
         )
 
     def read(self, name: str) -> Optional[dict]:
@@ -32,3 +34,69 @@ class CacheIO:
             return json.loads(file_contents)
 
         return None
+
+    def write_bytes(self, name: str, value: bytes) -> None:
+        self._write_file(name + self._BINARY_EXTENSION, value)
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        file_path = self._cache_path / (name + self._BINARY_EXTENSION)
+        if not file_path.exists():
+            return None
+        return file_path.read_bytes()
+
+    def touch(self, name: str) -> None:
+        """
+        Marks the entry as recently used, so `prune` keeps it.
+        """
+        try:
+            os.utime(self._cache_path / (name + self._EXTENSION))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, name: str, max_age: float, interval: float) -> None:
+        """
+        Removes files from the cache directory `name`, which were not modified for `max_age` seconds.
+        The directory is scanned at most once per `interval` seconds, so it is cheap to call on every run.
+        """
+        directory_path = self._cache_path / name
+        if not directory_path.is_dir():
+            return
+        marker_path = directory_path / self._PRUNING_MARKER_NAME
+        now = time.time()
+        try:
+            if now - marker_path.stat().st_mtime < interval:
+                return
+        except FileNotFoundError:
+            pass
+        marker_path.touch()
+
+        for file_path in directory_path.iterdir():
+            if file_path == marker_path:
+                continue
+            try:
+                if file_path.is_file() and file_path.stat().st_mtime < now - max_age:
+                    file_path.unlink()
+            # Other processes can remove the same files concurrently.
+            except FileNotFoundError:
+                continue
+
+    def get_directory_path(self, name: str) -> Path:
+        """
+        Returns a path to a directory in the cache, for tools managing their own files.
+        """
+        self._ensure_gitignore()
+        return self._cache_path / name
+
+    def _write_file(self, file_name: str, value: bytes) -> None:
+        self._ensure_gitignore()
+        file_path = Path(self._cache_path / file_name)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Cache entries can be written concurrently by test workers,
+        # so the file is replaced atomically to never expose partial contents.
+        tmp_file_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+        tmp_file_path.write_bytes(value)
+        os.replace(tmp_file_path, file_path)
+
+    def _ensure_gitignore(self) -> None:
+        if not self._gitignore_path.exists():
+            self._gitignore_path.write_text("*\n", encoding="utf-8")
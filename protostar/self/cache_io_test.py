@@ -1,4 +1,5 @@
 import os
+import time
 from pathlib import Path
 
 from .cache_io import CacheIO
@@ -73,3 +74,77 @@ def test_gitignore_behaviour(tmp_path: Path):
     assert gitignore_path.read_text(encoding="utf-8") == "*\nexample/*\n"
 
     assert cache_io.read(cache_name) == obj
+
+
+def test_cache_nested_name(tmp_path: Path):
+    cache_name = "nested/test-cache-nested"
+    cache_io = CacheIO(tmp_path)
+
+    obj = {"a": 1}
+
+    assert cache_io.read(cache_name) is None
+
+    cache_io.write(cache_name, obj)
+
+    assert cache_io.read(cache_name) == obj
+    # pylint: disable=protected-access
+    assert list((cache_io._cache_path / "nested").iterdir()) == [
+        cache_io._cache_path / "nested" / "test-cache-nested.json"
+    ]
+
+
+def test_cache_bytes(tmp_path: Path):
+    cache_name = "nested/test-cache-bytes"
+    cache_io = CacheIO(tmp_path)
+
+    assert cache_io.read_bytes(cache_name) is None
+
+    cache_io.write_bytes(cache_name, b"\x00\x01")
+
+    assert cache_io.read_bytes(cache_name) == b"\x00\x01"
+    assert cache_io.read(cache_name) is None
+
+
+def test_cache_directory_is_ignored(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+
+    directory_path = cache_io.get_directory_path("tool")
+
+    assert directory_path.parent == tmp_path / ".protostar_cache"
+    # pylint: disable=protected-access
+    assert cache_io._gitignore_path.read_text(encoding="utf-8") == "*\n"
+
+
+def set_age(file_path: Path, age: float):
+    modification_time = time.time() - age
+    os.utime(file_path, (modification_time, modification_time))
+
+
+def test_pruning_removes_unused_entries(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+    cache_io.write("nested/old", {"a": 1})
+    cache_io.write("nested/used", {"a": 2})
+    cache_io.write("nested/new", {"a": 3})
+    # pylint: disable=protected-access
+    set_age(cache_io._cache_path / "nested" / "old.json", 100)
+    set_age(cache_io._cache_path / "nested" / "used.json", 100)
+
+    cache_io.touch("nested/used")
+    cache_io.prune("nested", max_age=50, interval=10)
+
+    assert cache_io.read("nested/old") is None
+    assert cache_io.read("nested/used") == {"a": 2}
+    assert cache_io.read("nested/new") == {"a": 3}
+
+
+def test_pruning_is_skipped_within_interval(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+    cache_io.write("nested/first", {"a": 1})
+    cache_io.prune("nested", max_age=50, interval=10)
+    cache_io.write("nested/second", {"a": 2})
+    # pylint: disable=protected-access
+    set_age(cache_io._cache_path / "nested" / "second.json", 100)
+
+    cache_io.prune("nested", max_age=50, interval=10)
+
+    assert cache_io.read("nested/second") == {"a": 2}
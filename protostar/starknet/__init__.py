@@ -22,6 +22,7 @@ from .data_transformer import (
     PythonData,
 )
 from .starknet_compiler import StarknetCompiler, StarknetCompilerConfig
+from .compilation_cache import CompilationCache, CompilationCacheKey
 from .pass_managers import StarknetPassManagerFactory
 from .contract_abi import ContractAbi
 from .contract_data_transformer import ContractDataTransformer
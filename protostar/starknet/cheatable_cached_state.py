@@ -18,6 +18,7 @@ from protostar.starknet.types import ClassHashType, SelectorType
 from protostar.starknet.data_transformer import CairoOrPythonData
 
 from protostar.starknet.address import Address
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
 
 
 # pylint: disable=too-many-instance-attributes
@@ -34,14 +35,25 @@ class CheatableCachedState(CachedState):
             contract_class_cache=contract_class_cache,
         )
 
-        self.pranked_contracts_map: Dict[int, int] = {}
+        # Maps with immutable values are copied on write, so copying the state doesn't depend on their size.
+        self.pranked_contracts_map: CopyOnWriteDict[int, int] = CopyOnWriteDict()
         self.mocked_calls_map: Dict[Address, Dict[SelectorType, List[int]]] = {}
-        self.event_selector_to_name_map: Dict[int, str] = {}
-
-        self.event_name_to_contract_abi_map: Dict[str, AbiType] = {}
-        self.class_hash_to_contract_abi_map: Dict[ClassHashType, AbiType] = {}
-        self.class_hash_to_contract_path_map: Dict[ClassHashType, Path] = {}
-        self.contract_address_to_class_hash_map: Dict[Address, ClassHashType] = {}
+        self.event_selector_to_name_map: CopyOnWriteDict[
+            int, str
+        ] = CopyOnWriteDict()
+
+        self.event_name_to_contract_abi_map: CopyOnWriteDict[
+            str, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_abi_map: CopyOnWriteDict[
+            ClassHashType, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_path_map: CopyOnWriteDict[
+            ClassHashType, Path
+        ] = CopyOnWriteDict()
+        self.contract_address_to_class_hash_map: CopyOnWriteDict[
+            Address, ClassHashType
+        ] = CopyOnWriteDict()
         self.expected_contract_calls: dict[
             Address, list[tuple[SelectorType, CairoOrPythonData]]
         ] = {}
@@ -57,23 +69,30 @@ class CheatableCachedState(CachedState):
             contract_class_cache=self.contract_classes,
         )
 
-        copied.pranked_contracts_map = self.pranked_contracts_map.copy()
-        copied.mocked_calls_map = self.mocked_calls_map.copy()
-        copied.event_selector_to_name_map = self.event_selector_to_name_map.copy()
+        copied.pranked_contracts_map = self.pranked_contracts_map.fork()
+        # Cheatcodes modify mocked selectors and expected calls of an address in place.
+        copied.mocked_calls_map = {
+            address: dict(selector_to_ret_data)
+            for address, selector_to_ret_data in self.mocked_calls_map.items()
+        }
+        copied.event_selector_to_name_map = self.event_selector_to_name_map.fork()
 
         copied.event_name_to_contract_abi_map = (
-            self.event_name_to_contract_abi_map.copy()
+            self.event_name_to_contract_abi_map.fork()
         )
         copied.class_hash_to_contract_abi_map = (
-            self.class_hash_to_contract_abi_map.copy()
+            self.class_hash_to_contract_abi_map.fork()
         )
         copied.class_hash_to_contract_path_map = (
-            self.class_hash_to_contract_path_map.copy()
+            self.class_hash_to_contract_path_map.fork()
         )
         copied.contract_address_to_class_hash_map = (
-            self.contract_address_to_class_hash_map.copy()
+            self.contract_address_to_class_hash_map.fork()
         )
-        copied.expected_contract_calls = self.expected_contract_calls.copy()
+        copied.expected_contract_calls = {
+            address: list(expected_calls)
+            for address, expected_calls in self.expected_contract_calls.items()
+        }
 
         copied.cheaters = self.cheaters.copy()
 
@@ -83,10 +102,7 @@ class CheatableCachedState(CachedState):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent.pranked_contracts_map = {
-            **parent.pranked_contracts_map,
-            **self.pranked_contracts_map,
-        }
+        self.pranked_contracts_map.apply(parent.pranked_contracts_map)
 
         parent.mocked_calls_map = {**parent.mocked_calls_map}
 
@@ -100,28 +116,15 @@ class CheatableCachedState(CachedState):
             else:
                 parent.mocked_calls_map[address] = self.mocked_calls_map[address]
 
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
-
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
-
-        parent.class_hash_to_contract_path_map = {
-            **parent.class_hash_to_contract_path_map,
-            **self.class_hash_to_contract_path_map,
-        }
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
+        self.event_selector_to_name_map.apply(parent.event_selector_to_name_map)
+        self.event_name_to_contract_abi_map.apply(parent.event_name_to_contract_abi_map)
+        self.class_hash_to_contract_path_map.apply(
+            parent.class_hash_to_contract_path_map
+        )
+        self.class_hash_to_contract_abi_map.apply(parent.class_hash_to_contract_abi_map)
+        self.contract_address_to_class_hash_map.apply(
+            parent.contract_address_to_class_hash_map
+        )
         parent.expected_contract_calls = {
             **parent.expected_contract_calls,
             **self.expected_contract_calls,
@@ -1,7 +1,8 @@
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Tuple, cast
 from copy import deepcopy
 
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
@@ -37,6 +38,7 @@ from starkware.starknet.public import abi as starknet_abi
 from starkware.starknet.services.api.contract_class import (
     ContractClass,
     ContractEntryPoint,
+    EntryPointType,
 )
 from starkware.starkware_utils.error_handling import (
     StarkException,
@@ -95,6 +97,26 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     max_steps: Optional[int] = None
     "``None`` means default Cairo value."
 
+    visited_edges: Optional[set[tuple[int, Optional[int], int]]] = None
+    "When set, control flow edges taken by executed contracts are added to it."
+
+    MAX_VALIDATED_CONTRACT_CLASSES: ClassVar[int] = 128
+    MAX_SELECTED_ENTRY_POINTS: ClassVar[int] = 1024
+
+    validated_contract_classes: ClassVar[
+        "OrderedDict[bytes, ContractClass]"
+    ] = OrderedDict()
+    """
+    Recently used contract classes, which passed validation, by class hash.
+    A class hash identifies the contract class, so the cache is shared by all states in the process.
+    Only the most recently used classes are kept, so a long-lived worker doesn't keep classes of every run.
+    """
+
+    selected_entry_points: ClassVar[
+        "OrderedDict[Tuple[bytes, EntryPointType, int], ContractEntryPoint]"
+    ] = OrderedDict()
+    "Recently used entry points of validated contract classes by class hash, entry point type and selector."
+
     def _run(
         self,
         state: SyncState,
@@ -120,12 +142,14 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                 message="Fraud attempt blocked.",
             )
 
-        contract_class = state.get_contract_class(class_hash=class_hash)
-        contract_class.validate()
-
-        entry_point = self._get_selected_entry_point(
+        # region Modified Starknet code.
+        contract_class = self._get_validated_contract_class(
+            state=state, class_hash=class_hash
+        )
+        entry_point = self._get_cached_selected_entry_point(
             contract_class=contract_class, class_hash=class_hash
         )
+        # endregion
 
         # Run the specified contract entry point with given calldata.
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
@@ -268,6 +292,9 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         # region Modified Starknet code.
 
+        if CheatableExecuteEntryPoint.visited_edges is not None:
+            self.record_visited_edges(runner, class_hash)
+
         if self.profiling:
             self.append_runtime_profile(runner, contract_class, entry_point)
             self.pop_contract_callstack()
@@ -278,6 +305,51 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         return runner, syscall_handler
 
+    @staticmethod
+    def _get_validated_contract_class(
+        state: SyncState, class_hash: bytes
+    ) -> ContractClass:
+        contract_class = CheatableExecuteEntryPoint.validated_contract_classes.get(
+            class_hash
+        )
+        if contract_class is not None:
+            CheatableExecuteEntryPoint.validated_contract_classes.move_to_end(
+                class_hash
+            )
+            return contract_class
+
+        contract_class = state.get_contract_class(class_hash=class_hash)
+        contract_class.validate()
+        CheatableExecuteEntryPoint.validated_contract_classes[
+            class_hash
+        ] = contract_class
+        while (
+            len(CheatableExecuteEntryPoint.validated_contract_classes)
+            > CheatableExecuteEntryPoint.MAX_VALIDATED_CONTRACT_CLASSES
+        ):
+            CheatableExecuteEntryPoint.validated_contract_classes.popitem(last=False)
+        return contract_class
+
+    def _get_cached_selected_entry_point(
+        self, contract_class: ContractClass, class_hash: bytes
+    ) -> ContractEntryPoint:
+        key = (class_hash, self.entry_point_type, self.entry_point_selector)
+        entry_point = CheatableExecuteEntryPoint.selected_entry_points.get(key)
+        if entry_point is not None:
+            CheatableExecuteEntryPoint.selected_entry_points.move_to_end(key)
+            return entry_point
+
+        entry_point = self._get_selected_entry_point(
+            contract_class=contract_class, class_hash=class_hash
+        )
+        CheatableExecuteEntryPoint.selected_entry_points[key] = entry_point
+        while (
+            len(CheatableExecuteEntryPoint.selected_entry_points)
+            > CheatableExecuteEntryPoint.MAX_SELECTED_ENTRY_POINTS
+        ):
+            CheatableExecuteEntryPoint.selected_entry_points.popitem(last=False)
+        return entry_point
+
     def append_contract_callstack(self, state: SyncState, class_hash: bytes):
         if not CheatableExecuteEntryPoint.contract_callstack:
             CheatableExecuteEntryPoint.contract_callstack.append("TEST_CONTRACT")
@@ -290,6 +362,17 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     def pop_contract_callstack(self):
         CheatableExecuteEntryPoint.contract_callstack.pop()
 
+    @staticmethod
+    def record_visited_edges(runner: CairoFunctionRunner, class_hash: bytes):
+        visited_edges = CheatableExecuteEntryPoint.visited_edges
+        assert visited_edges is not None
+        code_id = from_bytes(class_hash)
+        previous_pc: Optional[int] = None
+        for trace_entry in runner.vm.trace:
+            pc = cast(RelocatableValue, trace_entry.pc).offset
+            visited_edges.add((code_id, previous_pc, pc))
+            previous_pc = pc
+
     def append_runtime_profile(
         self,
         runner: CairoFunctionRunner,
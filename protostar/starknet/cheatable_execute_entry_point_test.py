@@ -0,0 +1,142 @@
+from typing import Type, Union
+
+import pytest
+from pytest_mock import MockerFixture
+from starkware.starknet.services.api.contract_class import EntryPointType
+from starkware.starkware_utils.error_handling import StarkException
+
+from protostar.cheatable_starknet.cheatables.cheatable_execute_entry_point import (
+    CheatableExecuteEntryPoint as Cairo1CheatableExecuteEntryPoint,
+)
+
+from .cheatable_execute_entry_point import CheatableExecuteEntryPoint
+
+CheatableExecuteEntryPointType = Union[
+    Type[CheatableExecuteEntryPoint], Type[Cairo1CheatableExecuteEntryPoint]
+]
+
+CLASS_HASH = b"\x01" * 32
+SELECTOR = 0x123
+
+
+@pytest.fixture(
+    name="execute_entry_point_cls",
+    params=[CheatableExecuteEntryPoint, Cairo1CheatableExecuteEntryPoint],
+)
+def execute_entry_point_cls_fixture(
+    request: pytest.FixtureRequest, mocker: MockerFixture
+) -> CheatableExecuteEntryPointType:
+    execute_entry_point_cls: CheatableExecuteEntryPointType = request.param
+    mocker.patch.dict(execute_entry_point_cls.validated_contract_classes, clear=True)
+    mocker.patch.dict(execute_entry_point_cls.selected_entry_points, clear=True)
+    return execute_entry_point_cls
+
+
+def create_execute_entry_point(execute_entry_point_cls: CheatableExecuteEntryPointType):
+    return execute_entry_point_cls.create(
+        contract_address=1,
+        entry_point_selector=SELECTOR,
+        entry_point_type=EntryPointType.EXTERNAL,
+        calldata=[],
+        caller_address=0,
+    )
+
+
+def test_contract_class_is_validated_once_per_class_hash(
+    execute_entry_point_cls: CheatableExecuteEntryPointType, mocker: MockerFixture
+):
+    contract_class = mocker.MagicMock()
+    state = mocker.MagicMock()
+    state.get_contract_class.return_value = contract_class
+
+    for _ in range(3):
+        # pylint: disable=protected-access
+        assert (
+            execute_entry_point_cls._get_validated_contract_class(
+                state=state, class_hash=CLASS_HASH
+            )
+            is contract_class
+        )
+
+    contract_class.validate.assert_called_once()
+    state.get_contract_class.assert_called_once_with(class_hash=CLASS_HASH)
+
+
+def test_invalid_contract_class_raises_on_every_call(
+    execute_entry_point_cls: CheatableExecuteEntryPointType, mocker: MockerFixture
+):
+    contract_class = mocker.MagicMock()
+    contract_class.validate.side_effect = ValueError("Invalid contract class.")
+    state = mocker.MagicMock()
+    state.get_contract_class.return_value = contract_class
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            # pylint: disable=protected-access
+            execute_entry_point_cls._get_validated_contract_class(
+                state=state, class_hash=CLASS_HASH
+            )
+
+    assert contract_class.validate.call_count == 2
+
+
+def test_entry_point_is_selected_once(
+    execute_entry_point_cls: CheatableExecuteEntryPointType, mocker: MockerFixture
+):
+    entry_point = mocker.MagicMock(selector=SELECTOR)
+    contract_class = mocker.MagicMock()
+    contract_class.entry_points_by_type = {EntryPointType.EXTERNAL: [entry_point]}
+    execute_entry_point = create_execute_entry_point(execute_entry_point_cls)
+    get_selected_entry_point = mocker.spy(
+        execute_entry_point_cls, "_get_selected_entry_point"
+    )
+
+    for _ in range(3):
+        # pylint: disable=protected-access
+        assert (
+            execute_entry_point._get_cached_selected_entry_point(
+                contract_class=contract_class, class_hash=CLASS_HASH
+            )
+            is entry_point
+        )
+
+    get_selected_entry_point.assert_called_once()
+
+
+def test_missing_entry_point_raises_on_every_call(
+    execute_entry_point_cls: CheatableExecuteEntryPointType, mocker: MockerFixture
+):
+    contract_class = mocker.MagicMock()
+    contract_class.entry_points_by_type = {EntryPointType.EXTERNAL: []}
+    execute_entry_point = create_execute_entry_point(execute_entry_point_cls)
+
+    for _ in range(2):
+        with pytest.raises(StarkException):
+            # pylint: disable=protected-access
+            execute_entry_point._get_cached_selected_entry_point(
+                contract_class=contract_class, class_hash=CLASS_HASH
+            )
+
+    assert not execute_entry_point_cls.selected_entry_points
+
+
+def test_least_recently_used_contract_classes_are_evicted(
+    execute_entry_point_cls: CheatableExecuteEntryPointType, mocker: MockerFixture
+):
+    mocker.patch.object(execute_entry_point_cls, "MAX_VALIDATED_CONTRACT_CLASSES", 2)
+    state = mocker.MagicMock()
+    class_hashes = [bytes([index]) * 32 for index in range(3)]
+
+    # pylint: disable=protected-access
+    for class_hash in [class_hashes[0], class_hashes[1], class_hashes[0]]:
+        execute_entry_point_cls._get_validated_contract_class(
+            state=state, class_hash=class_hash
+        )
+    execute_entry_point_cls._get_validated_contract_class(
+        state=state, class_hash=class_hashes[2]
+    )
+
+    assert list(execute_entry_point_cls.validated_contract_classes) == [
+        class_hashes[0],
+        class_hashes[2],
+    ]
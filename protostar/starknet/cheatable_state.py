@@ -1,3 +1,4 @@
+import copy
 from typing import List, Optional, Union, cast
 
 from starkware.cairo.lang.vm.crypto import pedersen_hash_func
@@ -131,3 +132,17 @@ class CheatableStarknetState(StarknetState):
 
     def copy(self) -> "CheatableStarknetState":
         return cast(CheatableStarknetState, super().copy())
+
+    def fork_layer(self) -> "CheatableStarknetState":
+        """
+        Unlike `copy`, doesn't copy the state, but stacks a layer on top of it.
+        The layer records storage writes, cheats, messages and events, so dropping it rolls them back.
+        This state must not be modified while the layer is in use.
+        """
+        layer = copy.copy(self)
+        # pylint: disable=protected-access
+        layer.state = self.cheatable_state._copy()
+        for name, value in vars(self).items():
+            if isinstance(value, (list, dict)):
+                setattr(layer, name, copy.copy(value))
+        return layer
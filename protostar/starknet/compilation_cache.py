@@ -0,0 +1,130 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, Tuple, Type
+
+from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.cairo import PassManagerConfig, PassManagerFactory
+from protostar.self.cache_io import CacheIO
+
+CompilationCacheKey = str
+
+IMPORTED_MODULE_PATTERN = re.compile(
+    r"^\s*(?:from\s+([\w.]+)\s+import\b|import\s+([\w.]+))", re.MULTILINE
+)
+
+
+class CompilationCache:
+    """
+    Persistent, content-addressed cache of assembled contracts.
+
+    An entry is addressed by the contents of compiled files and all modules they transitively
+    import, so editing any of them results in a cache miss rather than in stale results.
+    Entries, which were not used for `MAX_ENTRY_AGE` seconds, are removed once a day.
+    """
+
+    _CACHE_NAMESPACE = "compilation"
+    MAX_ENTRY_AGE = 30 * 24 * 60 * 60
+    PRUNING_INTERVAL = 24 * 60 * 60
+
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+        self._cache_io: Optional[CacheIO] = None
+
+    def build_key(
+        self,
+        cairo_file_paths: Iterable[Path],
+        config: PassManagerConfig,
+        pass_manager_factory: Type[PassManagerFactory],
+        add_debug_info: bool,
+    ) -> CompilationCacheKey:
+        digest = hashlib.sha256()
+        for part in [
+            cairo_lang_version,
+            f"{pass_manager_factory.__module__}.{pass_manager_factory.__qualname__}",
+            str(config.disable_hint_validation),
+            str(add_debug_info),
+            *config.include_paths,
+        ]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        read_module = get_module_reader(cairo_path=config.include_paths).read
+        for file_name, code in collect_sources_with_dependencies(
+            cairo_file_paths, read_module
+        ):
+            digest.update(file_name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(code.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def read(self, key: CompilationCacheKey) -> Optional[ContractClass]:
+        try:
+            cache_io = self._get_cache_io()
+            serialized = cache_io.read(self._get_entry_name(key))
+            if serialized is None:
+                return None
+            contract_class = ContractClass.load(serialized)
+            cache_io.touch(self._get_entry_name(key))
+            return contract_class
+        # A corrupted entry must never break compilation, it is recompiled and overridden instead.
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def write(self, key: CompilationCacheKey, contract_class: ContractClass) -> None:
+        self._get_cache_io().write(self._get_entry_name(key), contract_class.dump())
+
+    def _get_cache_io(self) -> CacheIO:
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+            self._cache_io.prune(
+                self._CACHE_NAMESPACE,
+                max_age=self.MAX_ENTRY_AGE,
+                interval=self.PRUNING_INTERVAL,
+            )
+        return self._cache_io
+
+    def _get_entry_name(self, key: CompilationCacheKey) -> str:
+        return f"{self._CACHE_NAMESPACE}/{key}"
+
+
+def find_imported_modules(code: str) -> List[str]:
+    return [
+        from_module or plain_module
+        for from_module, plain_module in IMPORTED_MODULE_PATTERN.findall(code)
+    ]
+
+
+def collect_sources_with_dependencies(
+    cairo_file_paths: Iterable[Path], read_module: Callable[[str], Tuple[str, str]]
+) -> List[Tuple[str, str]]:
+    """
+    Returns `(file name, code)` pairs of given files and all modules they transitively import,
+    resolved the same way the Cairo compiler resolves them.
+    Modules that cannot be found are skipped, because the compilation fails anyway in such case.
+    """
+    sources: List[Tuple[str, str]] = [
+        (str(path), path.read_text("utf-8")) for path in cairo_file_paths
+    ]
+    dependencies: List[Tuple[str, str]] = []
+    visited_modules: Set[str] = set()
+    modules_to_visit = [
+        module for _, code in sources for module in find_imported_modules(code)
+    ]
+    while modules_to_visit:
+        module = modules_to_visit.pop()
+        if module in visited_modules:
+            continue
+        visited_modules.add(module)
+        try:
+            code, file_name = read_module(module)
+        except ModuleNotFoundException:
+            continue
+        dependencies.append((file_name, code))
+        modules_to_visit.extend(find_imported_modules(code))
+    return sources + sorted(dependencies)
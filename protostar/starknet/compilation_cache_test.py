@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+
+from .compilation_cache import (
+    collect_sources_with_dependencies,
+    find_imported_modules,
+)
+
+
+def test_finding_imported_modules():
+    code = """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from src.utils import (
+    foo,
+    bar,
+)
+import src.math
+// from src.commented import baz
+"""
+
+    assert find_imported_modules(code) == [
+        "starkware.cairo.common.cairo_builtins",
+        "src.utils",
+        "src.math",
+    ]
+
+
+def test_collecting_transitive_dependencies(tmp_path: Path):
+    source_path = tmp_path / "main.cairo"
+    source_path.write_text("from lib.a import x\n", encoding="utf-8")
+    modules = {
+        "lib.a": ("from lib.b import y\nfrom lib.missing import z\n", "lib/a.cairo"),
+        "lib.b": ("from lib.a import x\n", "lib/b.cairo"),
+    }
+
+    def read_module(module_name: str) -> tuple[str, str]:
+        if module_name not in modules:
+            raise ModuleNotFoundException(module_name)
+        return modules[module_name]
+
+    result = collect_sources_with_dependencies([source_path], read_module)
+
+    assert result == [
+        (str(source_path), "from lib.a import x\n"),
+        ("lib/a.cairo", modules["lib.a"][0]),
+        ("lib/b.cairo", modules["lib.b"][0]),
+    ]
@@ -0,0 +1,149 @@
+from typing import Any, Dict, Iterator, MutableMapping, Optional, TypeVar
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+_MISSING = object()
+_DELETED = object()
+
+
+class _Layer:
+    __slots__ = ("entries", "parent", "depth")
+
+    def __init__(self, entries: Dict[Any, Any], parent: Optional["_Layer"]):
+        self.entries = entries
+        self.parent = parent
+        self.depth: int = 1 if parent is None else parent.depth + 1
+
+    def get(self, key: Any) -> Any:
+        layer: Optional[_Layer] = self
+        while layer is not None:
+            value = layer.entries.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            layer = layer.parent
+        return _MISSING
+
+    def merge_until(self, last_excluded: Optional["_Layer"]) -> Dict[Any, Any]:
+        """
+        Returns entries of this layer and its ancestors up to `last_excluded`, including removal markers.
+        """
+        layers = []
+        layer: Optional[_Layer] = self
+        while layer is not None and layer is not last_excluded:
+            layers.append(layer)
+            layer = layer.parent
+
+        result: Dict[Any, Any] = {}
+        for layer in reversed(layers):
+            result.update(layer.entries)
+        return result
+
+    def flatten(self) -> Dict[Any, Any]:
+        return {
+            key: value
+            for key, value in self.merge_until(None).items()
+            if value is not _DELETED
+        }
+
+
+class CopyOnWriteDict(MutableMapping[KeyT, ValueT]):
+    """
+    Dictionary, which can be forked in constant time.
+
+    A fork shares entries with the dictionary it was forked from and stores only its own changes.
+    Entries stored before forking are frozen, so writes to either dictionary are not visible in the other.
+    Values are shared rather than copied, hence they must not be mutated in place.
+    """
+
+    MAX_LAYERS = 16
+    """
+    Chains of frozen entries longer than that are flattened on fork to keep lookups fast.
+    """
+
+    def __init__(self, entries: Optional[Dict[KeyT, ValueT]] = None):
+        self._base: Optional[_Layer] = None
+        self._changes: Dict[Any, Any] = dict(entries or {})
+        self._fork_point: Optional[_Layer] = None
+        "Layer shared with the dictionary this one was forked from. Layers above it hold own changes."
+
+    def fork(self) -> "CopyOnWriteDict[KeyT, ValueT]":
+        if self._changes:
+            self._base = _Layer(self._changes, self._base)
+            self._changes = {}
+        if self._base is not None and self._base.depth > self.MAX_LAYERS:
+            self._flatten_base()
+
+        forked: CopyOnWriteDict[KeyT, ValueT] = CopyOnWriteDict()
+        forked._base = self._base
+        forked._fork_point = self._base
+        return forked
+
+    def apply(self, parent: "CopyOnWriteDict[KeyT, ValueT]") -> None:
+        """
+        Writes entries set since this dictionary was forked from the `parent`,
+        including entries frozen by forking this dictionary in the meantime.
+        Like `{**parent, **fork}`, it doesn't remove entries removed from the fork.
+        """
+        changes = (
+            self._base.merge_until(self._fork_point) if self._base is not None else {}
+        )
+        changes.update(self._changes)
+        for key, value in changes.items():
+            if value is not _DELETED:
+                parent[key] = value
+
+    def _flatten_base(self) -> None:
+        assert self._base is not None
+        own_changes = self._base.merge_until(self._fork_point)
+        self._fork_point = (
+            _Layer(self._fork_point.flatten(), None)
+            if self._fork_point is not None
+            else None
+        )
+        self._base = _Layer(own_changes, self._fork_point)
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        value = self._changes.get(key, _MISSING)
+        if value is _MISSING and self._base is not None:
+            value = self._base.get(key)
+        if value is _MISSING or value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self._changes[key] = value
+
+    def __delitem__(self, key: KeyT) -> None:
+        if key not in self:
+            raise KeyError(key)
+        base_value = _MISSING if self._base is None else self._base.get(key)
+        if base_value is _MISSING or base_value is _DELETED:
+            del self._changes[key]
+        else:
+            self._changes[key] = _DELETED
+
+    def __iter__(self) -> Iterator[KeyT]:
+        return iter(self._to_dict())
+
+    def __len__(self) -> int:
+        return len(self._to_dict())
+
+    def __copy__(self) -> "CopyOnWriteDict[KeyT, ValueT]":
+        return self.fork()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CopyOnWriteDict[KeyT, ValueT]":
+        return self.fork()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._to_dict()!r})"
+
+    def _to_dict(self) -> Dict[KeyT, ValueT]:
+        return _Layer(self._changes, self._base).flatten()
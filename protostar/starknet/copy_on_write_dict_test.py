@@ -0,0 +1,104 @@
+from copy import deepcopy
+
+import pytest
+
+from .copy_on_write_dict import CopyOnWriteDict
+
+
+def test_fork_shares_entries():
+    origin = CopyOnWriteDict({"a": 1, "b": 2})
+
+    forked = origin.fork()
+
+    assert dict(forked) == {"a": 1, "b": 2}
+
+
+def test_writes_are_not_visible_between_forks():
+    origin = CopyOnWriteDict({"a": 1})
+    forked = origin.fork()
+
+    forked["a"] = 2
+    forked["b"] = 3
+    origin["c"] = 4
+
+    assert dict(origin) == {"a": 1, "c": 4}
+    assert dict(forked) == {"a": 2, "b": 3}
+
+
+def test_removing_entry_inherited_from_origin():
+    origin = CopyOnWriteDict({"a": 1, "b": 2})
+    forked = origin.fork()
+
+    del forked["a"]
+
+    assert "a" not in forked
+    assert len(forked) == 1
+    assert origin["a"] == 1
+    with pytest.raises(KeyError):
+        del forked["a"]
+
+
+def test_apply_writes_only_changed_entries():
+    parent = CopyOnWriteDict({"a": 1, "b": 2})
+    forked = parent.fork()
+    forked["a"] = 10
+    del forked["b"]
+    forked["c"] = 3
+
+    forked.apply(parent)
+
+    assert dict(parent) == {"a": 10, "b": 2, "c": 3}
+
+
+def test_apply_writes_entries_set_before_nested_fork():
+    parent = CopyOnWriteDict({"a": 1})
+    forked = parent.fork()
+    forked["b"] = 2
+    nested = forked.fork()
+    nested["c"] = 3
+    nested.apply(forked)
+    forked["d"] = 4
+
+    forked.apply(parent)
+
+    assert dict(parent) == {"a": 1, "b": 2, "c": 3, "d": 4}
+
+
+def test_apply_writes_own_entries_after_flattening():
+    parent = CopyOnWriteDict({"a": 1})
+    forked = parent.fork()
+    for i in range(3 * CopyOnWriteDict.MAX_LAYERS):
+        forked[i] = i
+        nested = forked.fork()
+        nested.apply(forked)
+
+    forked.apply(parent)
+
+    assert dict(parent) == {
+        "a": 1,
+        **{i: i for i in range(3 * CopyOnWriteDict.MAX_LAYERS)},
+    }
+
+
+def test_deepcopy_forks():
+    origin = CopyOnWriteDict({"a": 1})
+
+    copied = deepcopy(origin)
+    copied["a"] = 2
+
+    assert origin["a"] == 1
+    assert copied["a"] == 2
+
+
+def test_long_chains_of_forks_are_flattened():
+    current = CopyOnWriteDict({0: 0})
+    for i in range(1, 3 * CopyOnWriteDict.MAX_LAYERS):
+        current[i] = i
+        del current[i - 1]
+        current = current.fork()
+
+    last = 3 * CopyOnWriteDict.MAX_LAYERS - 1
+    assert dict(current) == {last: last}
+    # pylint: disable=protected-access
+    assert current._base is not None
+    assert current._base.depth <= CopyOnWriteDict.MAX_LAYERS + 1
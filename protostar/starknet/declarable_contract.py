@@ -0,0 +1,77 @@
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from starkware.python.utils import from_bytes
+from starkware.starknet.business_logic.transaction.objects import InternalDeclare
+from starkware.starknet.public.abi import AbiType
+from starkware.starknet.services.api.contract_class import ContractClass
+from starkware.starknet.services.api.gateway.transaction import (
+    DEFAULT_DECLARE_SENDER_ADDRESS,
+)
+from starkware.starknet.testing.contract_utils import EventManager, get_abi
+from typing_extensions import Self
+
+
+@dataclass(frozen=True)
+class DeclarableContract:
+    """
+    Everything needed to declare a compiled contract, which is expensive to compute,
+    but does not depend on the state the contract is declared in.
+    """
+
+    declare_tx: InternalDeclare
+    abi: AbiType
+    event_selector_to_name_map: Dict[int, str]
+
+    @property
+    def class_hash(self) -> int:
+        assert self.declare_tx.class_hash is not None
+        return from_bytes(self.declare_tx.class_hash)
+
+    @classmethod
+    def from_contract_class(cls, contract_class: ContractClass, chain_id: int) -> Self:
+        declare_tx = InternalDeclare.create(
+            contract_class=contract_class,
+            chain_id=chain_id,
+            sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
+            max_fee=0,
+            version=0,
+            signature=[],
+            nonce=0,
+        )
+        abi = get_abi(contract_class=contract_class)
+        return cls(
+            declare_tx=declare_tx,
+            abi=abi,
+            # pylint: disable=protected-access
+            event_selector_to_name_map=EventManager(abi=abi)._selector_to_name,
+        )
+
+
+class DeclarableContractCache:
+    """
+    Caches `DeclarableContract` per compiled contract object for as long as the object lives,
+    so declaring the same compiled contract again skips computing the class hash and the ABI.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[
+            Tuple[int, int], Tuple["weakref.ref[ContractClass]", DeclarableContract]
+        ] = {}
+
+    def get(self, contract_class: ContractClass, chain_id: int) -> DeclarableContract:
+        key = (id(contract_class), chain_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is contract_class:
+            return entry[1]
+
+        declarable_contract = DeclarableContract.from_contract_class(
+            contract_class, chain_id
+        )
+        self._entries[key] = (weakref.ref(contract_class), declarable_contract)
+        weakref.finalize(contract_class, self._entries.pop, key, None)
+        return declarable_contract
+
+
+declarable_contract_cache = DeclarableContractCache()
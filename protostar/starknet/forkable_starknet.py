@@ -39,9 +39,20 @@ class ForkableStarknet(Starknet):
             deploy_call_info=copy.deepcopy(deployed_contract.deploy_call_info),
         )
 
+    def rebind_contract(self, contract: StarknetContract) -> StarknetContract:
+        """
+        Cheaper alternative to `copy_and_adapt_contract`, which shares the ABI with the given contract.
+        """
+        rebound_contract = copy.copy(contract)
+        rebound_contract.state = self.cheatable_state
+        return rebound_contract
+
     def fork(self):
         return ForkableStarknet(state=self.cheatable_state.copy())
 
+    def fork_layer(self) -> "ForkableStarknet":
+        return ForkableStarknet(state=self.cheatable_state.fork_layer())
+
     async def deploy(
         self,
         source: Optional[str] = None,
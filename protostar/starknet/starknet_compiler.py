@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Type, Union
+from typing import Optional, Type, Union
 
 from starkware.cairo.lang.compiler.constants import MAIN_SCOPE
 from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
@@ -11,11 +11,13 @@ from starkware.starknet.compiler.compile import assemble_starknet_contract
 from starkware.starknet.compiler.starknet_preprocessor import (
     StarknetPreprocessedProgram,
 )
+from starkware.starknet.public.abi import AbiType
 from starkware.starknet.services.api.contract_class import ContractClass
 
 from protostar.protostar_exception import ProtostarException
 from protostar.cairo import PassManagerConfig, PassManagerFactory
 
+from .compilation_cache import CompilationCache, CompilationCacheKey
 from .pass_managers import TestCollectorPreprocessedProgram
 
 StarknetCompilerConfig = PassManagerConfig
@@ -26,8 +28,22 @@ class StarknetCompiler:
         self,
         config: StarknetCompilerConfig,
         pass_manager_factory: Type[PassManagerFactory],
+        compilation_cache: Optional[CompilationCache] = None,
     ):
         self.pass_manager = pass_manager_factory.build(config)
+        self._config = config
+        self._pass_manager_factory = pass_manager_factory
+        self._compilation_cache = compilation_cache
+
+    def __getstate__(self):
+        # The pass manager is rebuilt instead of being pickled, e.g. when collecting tests in a process pool.
+        state = self.__dict__.copy()
+        del state["pass_manager"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.pass_manager = self._pass_manager_factory.build(self._config)
 
     class FileNotFoundException(ProtostarException):
         pass
@@ -37,9 +53,7 @@ class StarknetCompiler:
 
     def preprocess_contract(
         self, *cairo_file_paths: Path
-    ) -> Union[
-        StarknetPreprocessedProgram, TestCollectorPreprocessedProgram
-    ]:  # TODO #1280: Cache result
+    ) -> Union[StarknetPreprocessedProgram, TestCollectorPreprocessedProgram]:
         try:
             codes = [
                 (cairo_file_path.read_text("utf-8"), str(cairo_file_path))
@@ -94,15 +108,67 @@ class StarknetCompiler:
         self,
         *sources: Path,
         add_debug_info: bool = False,
-    ) -> ContractClass:  # TODO #1280: Cache result
+    ) -> ContractClass:
+        cache_key = self.build_cache_key(*sources, add_debug_info=add_debug_info)
+        if self._compilation_cache is None or cache_key is None:
+            return self._compile_contract(*sources, add_debug_info=add_debug_info)
+
+        cached = self._compilation_cache.read(cache_key)
+        if cached is not None:
+            return cached
+
+        assembled = self._compile_contract(*sources, add_debug_info=add_debug_info)
+        self._compilation_cache.write(cache_key, assembled)
+        return assembled
+
+    def build_cache_key(
+        self,
+        *sources: Path,
+        add_debug_info: bool = False,
+    ) -> Optional[CompilationCacheKey]:
+        """
+        Returns a key identifying the compilation output by contents of all compiled files,
+        or `None` if the compiler has no compilation cache.
+        """
+        if self._compilation_cache is None:
+            return None
+        try:
+            return self._compilation_cache.build_key(
+                cairo_file_paths=sources,
+                config=self._config,
+                pass_manager_factory=self._pass_manager_factory,
+                add_debug_info=add_debug_info,
+            )
+        except FileNotFoundError as err:
+            raise StarknetCompiler.FileNotFoundException(
+                message=f"Couldn't find file '{err.filename}'"
+            ) from err
+
+    def _compile_contract(
+        self,
+        *sources: Path,
+        add_debug_info: bool,
+    ) -> ContractClass:
         preprocessed = self.preprocess_contract(*sources)
         assert isinstance(preprocessed, StarknetPreprocessedProgram)
         assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
         return assembled
 
-    def get_function_names(
+    def get_functions_abi(
         self,
         file_path: Path,
-    ) -> List[str]:
+    ) -> AbiType:
         preprocessed = self.preprocess_contract(file_path)
-        return [el["name"] for el in preprocessed.abi if el["type"] == "function"]
+        return [el for el in preprocessed.abi if el["type"] == "function"]
+
+    def get_functions_abi_from_compiled_contract(
+        self,
+        file_path: Path,
+        add_debug_info: bool = False,
+    ) -> AbiType:
+        """
+        Compiles the contract instead of only preprocessing it, so the compilation cache
+        already holds the compilation output when the contract is compiled again.
+        """
+        contract_class = self.compile_contract(file_path, add_debug_info=add_debug_info)
+        return [el for el in contract_class.abi or [] if el["type"] == "function"]
@@ -1,4 +1,5 @@
-from .test_collector import TestCollector
+from .test_collector import TestCollector, get_suite_functions_from_abi
+from .test_collection_cache import TestCollectionCache
 from .test_output_recorder import OutputName, format_output_name
 from .test_results import (
     BrokenFuzzTestCaseResult,
@@ -22,7 +23,7 @@ from .test_results import (
 )
 from .test_runner import TestRunner
 from .testing_summary import TestingSummary
-from .test_scheduler import TestScheduler
-from .test_shared_tests_state import SharedTestsState
+from .test_scheduler import TestScheduler, TestWorkerPool
+from .test_shared_tests_state import SharedTestsState, TestResultsSourceProtocol
 from .testing_seed import determine_testing_seed
 from .hook import Hook
@@ -1,4 +1,5 @@
 from .assume_cheatcode import AssumeCheatcode
+from .coverage_guided_fuzzing_cheatcode import CoverageGuidedFuzzingCheatcode
 from .declare_cheatcode import DeclareCheatcode
 from .deploy_cheatcode import DeployCheatcode
 from .deploy_contract_cheatcode import DeployContractCheatcode
@@ -18,3 +19,4 @@ from .start_prank_cheatcode import StartPrankCheatcode
 from .store_cheatcode import StoreCheatcode
 from .warp_cheatcode import WarpCheatcode
 from .expect_call_cheatcode import ExpectCallCheatcode
+from .fuzz_time_budget_cheatcode import FuzzTimeBudgetCheatcode
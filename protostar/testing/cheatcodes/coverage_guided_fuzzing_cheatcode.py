@@ -0,0 +1,24 @@
+from typing import Callable
+
+from protostar.starknet import Cheatcode
+from protostar.testing.test_config import TestConfig
+
+
+class CoverageGuidedFuzzingCheatcode(Cheatcode):
+    def __init__(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        test_config: TestConfig,
+    ):
+        super().__init__(syscall_dependencies)
+        self.test_config = test_config
+
+    @property
+    def name(self) -> str:
+        return "coverage_guided_fuzzing"
+
+    def build(self) -> Callable[..., None]:
+        return self.coverage_guided_fuzzing
+
+    def coverage_guided_fuzzing(self, enabled: bool = True) -> None:
+        self.test_config.fuzz_coverage_guided = enabled
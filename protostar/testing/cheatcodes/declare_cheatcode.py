@@ -3,17 +3,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
 
-from starkware.python.utils import from_bytes
-from starkware.starknet.business_logic.transaction.objects import InternalDeclare
-from starkware.starknet.public.abi import AbiType
-from starkware.starknet.services.api.gateway.transaction import (
-    DEFAULT_DECLARE_SENDER_ADDRESS,
-)
 from starkware.starknet.testing.contract import DeclaredClass
-from starkware.starknet.testing.contract_utils import EventManager, get_abi
 
 from protostar.compiler import ProjectCompiler
 from protostar.starknet import Cheatcode, KeywordOnlyArgumentCheatcodeException
+from protostar.starknet.declarable_contract import (
+    DeclarableContract,
+    declarable_contract_cache,
+)
 
 
 @dataclass
@@ -73,38 +70,31 @@ class DeclareCheatcode(Cheatcode):
             self._project_compiler.compile_contract_from_contract_identifier(contract)
         )
 
-        tx = InternalDeclare.create(
-            contract_class=contract_class,
-            chain_id=self.general_config.chain_id.value,
-            sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
-            max_fee=0,
-            version=0,
-            signature=[],
-            nonce=0,
+        declarable_contract = declarable_contract_cache.get(
+            contract_class, chain_id=self.general_config.chain_id.value
         )
+        tx = declarable_contract.declare_tx
 
         with self.cheatable_state.copy_and_apply() as state_copy:
             await tx.apply_state_updates(
                 state=state_copy, general_config=self.general_config
             )
 
-        abi = get_abi(contract_class=contract_class)
-        self._add_event_abi_to_state(abi)
+        self._add_event_abi_to_state(declarable_contract)
         class_hash = tx.class_hash
         assert class_hash is not None
         await self.cheatable_state.set_contract_class(class_hash, contract_class)
 
         return DeclaredClass(
-            class_hash=from_bytes(class_hash),
-            abi=get_abi(contract_class=contract_class),
+            class_hash=declarable_contract.class_hash,
+            abi=declarable_contract.abi,
         )
 
-    def _add_event_abi_to_state(self, abi: AbiType):
-        event_manager = EventManager(abi=abi)
+    def _add_event_abi_to_state(self, declarable_contract: DeclarableContract):
         self.cheatable_state.update_event_selector_to_name_map(
-            # pylint: disable=protected-access
-            event_manager._selector_to_name
+            declarable_contract.event_selector_to_name_map
         )
-        # pylint: disable=protected-access
-        for event_name in event_manager._selector_to_name.values():
-            self.cheatable_state.event_name_to_contract_abi_map[event_name] = abi
+        for event_name in declarable_contract.event_selector_to_name_map.values():
+            self.cheatable_state.event_name_to_contract_abi_map[
+                event_name
+            ] = declarable_contract.abi
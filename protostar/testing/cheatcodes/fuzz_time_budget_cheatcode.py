@@ -0,0 +1,27 @@
+from typing import Callable
+
+from protostar.starknet import Cheatcode, CheatcodeException
+from protostar.testing.test_config import TestConfig
+
+
+class FuzzTimeBudgetCheatcode(Cheatcode):
+    def __init__(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        test_config: TestConfig,
+    ):
+        super().__init__(syscall_dependencies)
+        self.test_config = test_config
+
+    @property
+    def name(self) -> str:
+        return "fuzz_time_budget"
+
+    def build(self) -> Callable[[float], None]:
+        return self.fuzz_time_budget
+
+    def fuzz_time_budget(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise CheatcodeException(self, "Fuzz time budget must be greater than 0.")
+
+        self.test_config.fuzz_time_budget = seconds
@@ -26,6 +26,12 @@ class CommonTestCheatcodeFactory(CheatcodeFactory):
     def __init__(self, state: TestExecutionState):
         self._state = state
 
+    def bind_state(self, state: TestExecutionState) -> None:
+        """
+        Makes cheatcodes and hint locals built from now on operate on the given state.
+        """
+        self._state = state
+
     def build_cheatcodes(
         self,
         syscall_dependencies: Cheatcode.SyscallDependencies,
@@ -1,18 +1,24 @@
 import asyncio
-import dataclasses
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from hypothesis import example, given, seed, settings
-from hypothesis.database import ExampleDatabase, InMemoryExampleDatabase
+from hypothesis import example, given, seed, settings, target
+from hypothesis.database import (
+    DirectoryBasedExampleDatabase,
+    ExampleDatabase,
+    InMemoryExampleDatabase,
+)
 from hypothesis.errors import InvalidArgument
 from hypothesis.reporting import with_reporter
 from hypothesis.strategies import SearchStrategy
 
 from protostar.cairo.cairo_function_executor import OffsetOrName
+from protostar.starknet.data_transformer import PythonData
 from protostar.starknet import BreakingReportedException, ReportedException
 from protostar.protostar_exception import ProtostarException
 from protostar.starknet.abi import get_function_parameters
+from protostar.starknet.cheatable_execute_entry_point import CheatableExecuteEntryPoint
 from protostar.starknet.cheatcode import Cheatcode
 from protostar.testing.cheatcodes import AssumeCheatcode, RejectCheatcode
 from protostar.testing.environments.contract_based_test_execution_environment import (
@@ -21,6 +27,9 @@ from protostar.testing.environments.contract_based_test_execution_environment im
 )
 from protostar.testing.environments.execution_environment import TestExecutionResult
 from protostar.testing.fuzzing.exceptions import FuzzingError, HypothesisRejectException
+from protostar.testing.fuzzing.failed_examples_exception_metadata import (
+    FailedExamplesExceptionMetadata,
+)
 from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
@@ -29,6 +38,18 @@ from protostar.testing.fuzzing.hypothesis.reporter import (
     HYPOTHESIS_VERBOSITY,
     protostar_reporter,
 )
+from protostar.testing.fuzzing.fuzz_stats import (
+    FuzzPhase,
+    FuzzStats,
+    FuzzStatsRecorder,
+)
+from protostar.testing.fuzzing.fuzz_stats_exception_metadata import (
+    FuzzStatsExceptionMetadata,
+)
+from protostar.testing.fuzzing.fuzz_time_budget import (
+    FuzzTimeBudget,
+    FuzzTimeBudgetExhausted,
+)
 from protostar.testing.fuzzing.hypothesis.runs_counter import RunsCounter
 from protostar.testing.fuzzing.strategy_collector import collect_search_strategies
 from protostar.testing.starkware.execution_resources_summary import (
@@ -42,6 +63,7 @@ from protostar.testing.starkware.contract_based_test_execution_state import (
 @dataclass
 class FuzzTestExecutionResult(TestExecutionResult):
     fuzz_runs_count: int
+    fuzz_stats: FuzzStats
 
 
 class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
@@ -51,6 +73,11 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             raise ProtostarException("Fuzz tests cannot be profiled")
         self.initial_state = state
         self.given_strategies: dict[str, SearchStrategy] = {}
+        self._cheatcode_factory = FuzzTestCaseCheatcodeFactory(
+            state=state,
+            expect_revert_context=self._expect_revert_context,
+            finish_hook=self._finish_hook,
+        )
 
     async def execute(
         self, function_identifier: OffsetOrName
@@ -66,8 +93,19 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
 
         execution_resources: List[ExecutionResourcesSummary] = []
 
-        database = InMemoryExampleDatabase()
-        runs_counter = RunsCounter(budget=self.state.config.fuzz_max_examples)
+        database: ExampleDatabase = (
+            DirectoryBasedExampleDatabase(
+                str(self.state.config.fuzz_examples_database_path)
+            )
+            if self.state.config.fuzz_examples_database_path
+            else InMemoryExampleDatabase()
+        )
+        time_budget = FuzzTimeBudget(seconds=self.state.config.fuzz_time_budget)
+        runs_counter = RunsCounter(
+            budget=self.state.config.fuzz_shard.get_max_examples(
+                self.state.config.fuzz_max_examples
+            )
+        )
 
         if (
             not self.state.config.fuzz_examples
@@ -78,7 +116,9 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                 "Please use one of the following cheatcodes in the case setup function in order to "
                 "explicitly provide test data: \n- example\n- given"
             )
+        fuzz_stats_recorder = FuzzStatsRecorder()
 
+        self.set_cheatcodes(self._cheatcode_factory)
         self.given_strategies = collect_search_strategies(
             declared_strategies=self.state.config.fuzz_declared_strategies,
             parameters=parameters,
@@ -90,12 +130,15 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
         #   we invoke Hypothesis code in new thread.
 
         def test_thread():
-            with with_reporter(protostar_reporter):
+            with with_reporter(protostar_reporter), fuzz_stats_recorder.run():
+                time_budget.start()
                 self.build_and_run_test(
                     function_name=function_identifier,
                     database=database,
                     execution_resources=execution_resources,
                     runs_counter=runs_counter,
+                    fuzz_stats_recorder=fuzz_stats_recorder,
+                    time_budget=time_budget,
                 )
 
         try:
@@ -106,40 +149,53 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             escape_err.error.metadata.append(
                 FuzzInputExceptionMetadata(escape_err.inputs)
             )
+            escape_err.error.metadata.append(
+                FuzzStatsExceptionMetadata(fuzz_stats_recorder.build())
+            )
             raise escape_err.error
 
         return FuzzTestExecutionResult(
             execution_resources=ExecutionResourcesSummary.sum(execution_resources),
             fuzz_runs_count=runs_counter.count,
+            fuzz_stats=fuzz_stats_recorder.build(),
         )
 
     def fork_state_for_test(self):
         """
-        Some parts of execution state **must** be shared between fuzz test runs,
-        so as kinda hack, we fork the state and then bring back old, shared, objects selectively.
+        Each fuzz test run works on a layer over the initial Starknet state, which is dropped after the run,
+        so runs don't pay for copying the whole state. The output recorder is shared between runs.
         """
 
-        self.state = dataclasses.replace(
-            self.initial_state.fork(),
-            output_recorder=self.initial_state.output_recorder,
-        )
+        self.state = self.initial_state.fork_layer()
 
     def set_cheatcodes_for_test(self):
+        self._cheatcode_factory.bind_state(self.state)
+
+    @contextmanager
+    def collect_visited_edges(self) -> Iterator[Optional[set]]:
         """
-        Cheatcodes and hint locals have to be built on each fuzz test run to avoid sharing a state.
+        Collects control flow edges taken by contracts, when the coverage-guided fuzzing is enabled.
         """
+        if not self.state.config.fuzz_coverage_guided:
+            yield None
+            return
 
-        self.set_cheatcodes(
-            FuzzTestCaseCheatcodeFactory(
-                state=self.state,
-                expect_revert_context=self._expect_revert_context,
-                finish_hook=self._finish_hook,
-            )
-        )
+        CheatableExecuteEntryPoint.visited_edges = set()
+        try:
+            yield CheatableExecuteEntryPoint.visited_edges
+        finally:
+            CheatableExecuteEntryPoint.visited_edges = None
+
+    @property
+    def examples(self) -> list[PythonData]:
+        # Explicit examples are run only by the first shard of a sharded fuzz test case.
+        if self.state.config.fuzz_shard.index > 0:
+            return []
+        return self.state.config.fuzz_examples
 
     def decorate_with_examples(self, target_func: Callable) -> Callable:
         func = target_func
-        for ex in reversed(self.state.config.fuzz_examples):
+        for ex in reversed(self.examples):
             func = example(**ex)(func)
         return func
 
@@ -150,48 +206,109 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
         func = given(**self.given_strategies)(func)
         return func
 
+    def run_examples(self, test: Callable[..., None]):
+        """
+        Runs the share of examples of a parameterized test case. Each example is run,
+        even if a previous one failed, so all failing examples are reported.
+        """
+        rows_to_examples = [
+            (example_index + 1, ex)
+            for example_index, ex in enumerate(self.state.config.fuzz_examples)
+            if self.state.config.fuzz_shard.owns_example(example_index)
+        ]
+        failures: List[Tuple[int, HypothesisFailureSmugglingError]] = []
+        for row, ex in rows_to_examples:
+            try:
+                test(**ex)
+            except HypothesisFailureSmugglingError as failure:
+                failures.append((row, failure))
+
+        if failures:
+            first_failure = failures[0][1]
+            first_failure.error.metadata.append(
+                FailedExamplesExceptionMetadata(
+                    failed_examples=tuple(
+                        (row, failure.inputs) for row, failure in failures
+                    ),
+                    examples_count=len(self.state.config.fuzz_examples),
+                )
+            )
+            raise first_failure
+
     def build_and_run_test(
         self,
         function_name: str,
         database: ExampleDatabase,
         execution_resources: List[ExecutionResourcesSummary],
         runs_counter: RunsCounter,
+        fuzz_stats_recorder: FuzzStatsRecorder,
+        time_budget: FuzzTimeBudget,
     ):
         try:
+            max_examples = runs_counter.available_runs
+            if max_examples == 0:
+                # A shard can get no share of the examples budget, when there are more shards than examples.
+                if self.given_strategies:
+                    return
+                # Explicit examples don't count against the budget, but Hypothesis rejects a zero budget.
+                max_examples = 1
+
             settings_instance = settings(
                 database=database,
                 deadline=None,
-                max_examples=runs_counter.available_runs,
+                max_examples=max_examples,
                 print_blob=False,
                 report_multiple_bugs=False,
                 verbosity=HYPOTHESIS_VERBOSITY,
             )
 
-            @self.decorate_with_examples
-            @seed(self.state.config.seed)
-            @settings_instance
-            @self.decorate_with_given
-            async def test(**inputs: Any):
-                self.fork_state_for_test()
-                self.set_cheatcodes_for_test()
+            async def run_example(**inputs: Any):
+                # The time budget bounds only generating examples, explicit examples are always run.
+                # Once a failure is found, Hypothesis is let to shrink it regardless of the time.
+                if (
+                    self.given_strategies
+                    and inputs not in self.examples
+                    and not fuzz_stats_recorder.has_failure
+                ):
+                    time_budget.check()
+
+                with fuzz_stats_recorder.phase(FuzzPhase.FORK):
+                    self.fork_state_for_test()
+                with fuzz_stats_recorder.phase(FuzzPhase.CHEATCODES_SETUP):
+                    self.set_cheatcodes_for_test()
 
                 run_no = next(runs_counter)
                 with self.state.output_recorder.redirect(("test", run_no)):
                     with with_reporter(protostar_reporter):
                         try:
-                            this_run_resources = await self.execute_test_case(
-                                function_name, **inputs
-                            )
+                            with fuzz_stats_recorder.phase(
+                                FuzzPhase.EXECUTION
+                            ), self.collect_visited_edges() as visited_edges:
+                                this_run_resources = await self.execute_test_case(
+                                    function_name, **inputs
+                                )
+                            if visited_edges is not None and self.given_strategies:
+                                # Hypothesis favors inputs close to those, which reached more code.
+                                target(len(visited_edges), label="visited edges")
                             if this_run_resources is not None:
                                 execution_resources.append(this_run_resources)
                         except HypothesisRejectException as reject_ex:
                             raise reject_ex.unsatisfied_assumption_exc
                         except ReportedException as reported_ex:
+                            fuzz_stats_recorder.mark_failure()
                             raise HypothesisFailureSmugglingError(
                                 error=reported_ex,
                                 inputs=inputs,
                             ) from reported_ex
 
+            @self.decorate_with_examples
+            @seed(self.state.config.fuzz_shard.derive_seed(self.state.config.seed))
+            @settings_instance
+            @self.decorate_with_given
+            async def test(**inputs: Any):
+                with fuzz_stats_recorder.example():
+                    await run_example(**inputs)
+
             if hasattr(
                 test, "hypothesis"
             ):  # this checks only if "given" cheatcode is used
@@ -202,9 +319,10 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                 #   because the @given decorator provides all of them behind the scenes.
                 test()
             elif self.state.config.fuzz_examples:
-                test = wrap_in_sync(test)
-                for ex in reversed(self.state.config.fuzz_examples):
-                    test(**ex)
+                self.run_examples(wrap_in_sync(test))
+
+        except FuzzTimeBudgetExhausted:
+            pass
 
         except InvalidArgument as ex:
             # This exception is sometimes raised by Hypothesis during runtime when user messes up
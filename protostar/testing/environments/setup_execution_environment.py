@@ -1,7 +1,11 @@
 from typing import List
 
 from protostar.starknet.cheatcode import Cheatcode
-from protostar.testing.cheatcodes import MaxExamplesCheatcode
+from protostar.testing.cheatcodes import (
+    CoverageGuidedFuzzingCheatcode,
+    FuzzTimeBudgetCheatcode,
+    MaxExamplesCheatcode,
+)
 from protostar.cairo.cairo_function_executor import OffsetOrName
 from .common_test_cheatcode_factory import CommonTestCheatcodeFactory
 from .contract_based_test_execution_environment import (
@@ -28,4 +32,6 @@ class SetupCheatcodeFactory(CommonTestCheatcodeFactory):
         return [
             *super().build_cheatcodes(syscall_dependencies),
             MaxExamplesCheatcode(syscall_dependencies, self._state.config),
+            CoverageGuidedFuzzingCheatcode(syscall_dependencies, self._state.config),
+            FuzzTimeBudgetCheatcode(syscall_dependencies, self._state.config),
         ]
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from typing_extensions import Self
+
+from protostar.starknet import ExceptionMetadata
+
+
+@dataclass(frozen=True)
+class FailedExamplesExceptionMetadata(ExceptionMetadata):
+    """
+    Lists all failing rows of a parameterized test case. Rows are numbered from 1,
+    in the order of `example` cheatcode calls.
+    """
+
+    failed_examples: Tuple[Tuple[int, Dict[str, Any]], ...]
+    examples_count: int
+
+    @classmethod
+    def merge(cls, metadata: List[Self]) -> Self:
+        """
+        Merges failing rows found by shards of a parameterized test case, which share the rows.
+        """
+        return cls(
+            failed_examples=tuple(
+                sorted(
+                    (
+                        failed_example
+                        for item in metadata
+                        for failed_example in item.failed_examples
+                    ),
+                    key=lambda failed_example: failed_example[0],
+                )
+            ),
+            examples_count=max(item.examples_count for item in metadata),
+        )
+
+    @property
+    def name(self) -> str:
+        return "failed examples"
+
+    def format(self) -> str:
+        lines = [
+            f"#{row}: " + ", ".join(f"{k} = {v!r}" for k, v in inputs.items())
+            for row, inputs in self.failed_examples
+        ]
+        lines.append(
+            f"{len(self.failed_examples)} of {self.examples_count} examples failed"
+        )
+        return "\n".join(lines)
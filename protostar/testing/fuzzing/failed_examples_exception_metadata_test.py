@@ -0,0 +1,33 @@
+from .failed_examples_exception_metadata import FailedExamplesExceptionMetadata
+
+
+def test_display():
+    metadata = FailedExamplesExceptionMetadata(
+        failed_examples=((3, {"a": 1, "b": "abc"}), (5, {"a": 0, "b": ""})),
+        examples_count=6,
+    )
+    assert (
+        metadata.format()
+        == """\
+#3: a = 1, b = 'abc'
+#5: a = 0, b = ''
+2 of 6 examples failed\
+"""
+    )
+
+
+def test_merging_failed_examples_of_shards():
+    metadata = FailedExamplesExceptionMetadata.merge(
+        [
+            FailedExamplesExceptionMetadata(
+                failed_examples=((4, {"a": 6}),), examples_count=4
+            ),
+            FailedExamplesExceptionMetadata(
+                failed_examples=((2, {"a": 5}),), examples_count=4
+            ),
+        ]
+    )
+
+    assert metadata == FailedExamplesExceptionMetadata(
+        failed_examples=((2, {"a": 5}), (4, {"a": 6})), examples_count=4
+    )
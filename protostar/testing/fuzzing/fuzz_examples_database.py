@@ -0,0 +1,39 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from protostar.self.cache_io import CacheIO
+from protostar.starknet.abi import AbiType, find_abi_item
+
+
+class FuzzExamplesDatabase:
+    """
+    Locations of persistent databases of examples found by Hypothesis, one per fuzz test case.
+    Hypothesis replays stored examples, e.g. shrunk inputs of the last failure, before generating new ones,
+    so rerunning a failed fuzz test case doesn't repeat the search and shrinking.
+    A database is bound to the path of the test suite, the name and parameters of the test case.
+    """
+
+    _CACHE_NAMESPACE = "fuzzing"
+
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+        self._cache_io: Optional[CacheIO] = None
+
+    def get_path(self, test_path: Path, test_fn_name: str, abi: AbiType) -> Path:
+        signature = json.dumps(
+            find_abi_item(abi, test_fn_name)["inputs"], sort_keys=True
+        )
+        test_case_id = hashlib.sha256(
+            f"{test_path.resolve()}::{test_fn_name}::{signature}".encode("utf-8")
+        ).hexdigest()
+        cache_directory_path = self._get_cache_io().get_directory_path(
+            self._CACHE_NAMESPACE
+        )
+        return cache_directory_path / test_case_id
+
+    def _get_cache_io(self) -> CacheIO:
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+        return self._cache_io
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from protostar.starknet.abi import AbiType
+
+from .fuzz_examples_database import FuzzExamplesDatabase
+
+
+def build_abi(parameter_type: str) -> AbiType:
+    return [
+        {
+            "name": "test_fuzz",
+            "type": "function",
+            "inputs": [{"name": "a", "type": parameter_type}],
+            "outputs": [],
+        }
+    ]
+
+
+def test_database_path_depends_on_test_case_signature(tmp_path: Path):
+    fuzz_examples_database = FuzzExamplesDatabase(tmp_path)
+    test_path = tmp_path / "test_fuzz.cairo"
+
+    path = fuzz_examples_database.get_path(test_path, "test_fuzz", build_abi("felt"))
+
+    assert path.parent == tmp_path / ".protostar_cache" / "fuzzing"
+    assert path == fuzz_examples_database.get_path(
+        test_path, "test_fuzz", build_abi("felt")
+    )
+    assert path != fuzz_examples_database.get_path(
+        test_path, "test_fuzz", build_abi("Uint256")
+    )
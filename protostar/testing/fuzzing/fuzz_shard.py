@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from protostar.testing.testing_seed import Seed
+
+
+@dataclass(frozen=True)
+class FuzzShard:
+    """
+    Share of examples of a fuzz test case, when the test case is run by `count` workers at once.
+    Each shard explores its own part of the examples budget with a seed derived from the testing seed.
+    """
+
+    index: int = 0
+    count: int = 1
+
+    @property
+    def is_sharded(self) -> bool:
+        return self.count > 1
+
+    def get_max_examples(self, max_examples: int) -> int:
+        return max_examples // self.count + (
+            1 if self.index < max_examples % self.count else 0
+        )
+
+    def owns_example(self, example_index: int) -> bool:
+        return example_index % self.count == self.index
+
+    def derive_seed(self, seed: Seed) -> Seed:
+        # The first shard keeps the testing seed, so it starts from the same examples
+        # as the test case run without sharding.
+        return (seed + self.index * 0x9E3779B9) % 2**32
@@ -0,0 +1,31 @@
+from .fuzz_shard import FuzzShard
+
+
+def test_max_examples_are_split_between_shards():
+    shards = [FuzzShard(index=index, count=3) for index in range(3)]
+
+    assert [shard.get_max_examples(100) for shard in shards] == [34, 33, 33]
+
+
+def test_only_first_shard_keeps_seed():
+    shards = [FuzzShard(index=index, count=3) for index in range(3)]
+
+    seeds = [shard.derive_seed(42) for shard in shards]
+
+    assert seeds[0] == 42
+    assert len(set(seeds)) == 3
+
+
+def test_examples_are_split_between_shards():
+    shards = [FuzzShard(index=index, count=3) for index in range(3)]
+
+    assert [
+        [index for index in range(7) if shard.owns_example(index)]
+        for shard in shards
+    ] == [[0, 3, 6], [1, 4], [2, 5]]
+
+
+def test_trailing_shards_get_no_examples_when_shards_outnumber_them():
+    shards = [FuzzShard(index=index, count=8) for index in range(8)]
+
+    assert [shard.get_max_examples(5) for shard in shards] == [1, 1, 1, 1, 1, 0, 0, 0]
@@ -0,0 +1,188 @@
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class FuzzPhase(Enum):
+    FORK = "fork"
+    CHEATCODES_SETUP = "cheatcodes_setup"
+    EXECUTION = "execution"
+
+
+@dataclass(frozen=True)
+class FuzzStats:
+    """
+    Shows where the time of a fuzz test case went. Times are in seconds.
+    Examples run while Hypothesis shrinks a failure count only towards `shrink_time`.
+    `generation_time` is the time spent by Hypothesis between examples, before the first failure.
+    """
+
+    total_time: float
+    example_times: Tuple[float, ...]
+    generation_time: float
+    phase_times: Dict[FuzzPhase, float]
+    shrink_time: float
+
+    @property
+    def examples_per_second(self) -> float:
+        if self.total_time <= 0:
+            return 0.0
+        return len(self.example_times) / self.total_time
+
+    def get_example_time_percentile(self, percentile: float) -> float:
+        if not self.example_times:
+            return 0.0
+        sorted_example_times = sorted(self.example_times)
+        rank = math.ceil(percentile / 100 * len(sorted_example_times))
+        return sorted_example_times[max(0, rank - 1)]
+
+    def get_example_time_histogram(self) -> Dict[str, int]:
+        """
+        Counts examples in buckets of wall time, which bounds grow by powers of two milliseconds.
+        """
+        bucket_to_count: Dict[int, int] = {}
+        for example_time in self.example_times:
+            bucket = max(0, math.ceil(math.log2(max(example_time * 1000, 1))))
+            bucket_to_count[bucket] = bucket_to_count.get(bucket, 0) + 1
+        return {
+            f"<={2**bucket}ms": bucket_to_count[bucket]
+            for bucket in sorted(bucket_to_count)
+        }
+
+    def format(self) -> str:
+        items = [
+            f"examples/s={self.examples_per_second:.1f}",
+            f"example_time_p50={self.get_example_time_percentile(50) * 1000:.2f}ms",
+            f"example_time_p90={self.get_example_time_percentile(90) * 1000:.2f}ms",
+            f"example_time_max={self.get_example_time_percentile(100) * 1000:.2f}ms",
+            f"generation={self.generation_time:.2f}s",
+            *(
+                f"{phase.value}={phase_time:.2f}s"
+                for phase, phase_time in self.phase_times.items()
+            ),
+        ]
+        if self.shrink_time:
+            items.append(f"shrink={self.shrink_time:.2f}s")
+        return ", ".join(items)
+
+    def to_dict(self) -> dict:
+        return {
+            "examples_per_second": round(self.examples_per_second, 2),
+            "example_time_in_seconds": {
+                "p50": self.get_example_time_percentile(50),
+                "p90": self.get_example_time_percentile(90),
+                "max": self.get_example_time_percentile(100),
+            },
+            "example_time_histogram": self.get_example_time_histogram(),
+            "time_in_seconds": {
+                "total": self.total_time,
+                "generation": self.generation_time,
+                **{
+                    phase.value: phase_time
+                    for phase, phase_time in self.phase_times.items()
+                },
+                "shrink": self.shrink_time,
+            },
+        }
+
+    @classmethod
+    def sum(cls, fuzz_stats: Iterable["FuzzStats"]) -> Optional["FuzzStats"]:
+        """
+        Sums stats of shards of a fuzz test case. Shards run at the same time, so the total time
+        is the time of the slowest shard.
+        """
+        fuzz_stats_list = list(fuzz_stats)
+        if not fuzz_stats_list:
+            return None
+        return cls(
+            total_time=max(stats.total_time for stats in fuzz_stats_list),
+            example_times=tuple(
+                example_time
+                for stats in fuzz_stats_list
+                for example_time in stats.example_times
+            ),
+            generation_time=sum(stats.generation_time for stats in fuzz_stats_list),
+            phase_times={
+                phase: sum(
+                    stats.phase_times.get(phase, 0.0) for stats in fuzz_stats_list
+                )
+                for phase in FuzzPhase
+            },
+            shrink_time=sum(stats.shrink_time for stats in fuzz_stats_list),
+        )
+
+
+@dataclass
+class FuzzStatsRecorder:
+    """
+    Measures a fuzz test case run. It is used from a single thread, running Hypothesis.
+    """
+
+    example_times: List[float] = field(default_factory=list)
+    phase_times: Dict[FuzzPhase, float] = field(
+        default_factory=lambda: {phase: 0.0 for phase in FuzzPhase}
+    )
+    _start_time: Optional[float] = None
+    _end_time: Optional[float] = None
+    _first_failure_time: Optional[float] = None
+
+    @property
+    def has_failure(self) -> bool:
+        return self._first_failure_time is not None
+
+    def _is_before_first_failure(self, time_point: float) -> bool:
+        return self._first_failure_time is None or time_point < self._first_failure_time
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        self._start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._end_time = time.perf_counter()
+
+    @contextmanager
+    def example(self) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._is_before_first_failure(start_time):
+                self.example_times.append(time.perf_counter() - start_time)
+
+    @contextmanager
+    def phase(self, phase: FuzzPhase) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._is_before_first_failure(start_time):
+                self.phase_times[phase] += time.perf_counter() - start_time
+
+    def mark_failure(self) -> None:
+        if self._first_failure_time is None:
+            self._first_failure_time = time.perf_counter()
+
+    def build(self) -> FuzzStats:
+        assert self._start_time is not None, "The run hasn't been measured."
+        end_time = (
+            self._end_time if self._end_time is not None else time.perf_counter()
+        )
+        shrink_start_time = (
+            self._first_failure_time
+            if self._first_failure_time is not None
+            else end_time
+        )
+        return FuzzStats(
+            total_time=end_time - self._start_time,
+            example_times=tuple(self.example_times),
+            generation_time=max(
+                0.0,
+                shrink_start_time - self._start_time - sum(self.example_times),
+            ),
+            phase_times=dict(self.phase_times),
+            shrink_time=end_time - shrink_start_time,
+        )
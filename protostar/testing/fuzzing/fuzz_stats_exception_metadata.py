@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from protostar.starknet import ExceptionMetadata
+from protostar.testing.fuzzing.fuzz_stats import FuzzStats
+
+
+@dataclass(frozen=True)
+class FuzzStatsExceptionMetadata(ExceptionMetadata):
+    fuzz_stats: FuzzStats
+
+    @property
+    def name(self) -> str:
+        return "fuzz stats"
+
+    def format(self) -> str:
+        return self.fuzz_stats.format()
@@ -0,0 +1,59 @@
+from .fuzz_stats import FuzzPhase, FuzzStats, FuzzStatsRecorder
+
+
+def create_fuzz_stats(example_times: list[float], total_time: float) -> FuzzStats:
+    return FuzzStats(
+        total_time=total_time,
+        example_times=tuple(example_times),
+        generation_time=0.5,
+        phase_times={phase: 0.1 for phase in FuzzPhase},
+        shrink_time=0.0,
+    )
+
+
+def test_example_time_percentiles():
+    fuzz_stats = create_fuzz_stats([0.004, 0.001, 0.003, 0.002], total_time=1.0)
+
+    assert fuzz_stats.get_example_time_percentile(50) == 0.002
+    assert fuzz_stats.get_example_time_percentile(100) == 0.004
+    assert fuzz_stats.examples_per_second == 4.0
+
+
+def test_example_time_histogram():
+    fuzz_stats = create_fuzz_stats([0.0005, 0.001, 0.003, 0.0035], total_time=1.0)
+
+    assert fuzz_stats.get_example_time_histogram() == {"<=1ms": 2, "<=4ms": 2}
+
+
+def test_summing_stats_of_shards():
+    summed_fuzz_stats = FuzzStats.sum(
+        [
+            create_fuzz_stats([0.001, 0.002], total_time=1.0),
+            create_fuzz_stats([0.003], total_time=2.0),
+        ]
+    )
+
+    assert summed_fuzz_stats is not None
+    assert summed_fuzz_stats.total_time == 2.0
+    assert summed_fuzz_stats.example_times == (0.001, 0.002, 0.003)
+    assert summed_fuzz_stats.generation_time == 1.0
+    assert summed_fuzz_stats.phase_times[FuzzPhase.FORK] == 0.2
+
+
+def test_examples_after_first_failure_count_towards_shrinking():
+    recorder = FuzzStatsRecorder()
+
+    with recorder.run():
+        with recorder.example():
+            with recorder.phase(FuzzPhase.EXECUTION):
+                pass
+        with recorder.example():
+            recorder.mark_failure()
+        with recorder.example():
+            with recorder.phase(FuzzPhase.EXECUTION):
+                pass
+
+    fuzz_stats = recorder.build()
+
+    assert len(fuzz_stats.example_times) == 2
+    assert fuzz_stats.shrink_time > 0
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+
+class FuzzTimeBudgetExhausted(BaseException):
+    """
+    Stops Hypothesis, which doesn't treat exceptions other than `Exception` as test failures.
+    """
+
+
+@dataclass
+class FuzzTimeBudget:
+    """
+    Bounds the time of generating new examples, once started.
+    The examples budget still applies, so fuzzing stops after `max_examples` examples or when the time runs out,
+    whichever comes first. Examples are generated from the seed in the same order, so a run cut short
+    by the time budget runs a prefix of examples of the run without it.
+    """
+
+    seconds: Optional[float]
+    _deadline: Optional[float] = None
+
+    def start(self) -> None:
+        if self.seconds is not None:
+            self._deadline = perf_counter() + self.seconds
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self._deadline is not None and perf_counter() >= self._deadline
+
+    def check(self) -> None:
+        if self.is_exhausted:
+            raise FuzzTimeBudgetExhausted()
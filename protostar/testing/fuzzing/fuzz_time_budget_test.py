@@ -0,0 +1,35 @@
+import pytest
+
+from . import fuzz_time_budget
+from .fuzz_time_budget import FuzzTimeBudget, FuzzTimeBudgetExhausted
+
+
+def test_unbounded_budget_is_never_exhausted():
+    time_budget = FuzzTimeBudget(seconds=None)
+
+    time_budget.start()
+
+    time_budget.check()
+
+
+def test_exhausted_budget_stops_fuzzing():
+    time_budget = FuzzTimeBudget(seconds=0)
+
+    time_budget.start()
+
+    with pytest.raises(FuzzTimeBudgetExhausted):
+        time_budget.check()
+
+
+def test_budget_is_exhausted_once_deadline_passes(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(fuzz_time_budget, "perf_counter", lambda: now[0])
+    time_budget = FuzzTimeBudget(seconds=2)
+
+    time_budget.start()
+    now[0] = 101.9
+    time_budget.check()
+    now[0] = 102.0
+
+    with pytest.raises(FuzzTimeBudgetExhausted):
+        time_budget.check()
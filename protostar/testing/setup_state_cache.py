@@ -0,0 +1,209 @@
+import hashlib
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+from starkware.starknet.public.abi import AbiType
+from starkware.starknet.testing.contract import StarknetContract
+
+from protostar.compiler import ProjectCompiler
+from protostar.compiler.project_compiler import CompiledContractKey
+from protostar.self.cache_io import CacheIO
+from protostar.starknet import CompilationCacheKey, StarknetCompiler
+from protostar.starknet.forkable_starknet import ForkableStarknet
+
+from .starkware.contract_based_test_execution_state import (
+    ContractBasedTestExecutionState,
+)
+from .stopwatch import Stopwatch
+from .test_config import TestConfig
+from .test_context import TestContext
+from .test_output_recorder import OutputRecorder
+from .test_suite import TestSuite
+
+SetupStateCacheKey = str
+SetupStateDependencies = Dict[CompiledContractKey, Optional[CompilationCacheKey]]
+
+
+def build_setup_state_dependencies(
+    project_compiler: ProjectCompiler,
+) -> SetupStateDependencies:
+    """
+    Returns compilation keys of all contracts compiled by the project compiler, e.g. during a setup.
+    """
+    return {
+        compiled_contract_key: project_compiler.build_compilation_cache_key(
+            compiled_contract_key
+        )
+        for compiled_contract_key in project_compiler.get_compiled_contract_keys()
+    }
+
+
+def are_setup_state_dependencies_up_to_date(
+    dependencies: SetupStateDependencies, project_compiler: ProjectCompiler
+) -> bool:
+    return all(
+        compilation_key is not None
+        and project_compiler.build_compilation_cache_key(compiled_contract_key)
+        == compilation_key
+        for compiled_contract_key, compilation_key in dependencies.items()
+    )
+
+
+@dataclass
+class _SetupStateSnapshot:
+    starknet: ForkableStarknet
+    stopwatch: Stopwatch
+    output_recorder: OutputRecorder
+    context: TestContext
+    config: TestConfig
+    contract_address: int
+    contract_abi: AbiType
+    contract_deploy_call_info: Any
+
+
+@dataclass
+class _SetupStateCacheEntry:
+    key: SetupStateCacheKey
+    dependencies: SetupStateDependencies
+    snapshot: _SetupStateSnapshot
+
+
+class SetupStateCache:
+    """
+    Persistent cache of execution states of test suites after running `__setup__`, enabled with
+    `--cache-setup-states`.
+
+    An entry is valid as long as contents of the test suite, contents of all contracts compiled
+    during the setup, the configuration file, the seed and the testing configuration are the same.
+    Setup hooks depending on anything else, e.g. files read directly or environment variables,
+    can't be cached, as changes of such inputs don't invalidate entries.
+    Each test suite keeps only its latest entry.
+    """
+
+    _CACHE_NAMESPACE = "setup_states"
+    _FORMAT_VERSION = "2"
+
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+        self._cache_io: Optional[CacheIO] = None
+
+    def build_key(
+        self,
+        test_suite: TestSuite,
+        tests_compiler: StarknetCompiler,
+        project_compiler: ProjectCompiler,
+        test_config: TestConfig,
+        disable_hint_validation_in_user_contracts: bool,
+    ) -> Optional[SetupStateCacheKey]:
+        test_suite_key = tests_compiler.build_cache_key(
+            test_suite.test_path, add_debug_info=True
+        )
+        if test_suite_key is None:
+            return None
+
+        configuration_file_path = project_compiler.configuration_file.get_filepath()
+        digest = hashlib.sha256()
+        for part in [
+            self._FORMAT_VERSION,
+            cairo_lang_version,
+            test_suite_key,
+            str(test_suite.setup_fn_name),
+            str(test_config.seed),
+            str(test_config.max_steps),
+            str(test_config.profiling),
+            str(test_config.gas_estimation_enabled),
+            str(disable_hint_validation_in_user_contracts),
+            configuration_file_path.read_text("utf-8")
+            if configuration_file_path.exists()
+            else "",
+        ]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def read(
+        self,
+        key: SetupStateCacheKey,
+        test_suite: TestSuite,
+        project_compiler: ProjectCompiler,
+    ) -> Optional[Tuple[ContractBasedTestExecutionState, SetupStateDependencies]]:
+        """
+        Returns the stored state together with keys of contracts compiled during the setup.
+        """
+        try:
+            serialized = self._get_cache_io().read_bytes(
+                self._get_entry_name(test_suite)
+            )
+            if serialized is None:
+                return None
+            entry = pickle.loads(serialized)
+            if not isinstance(entry, _SetupStateCacheEntry) or entry.key != key:
+                return None
+            if not are_setup_state_dependencies_up_to_date(
+                entry.dependencies, project_compiler
+            ):
+                return None
+        # A corrupted or outdated entry must never break testing, the setup is run again instead.
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        snapshot = entry.snapshot
+        execution_state = ContractBasedTestExecutionState(
+            contract=StarknetContract(
+                state=snapshot.starknet.cheatable_state,
+                abi=snapshot.contract_abi,
+                contract_address=snapshot.contract_address,
+                deploy_call_info=snapshot.contract_deploy_call_info,
+            ),
+            starknet=snapshot.starknet,
+            stopwatch=snapshot.stopwatch,
+            output_recorder=snapshot.output_recorder,
+            context=snapshot.context,
+            config=snapshot.config,
+            project_compiler=project_compiler,
+        )
+        return execution_state, entry.dependencies
+
+    def write(
+        self,
+        key: SetupStateCacheKey,
+        test_suite: TestSuite,
+        execution_state: ContractBasedTestExecutionState,
+        dependencies: SetupStateDependencies,
+    ) -> None:
+        entry = _SetupStateCacheEntry(
+            key=key,
+            dependencies=dependencies,
+            snapshot=_SetupStateSnapshot(
+                starknet=execution_state.starknet,
+                stopwatch=execution_state.stopwatch,
+                output_recorder=execution_state.output_recorder,
+                context=execution_state.context,
+                config=execution_state.config,
+                contract_address=execution_state.contract.contract_address,
+                contract_abi=execution_state.contract.abi,
+                contract_deploy_call_info=execution_state.contract.deploy_call_info,
+            ),
+        )
+        try:
+            serialized = pickle.dumps(entry)
+        # Setup hooks can store arbitrary objects in the context, some of them can't be serialized.
+        except Exception:  # pylint: disable=broad-except
+            return
+        self._get_cache_io().write_bytes(self._get_entry_name(test_suite), serialized)
+
+    def _get_cache_io(self) -> CacheIO:
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+        return self._cache_io
+
+    def _get_entry_name(self, test_suite: TestSuite) -> str:
+        test_suite_id = hashlib.sha256(
+            f"{test_suite.test_path.resolve()}::{test_suite.setup_fn_name}".encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        return f"{self._CACHE_NAMESPACE}/{test_suite_id}"
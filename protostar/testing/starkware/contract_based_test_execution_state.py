@@ -1,4 +1,5 @@
 import dataclasses
+from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -24,6 +25,21 @@ class ContractBasedTestExecutionState(TestExecutionState):
             contract=super_instance.starknet.copy_and_adapt_contract(self.contract),
         )
 
+    def fork_layer(self) -> Self:
+        """
+        Lightweight fork for running a test case many times from the same state.
+        Changes made to Starknet are recorded in a layer over the Starknet of this state,
+        so this state must not be modified while the fork is in use.
+        The output recorder, the stopwatch and the config are shared with this state.
+        """
+        starknet = self.starknet.fork_layer()
+        return dataclasses.replace(
+            self,
+            context=deepcopy(self.context),
+            starknet=starknet,
+            contract=starknet.rebind_contract(self.contract),
+        )
+
     @classmethod
     async def from_test_suite_definition(
         cls,
@@ -8,6 +8,9 @@ from protostar.testing.environments.fuzz_test_execution_environment import (
 from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
+from protostar.testing.fuzzing.fuzz_stats_exception_metadata import (
+    FuzzStatsExceptionMetadata,
+)
 from protostar.testing.test_results import (
     BrokenFuzzTestCaseResult,
     BrokenTestCaseResult,
@@ -44,7 +47,10 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         )
         return PassedFuzzTestCaseResult.from_passed_test_case_result(
             passed_test_case_result,
-            fuzz_result=FuzzResult(fuzz_runs_count=execution_result.fuzz_runs_count),
+            fuzz_result=FuzzResult(
+                fuzz_runs_count=execution_result.fuzz_runs_count,
+                fuzz_stats=execution_result.fuzz_stats,
+            ),
         )
 
     def _map_reported_exception_to_failed_test_result(
@@ -84,6 +90,12 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         if fuzz_input:
             fuzz_runs_count = reported_exception.execution_info["fuzz_runs"]
             assert isinstance(fuzz_runs_count, int)
-            return FuzzResult(fuzz_runs_count=fuzz_runs_count)
+            fuzz_stats = reported_exception.get_metadata_by_type(
+                FuzzStatsExceptionMetadata
+            )
+            return FuzzResult(
+                fuzz_runs_count=fuzz_runs_count,
+                fuzz_stats=fuzz_stats.fuzz_stats if fuzz_stats else None,
+            )
 
         return None
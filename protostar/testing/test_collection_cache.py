@@ -0,0 +1,53 @@
+import hashlib
+from pathlib import Path
+from typing import Callable, Optional
+
+from protostar.self.cache_io import CacheIO
+
+TestSuiteKeyBuilder = Callable[[Path], Optional[str]]
+
+
+class TestCollectionCache:
+    """
+    Persistent index of collected test suites.
+
+    Each test suite has a single entry, which stores what the collector extracted from the test suite
+    together with a key built from contents of the test suite and its dependencies.
+    The entry is used only as long as the key doesn't change, so unchanged test suites are not parsed again.
+    """
+
+    _CACHE_NAMESPACE = "test_collection"
+
+    def __init__(self, project_root_path: Path, build_key: TestSuiteKeyBuilder):
+        self._project_root_path = project_root_path
+        self._build_key = build_key
+        self._cache_io: Optional[CacheIO] = None
+
+    def build_key(self, test_suite_path: Path) -> Optional[str]:
+        try:
+            return self._build_key(test_suite_path)
+        # Failing to build a key disables caching, while the collector reports the actual problem.
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def read(self, test_suite_path: Path, key: str) -> Optional[dict]:
+        entry = self._get_cache_io().read(self._get_entry_name(test_suite_path))
+        if entry is None or entry.get("key") != key:
+            return None
+        return entry.get("value")
+
+    def write(self, test_suite_path: Path, key: str, value: dict) -> None:
+        self._get_cache_io().write(
+            self._get_entry_name(test_suite_path), {"key": key, "value": value}
+        )
+
+    def _get_cache_io(self) -> CacheIO:
+        if self._cache_io is None:
+            self._cache_io = CacheIO(self._project_root_path)
+        return self._cache_io
+
+    def _get_entry_name(self, test_suite_path: Path) -> str:
+        test_suite_id = hashlib.sha256(
+            str(test_suite_path.resolve()).encode("utf-8")
+        ).hexdigest()
+        return f"{self._CACHE_NAMESPACE}/{test_suite_id}"
@@ -1,19 +1,26 @@
+import dataclasses
+import multiprocessing
+import pickle
 import re
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import partial
 from fnmatch import fnmatch
 from glob import glob
 from pathlib import Path
 from time import time
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Protocol
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Protocol, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     LocationError,
     PreprocessorError,
 )
+from starkware.starknet.public.abi import AbiType
 
 from protostar.cairo.cairo_exceptions import CairoBindingException
+from protostar.protostar_exception import ProtostarException
 
+from .test_collection_cache import TestCollectionCache
 from .test_results import BrokenTestSuiteResult
 from .test_suite import TestCase, TestSuite
 
@@ -75,11 +82,38 @@ def fnmatch_any(name: str, pats: Iterable[str]) -> bool:
 TestSuiteInfoDict = Dict[TestSuitePath, TestSuiteInfo]
 
 
-class FunctionNameGetter(Protocol):
-    def __call__(self, file_path: Path) -> List[str]:
+@dataclass(frozen=True)
+class SuiteFunctions:
+    function_names: List[str]
+    parameterized_function_names: List[str] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_functions_abi(cls, functions_abi: AbiType) -> "SuiteFunctions":
+        return cls(
+            function_names=[el["name"] for el in functions_abi],
+            parameterized_function_names=[
+                el["name"] for el in functions_abi if el["inputs"]
+            ],
+        )
+
+
+class SuiteFunctionsGetter(Protocol):
+    def __call__(self, file_path: Path) -> SuiteFunctions:
+        ...
+
+
+class SuiteFunctionsAbiGetter(Protocol):
+    def __call__(self, file_path: Path) -> AbiType:
         ...
 
 
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def get_suite_functions_from_abi(
+    get_suite_functions_abi: SuiteFunctionsAbiGetter, file_path: Path
+) -> SuiteFunctions:
+    return SuiteFunctions.from_functions_abi(get_suite_functions_abi(file_path))
+
+
 class TestCollector:
     class Result:
         def __init__(
@@ -102,9 +136,19 @@ class TestCollector:
 
     def __init__(
         self,
-        get_suite_function_names: FunctionNameGetter,
+        get_suite_functions: SuiteFunctionsGetter,
+        processes_count: int = 1,
+        test_collection_cache: Optional[TestCollectionCache] = None,
     ) -> None:
-        self._get_suite_function_names = get_suite_function_names
+        """
+        With `processes_count` greater than 1, test suites are collected in a process pool,
+        so the collector, including `get_suite_functions`, must be picklable.
+        With `test_collection_cache`, functions of test suites unchanged since the previous collection
+        are read from the cache instead of being extracted by `get_suite_functions`.
+        """
+        self._get_suite_functions = get_suite_functions
+        self._processes_count = processes_count
+        self._test_collection_cache = test_collection_cache
 
     supported_test_suite_filename_patterns = [
         re.compile(r"^test_.*\.cairo"),
@@ -248,42 +292,66 @@ class TestCollector:
         self,
         test_suite_info_dict: TestSuiteInfoDict,
     ) -> Tuple[List[TestSuite], List[BrokenTestSuiteResult]]:
-        test_suites: List[TestSuite] = []
-        broken_test_suites: List[BrokenTestSuiteResult] = []
-
-        for test_suite_info in test_suite_info_dict.values():
-            try:
-                test_suites.append(
-                    self._build_test_suite_from_test_suite_info(
-                        test_suite_info,
-                    )
-                )
-            except (PreprocessorError, LocationError, CairoBindingException) as err:
-                broken_test_suites.append(
-                    BrokenTestSuiteResult(
-                        file_path=test_suite_info.path,
-                        test_case_names=[],
-                        exception=err,
-                    )
+        test_suite_infos = sorted(
+            test_suite_info_dict.values(),
+            key=lambda test_suite_info: str(test_suite_info.path),
+        )
+        processes_count = min(self._processes_count, len(test_suite_infos))
+        if processes_count > 1:
+            with multiprocessing.Pool(processes=processes_count) as pool:
+                results = pool.map(
+                    partial(_build_test_suite_in_worker, self),
+                    test_suite_infos,
+                    chunksize=1,
                 )
+        else:
+            results = [
+                self._build_test_suite_or_broken_result(test_suite_info)
+                for test_suite_info in test_suite_infos
+            ]
 
+        test_suites: List[TestSuite] = []
+        broken_test_suites: List[BrokenTestSuiteResult] = []
+        for result in results:
+            if isinstance(result, BrokenTestSuiteResult):
+                broken_test_suites.append(result)
+            else:
+                test_suites.append(result)
         return test_suites, broken_test_suites
 
+    def _build_test_suite_or_broken_result(
+        self,
+        test_suite_info: TestSuiteInfo,
+    ) -> Union[TestSuite, BrokenTestSuiteResult]:
+        try:
+            return self._build_test_suite_from_test_suite_info(test_suite_info)
+        except (PreprocessorError, LocationError, CairoBindingException) as err:
+            return BrokenTestSuiteResult(
+                file_path=test_suite_info.path,
+                test_case_names=[],
+                exception=err,
+            )
+
     def _build_test_suite_from_test_suite_info(
         self,
         test_suite_info: TestSuiteInfo,
     ) -> TestSuite:
-        function_names = self._get_suite_function_names(test_suite_info.path)
-        setup_fn_name = self._collect_setup_hook_name(function_names)
+        suite_functions = self._get_cached_suite_functions(test_suite_info.path)
+        setup_fn_name = self._collect_setup_hook_name(suite_functions.function_names)
 
         test_cases = list(
             test_suite_info.filter_test_cases(
                 self._collect_test_cases(
-                    function_names=function_names,
+                    function_names=suite_functions.function_names,
                     test_path=test_suite_info.path,
                 )
             )
         )
+        parameterized_function_names = set(suite_functions.parameterized_function_names)
+        for test_case in test_cases:
+            test_case.has_parameters = (
+                test_case.test_fn_name in parameterized_function_names
+            )
 
         return TestSuite(
             test_path=test_suite_info.path,
@@ -291,6 +359,52 @@ class TestCollector:
             setup_fn_name=setup_fn_name,
         )
 
+    def _get_cached_suite_functions(self, test_suite_path: Path) -> SuiteFunctions:
+        if self._test_collection_cache is None:
+            return self._get_suite_functions(test_suite_path)
+
+        key = self._test_collection_cache.build_key(test_suite_path)
+        if key is None:
+            return self._get_suite_functions(test_suite_path)
+
+        entry = self._test_collection_cache.read(test_suite_path, key)
+        if entry is not None and self._restore_collection_cache_entry(
+            test_suite_path, entry
+        ):
+            return SuiteFunctions(
+                function_names=entry["function_names"],
+                parameterized_function_names=entry["parameterized_function_names"],
+            )
+
+        suite_functions = self._get_suite_functions(test_suite_path)
+        self._test_collection_cache.write(
+            test_suite_path,
+            key,
+            self._build_collection_cache_entry(test_suite_path, suite_functions),
+        )
+        return suite_functions
+
+    def _build_collection_cache_entry(
+        self, test_suite_path: Path, suite_functions: SuiteFunctions
+    ) -> dict:
+        # pylint: disable=unused-argument
+        return {
+            "function_names": suite_functions.function_names,
+            "parameterized_function_names": suite_functions.parameterized_function_names,
+        }
+
+    def _restore_collection_cache_entry(
+        self, test_suite_path: Path, entry: dict
+    ) -> bool:
+        """
+        Restores side outputs of collecting the test suite from the cache entry.
+        Returns `False` if the entry is incomplete and the test suite has to be collected again.
+        """
+        # pylint: disable=unused-argument
+        return isinstance(entry.get("function_names"), list) and isinstance(
+            entry.get("parameterized_function_names"), list
+        )
+
     def _collect_test_cases(
         self,
         function_names: List[str],
@@ -323,3 +437,20 @@ class TestCollector:
         if function_names.count(hook_name) == 1:
             return hook_name
         return None
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _build_test_suite_in_worker(
+    test_collector: TestCollector, test_suite_info: TestSuiteInfo
+) -> Union[TestSuite, BrokenTestSuiteResult]:
+    # pylint: disable=protected-access
+    result = test_collector._build_test_suite_or_broken_result(test_suite_info)
+    if isinstance(result, BrokenTestSuiteResult):
+        try:
+            pickle.loads(pickle.dumps(result.exception))
+        except Exception:  # pylint: disable=broad-except
+            # Some compiler errors can't be sent back to the main process, their messages can.
+            return dataclasses.replace(
+                result, exception=ProtostarException(str(result.exception))
+            )
+    return result
@@ -8,7 +8,8 @@ from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
 )
 
-from .test_collector import TestCollector, FunctionNameGetter
+from .test_collection_cache import TestCollectionCache
+from .test_collector import SuiteFunctions, SuiteFunctionsGetter, TestCollector
 from .test_suite import TestCase, TestSuite
 
 
@@ -57,13 +58,13 @@ def test_suites_fixture(project_root: Path):
     (tmp_foo_path / "foo.cairo").touch()
 
 
-FunctionNameGetterFixture = FunctionNameGetter
+FunctionNameGetterFixture = SuiteFunctionsGetter
 
 
 @pytest.fixture(name="function_name_getter")
-def function_name_getter_fixture() -> FunctionNameGetter:
+def function_name_getter_fixture() -> SuiteFunctionsGetter:
     def get_function_names(file_path: Path):
-        return ["test_case_a", "test_case_b", "run"]
+        return SuiteFunctions(["test_case_a", "test_case_b", "run"])
 
     return get_function_names
 
@@ -95,7 +96,7 @@ def test_collecting_tests_from_target(
 
 
 def test_returning_broken_test_suites(project_root: Path):
-    def get_function_names(file_path: Path) -> List[str]:
+    def get_function_names(file_path: Path) -> SuiteFunctions:
         raise PreprocessorError("")
 
     test_collector = TestCollector(get_function_names)
@@ -128,8 +129,8 @@ def test_collecting_specific_function(
 
 
 def test_finding_setup_function(project_root: Path):
-    def get_function_names(file_path: Path) -> List[str]:
-        return ["test_main", "__setup__"]
+    def get_function_names(file_path: Path) -> SuiteFunctions:
+        return SuiteFunctions(["test_main", "__setup__"])
 
     test_collector = TestCollector(get_function_names)
 
@@ -141,8 +142,8 @@ def test_finding_setup_function(project_root: Path):
 
 
 def test_finding_setup_case_function(project_root: Path):
-    def get_function_names(file_path: Path) -> List[str]:
-        return ["test_main", "setup_main", "setup_dangling"]
+    def get_function_names(file_path: Path) -> SuiteFunctions:
+        return SuiteFunctions(["test_main", "setup_main", "setup_dangling"])
 
     test_collector = TestCollector(get_function_names)
 
@@ -296,3 +297,86 @@ def test_testing_all_test_cases_despite_one_of_points_to_specific_test_case(
 
     assert_tested_suites(result.test_suites, ["test_foo.cairo"])
     assert result.test_cases_count == 2
+
+
+def get_function_names_or_fail_for_bar(file_path: Path) -> SuiteFunctions:
+    if file_path.name == "bar_test.cairo":
+        raise PreprocessorError("")
+    return SuiteFunctions(["test_case_a", "test_case_b", "run"])
+
+
+def test_collecting_in_process_pool(project_root: Path):
+    test_collector = TestCollector(
+        get_function_names_or_fail_for_bar, processes_count=2
+    )
+
+    result = test_collector.collect(targets=[str(project_root)])
+
+    assert [test_suite.test_path for test_suite in result.test_suites] == sorted(
+        [
+            project_root / "baz" / "foo" / "test_foo.cairo",
+            project_root / "foo" / "test_foo.cairo",
+        ],
+        key=str,
+    )
+    assert [
+        broken_test_suite.file_path for broken_test_suite in result.broken_test_suites
+    ] == [project_root / "bar" / "bar_test.cairo"]
+
+
+def test_collecting_unchanged_test_suites_from_cache(project_root: Path):
+    test_collection_cache = TestCollectionCache(
+        project_root, build_key=lambda file_path: file_path.read_text("utf-8")
+    )
+    TestCollector(
+        lambda file_path: SuiteFunctions(["test_case_a", "__setup__"]),
+        test_collection_cache=test_collection_cache,
+    ).collect(targets=[str(project_root)])
+    (project_root / "foo" / "test_foo.cairo").write_text("changed", "utf-8")
+
+    result = TestCollector(
+        lambda file_path: SuiteFunctions(["test_case_b"]),
+        test_collection_cache=test_collection_cache,
+    ).collect(targets=[str(project_root)])
+
+    assert {
+        (
+            test_suite.test_path.relative_to(project_root).as_posix(),
+            test_case.test_fn_name,
+            test_suite.setup_fn_name,
+        )
+        for test_suite in result.test_suites
+        for test_case in test_suite.test_cases
+    } == {
+        ("bar/bar_test.cairo", "test_case_a", "__setup__"),
+        ("baz/foo/test_foo.cairo", "test_case_a", "__setup__"),
+        ("foo/test_foo.cairo", "test_case_b", None),
+    }
+
+
+def test_marking_test_cases_with_parameters(project_root: Path):
+    test_collection_cache = TestCollectionCache(
+        project_root, build_key=lambda file_path: file_path.read_text("utf-8")
+    )
+    test_path = project_root / "foo" / "test_foo.cairo"
+
+    def get_suite_functions(file_path: Path) -> SuiteFunctions:
+        return SuiteFunctions(
+            ["test_fuzz", "test_plain", "setup_fuzz"],
+            parameterized_function_names=["test_fuzz", "setup_fuzz"],
+        )
+
+    def get_suite_functions_or_fail(file_path: Path) -> SuiteFunctions:
+        raise PreprocessorError("")
+
+    for get_functions in [get_suite_functions, get_suite_functions_or_fail]:
+        [suite] = (
+            TestCollector(get_functions, test_collection_cache=test_collection_cache)
+            .collect([str(test_path)])
+            .test_suites
+        )
+
+        assert {
+            test_case.test_fn_name: test_case.has_parameters
+            for test_case in suite.test_cases
+        } == {"test_fuzz": True, "test_plain": False}
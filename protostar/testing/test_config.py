@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Optional
 
 from starkware.starknet.testing.contract import StarknetContract
@@ -9,6 +10,7 @@ from protostar.protostar_exception import ProtostarException
 from protostar.starknet.abi import has_function_parameters
 from protostar.starknet.data_transformer import PythonData
 
+from .fuzzing.fuzz_shard import FuzzShard
 from .fuzzing.strategy_descriptor import StrategyDescriptor
 from .test_suite import TestCase
 from .testing_seed import Seed, random_seed
@@ -99,6 +101,10 @@ class TestConfig:
         default_factory=dict
     )
     fuzz_examples: list[PythonData] = field(default_factory=list)
+    fuzz_shard: FuzzShard = field(default_factory=FuzzShard)
+    fuzz_examples_database_path: Optional[Path] = None
+    fuzz_coverage_guided: bool = False
+    fuzz_time_budget: Optional[float] = None
 
     def convert_mode_to(self, to_mode: TestMode):
         self.mode = self.mode.convert_to(to_mode)
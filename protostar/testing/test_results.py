@@ -1,9 +1,13 @@
+import dataclasses
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, cast
 
 from typing_extensions import Self
 
+from .fuzzing.failed_examples_exception_metadata import FailedExamplesExceptionMetadata
+from .fuzzing.fuzz_shard import FuzzShard
+from .fuzzing.fuzz_stats import FuzzStats
 from .starkware.execution_resources_summary import ExecutionResourcesSummary
 from .test_environment_exceptions import ReportedException
 from .test_output_recorder import OutputName
@@ -60,6 +64,7 @@ class SkippedTestCaseResult(TimedTestCaseResult, AcceptableResult):
 @dataclass(frozen=True)
 class FuzzResult:
     fuzz_runs_count: Optional[int]
+    fuzz_stats: Optional[FuzzStats]
 
 
 @dataclass(frozen=True)
@@ -75,6 +80,7 @@ class PassedFuzzTestCaseResult(PassedTestCaseResult, FuzzResult):
             execution_resources=passed_test_case_result.execution_resources,
             execution_time=passed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_result.fuzz_runs_count,
+            fuzz_stats=fuzz_result.fuzz_stats,
         )
 
 
@@ -87,6 +93,7 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_stats = fuzz_result.fuzz_stats if fuzz_result else None
 
         return cls(
             file_path=failed_test_case_result.file_path,
@@ -95,6 +102,7 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
             exception=failed_test_case_result.exception,
             execution_time=failed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_stats=fuzz_stats,
         )
 
 
@@ -107,6 +115,7 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_stats = fuzz_result.fuzz_stats if fuzz_result else None
 
         return cls(
             file_path=broken_test_case_result.file_path,
@@ -115,6 +124,128 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
             exception=broken_test_case_result.exception,
             execution_time=broken_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_stats=fuzz_stats,
+        )
+
+
+@dataclass(frozen=True)
+class FuzzShardResult(TestResult):
+    """
+    Result of a share of examples of a fuzz test case, run by one of the workers
+    the test case is sharded across. Only the first shard reports test cases,
+    which turn out not to be fuzz test cases. Other shards send `None` instead.
+    """
+
+    test_case_name: str
+    fuzz_shard: FuzzShard
+    test_case_result: Optional[TestCaseResult]
+
+    @property
+    def is_acceptable(self) -> bool:
+        return self.test_case_result is None or isinstance(
+            self.test_case_result, AcceptableResult
+        )
+
+    @property
+    def failed_examples(self) -> Optional[FailedExamplesExceptionMetadata]:
+        """
+        Failing rows of the share of a parameterized test case, if the shard failed.
+        """
+        if not isinstance(self.test_case_result, FailedTestCaseResult):
+            return None
+        return self.test_case_result.exception.get_metadata_by_type(
+            FailedExamplesExceptionMetadata
+        )
+
+    @staticmethod
+    def merge(shard_results: List["FuzzShardResult"]) -> TestCaseResult:
+        """
+        Merges results of all shards of a test case into a result of the whole test case.
+        Results have to be acceptable, unless they list failing rows of a parameterized test case.
+        """
+        sorted_shard_results = sorted(
+            shard_results, key=lambda shard_result: shard_result.fuzz_shard.index
+        )
+        failed_examples = [
+            shard_result.failed_examples
+            for shard_result in sorted_shard_results
+            if shard_result.failed_examples is not None
+        ]
+        if failed_examples:
+            return FuzzShardResult._merge_failed_examples(
+                sorted_shard_results, failed_examples
+            )
+
+        test_case_results = [
+            shard_result.test_case_result
+            for shard_result in sorted_shard_results
+            if shard_result.test_case_result is not None
+        ]
+        assert test_case_results, "The first shard must report the test case."
+        if len(test_case_results) == 1 or not all(
+            isinstance(test_case_result, PassedFuzzTestCaseResult)
+            for test_case_result in test_case_results
+        ):
+            return test_case_results[0]
+
+        passed_results = cast(List[PassedFuzzTestCaseResult], test_case_results)
+        captured_stdout: Dict[OutputName, str] = {}
+        runs_offset = 0
+        for shard_no, passed_result in enumerate(passed_results):
+            for name, output in passed_result.captured_stdout.items():
+                # Runs are renumbered, so outputs of different shards don't overwrite each other.
+                if isinstance(name, tuple):
+                    captured_stdout[(name[0], name[1] + runs_offset)] = output
+                elif shard_no == 0:
+                    captured_stdout[name] = output
+            runs_offset += passed_result.fuzz_runs_count or 0
+
+        return dataclasses.replace(
+            passed_results[0],
+            captured_stdout=captured_stdout,
+            execution_resources=ExecutionResourcesSummary.sum(
+                passed_result.execution_resources
+                for passed_result in passed_results
+                if passed_result.execution_resources is not None
+            ),
+            execution_time=max(
+                passed_result.execution_time for passed_result in passed_results
+            ),
+            fuzz_runs_count=runs_offset,
+            fuzz_stats=FuzzStats.sum(
+                passed_result.fuzz_stats
+                for passed_result in passed_results
+                if passed_result.fuzz_stats is not None
+            ),
+        )
+
+    @staticmethod
+    def _merge_failed_examples(
+        sorted_shard_results: List["FuzzShardResult"],
+        failed_examples: List[FailedExamplesExceptionMetadata],
+    ) -> TestCaseResult:
+        [first_failed_result, *_] = [
+            cast(FailedTestCaseResult, shard_result.test_case_result)
+            for shard_result in sorted_shard_results
+            if shard_result.failed_examples is not None
+        ]
+        # The exception was received from a worker, so it's not shared with other results.
+        exception = first_failed_result.exception
+        exception.metadata = [
+            FailedExamplesExceptionMetadata.merge(failed_examples)
+            if isinstance(metadata, FailedExamplesExceptionMetadata)
+            else metadata
+            for metadata in exception.metadata
+        ]
+        if not isinstance(first_failed_result, FuzzResult):
+            return first_failed_result
+        return dataclasses.replace(
+            first_failed_result,
+            fuzz_runs_count=sum(
+                shard_result.test_case_result.fuzz_runs_count or 0
+                for shard_result in sorted_shard_results
+                if isinstance(shard_result.test_case_result, FuzzResult)
+            ),
         )
 
 
@@ -1,13 +1,16 @@
 import asyncio
+import dataclasses
 import traceback
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from logging import getLogger
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Tuple
 
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.cairo.hint_code_cache import install_hint_code_cache
 from protostar.compiler import (
     ProjectCairoPathBuilder,
     ProjectCompiler,
@@ -17,22 +20,37 @@ from protostar.configuration_file.configuration_file_factory import (
     ConfigurationFileFactory,
 )
 from protostar.protostar_exception import ProtostarException
+from protostar.starknet.abi import has_function_parameters
 from protostar.starknet.pass_managers import TestSuitePassMangerFactory
-from protostar.starknet import StarknetCompiler, StarknetCompilerConfig
+from protostar.starknet import (
+    CompilationCache,
+    CompilationCacheKey,
+    StarknetCompiler,
+    StarknetCompilerConfig,
+)
 
 from .environments.setup_execution_environment import SetupExecutionEnvironment
+from .fuzzing.fuzz_examples_database import FuzzExamplesDatabase
+from .fuzzing.fuzz_shard import FuzzShard
 from .starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
+from .setup_state_cache import (
+    SetupStateCache,
+    SetupStateDependencies,
+    are_setup_state_dependencies_up_to_date,
+    build_setup_state_dependencies,
+)
 from .test_case_runners.setup_case_runner import run_setup_case
 from .test_case_runners.test_case_runner_factory import TestCaseRunnerFactory
-from .test_config import TestConfig
+from .test_config import TestConfig, TestMode
 from .test_environment_exceptions import ReportedException
 from .test_results import (
     BrokenSetupCaseResult,
     BrokenTestSuiteResult,
+    FuzzShardResult,
     SkippedSetupCaseResult,
-    TestResult,
+    TestCaseResult,
     UnexpectedBrokenTestSuiteResult,
 )
 from .test_shared_tests_state import SharedTestsState
@@ -41,9 +59,31 @@ from .testing_seed import Seed
 
 logger = getLogger()
 
+ExecutionStateCacheKey = Tuple[Path, Optional[str]]
+
+
+@dataclass
+class _CachedExecutionState:
+    test_suite_key: CompilationCacheKey
+    dependencies: SetupStateDependencies
+    execution_state: ContractBasedTestExecutionState
+
 
 # pylint: disable=too-many-instance-attributes
 class TestRunner:
+    MAX_CACHED_EXECUTION_STATES: ClassVar[int] = 4
+    _cached_run_id: ClassVar[Optional[str]] = None
+    _cached_execution_states: ClassVar[
+        "OrderedDict[ExecutionStateCacheKey, _CachedExecutionState]"
+    ] = OrderedDict()
+    """
+    Post-`__setup__` execution states of recently run test suites, kept by a worker process for the duration
+    of a single test run, so chunks of the same test suite don't repeat compilation and setup.
+    Chunks of a test suite are scheduled one after another, so only a few most recently used states are kept.
+    A warm worker pool keeps them across runs that share the `run_id`, as long as compilation keys of the test
+    suite and of contracts compiled during the setup don't change.
+    """
+
     def __init__(
         self,
         shared_tests_state: SharedTestsState,
@@ -54,17 +94,37 @@ class TestRunner:
         include_paths: Optional[List[str]] = None,
         profiling: bool = False,
         gas_estimation_enabled: bool = False,
+        fuzz_shard: Optional[FuzzShard] = None,
+        fuzz_time_budget: Optional[float] = None,
+        cache_setup_states: bool = False,
     ):
+        """
+        With a `fuzz_shard`, the runner runs only its share of examples of fuzz and parameterized
+        test cases, and reports other test cases only if it is the first shard.
+        `fuzz_time_budget` applies to fuzz test cases, which don't set their own time budget.
+        With `cache_setup_states`, post-`__setup__` states are stored in and read from `SetupStateCache`.
+        """
         self._gas_estimation_enabled = gas_estimation_enabled
+        self._fuzz_shard = fuzz_shard or FuzzShard()
+        self._fuzz_time_budget = fuzz_time_budget
+        self._disable_hint_validation_in_user_contracts = (
+            disable_hint_validation_in_user_contracts
+        )
+        self._setup_state_cache = (
+            SetupStateCache(project_root_path) if cache_setup_states else None
+        )
+        self._fuzz_examples_database = FuzzExamplesDatabase(project_root_path)
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
         include_paths = include_paths or []
+        compilation_cache = CompilationCache(project_root_path)
 
         self.tests_compiler = StarknetCompiler(
             config=StarknetCompilerConfig(
                 include_paths=include_paths, disable_hint_validation=True
             ),
             pass_manager_factory=TestSuitePassMangerFactory,
+            compilation_cache=compilation_cache,
         )
         configuration_file = ConfigurationFileFactory(
             cwd=cwd, active_profile_name=active_profile_name
@@ -80,6 +140,7 @@ class TestRunner:
                 hint_validation_disabled=disable_hint_validation_in_user_contracts,
                 debugging_info_attached=profiling,
             ),
+            compilation_cache=compilation_cache,
         )
 
     @dataclass
@@ -95,31 +156,44 @@ class TestRunner:
         active_profile_name: Optional[str]
         max_steps: Optional[int]
         gas_estimation_enabled: bool
+        run_id: Optional[str] = None
+        fuzz_shard: FuzzShard = field(default_factory=FuzzShard)
+        fuzz_time_budget: Optional[float] = None
+        cache_setup_states: bool = False
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
-        asyncio.run(
-            cls(
-                shared_tests_state=args.shared_tests_state,
-                include_paths=args.include_paths,
-                project_root_path=args.project_root_path,
-                disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
-                profiling=args.profiling,
-                cwd=args.cwd,
-                active_profile_name=args.active_profile_name,
-                gas_estimation_enabled=args.gas_estimation_enabled,
-            ).run_test_suite(
-                test_suite=args.test_suite,
-                testing_seed=args.testing_seed,
-                max_steps=args.max_steps,
+        install_hint_code_cache()
+        try:
+            asyncio.run(
+                cls(
+                    shared_tests_state=args.shared_tests_state,
+                    include_paths=args.include_paths,
+                    project_root_path=args.project_root_path,
+                    disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
+                    profiling=args.profiling,
+                    cwd=args.cwd,
+                    active_profile_name=args.active_profile_name,
+                    gas_estimation_enabled=args.gas_estimation_enabled,
+                    fuzz_shard=args.fuzz_shard,
+                    fuzz_time_budget=args.fuzz_time_budget,
+                    cache_setup_states=args.cache_setup_states,
+                ).run_test_suite(
+                    test_suite=args.test_suite,
+                    testing_seed=args.testing_seed,
+                    max_steps=args.max_steps,
+                    run_id=args.run_id,
+                )
             )
-        )
+        finally:
+            args.shared_tests_state.flush()
 
     async def run_test_suite(
         self,
         test_suite: TestSuite,
         testing_seed: Seed,
         max_steps: Optional[int],
+        run_id: Optional[str] = None,
     ):
         test_config = TestConfig(
             seed=testing_seed,
@@ -129,25 +203,33 @@ class TestRunner:
         )
 
         try:
-            compiled_test = self.tests_compiler.compile_contract(
-                test_suite.test_path,
-                add_debug_info=True,
+            test_suite_key = (
+                self.tests_compiler.build_cache_key(
+                    test_suite.test_path, add_debug_info=True
+                )
+                if run_id is not None
+                else None
             )
-
-            execution_state = await self._build_execution_state(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-                test_config=test_config,
-                contract_path=test_suite.test_path,
+            execution_state = self._get_cached_execution_state(
+                test_suite, test_suite_key, run_id, testing_seed
             )
             if not execution_state:
-                return
+                built = await self._get_or_build_execution_state(
+                    test_suite=test_suite,
+                    test_config=test_config,
+                )
+                if not built:
+                    return
+                execution_state, dependencies = built
+                self._cache_execution_state(
+                    test_suite, test_suite_key, run_id, execution_state, dependencies
+                )
             await self._invoke_test_cases(
                 test_suite=test_suite,
                 execution_state=execution_state,
             )
         except ProtostarException as ex:
-            self.shared_tests_state.put_result(
+            self._put_broken_test_suite_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -156,7 +238,7 @@ class TestRunner:
             )
 
         except ReportedException as ex:
-            self.shared_tests_state.put_result(
+            self._put_broken_test_suite_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -166,7 +248,7 @@ class TestRunner:
 
         # An unexpected exception in a worker should neither crash nor freeze the whole application
         except BaseException as ex:  # pylint: disable=broad-except
-            self.shared_tests_state.put_result(
+            self._put_broken_test_suite_result(
                 UnexpectedBrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -175,6 +257,106 @@ class TestRunner:
                 )
             )
 
+    def _get_cached_execution_state(
+        self,
+        test_suite: TestSuite,
+        test_suite_key: Optional[CompilationCacheKey],
+        run_id: Optional[str],
+        testing_seed: Seed,
+    ) -> Optional[ContractBasedTestExecutionState]:
+        if run_id is None or run_id != self._cached_run_id:
+            return None
+        key = (test_suite.test_path, test_suite.setup_fn_name)
+        cached = self._cached_execution_states.get(key)
+        if cached is None:
+            return None
+        # The run ID covers only the test suite file, its imports and contracts deployed in the setup are checked here.
+        if (
+            test_suite_key is None
+            or cached.test_suite_key != test_suite_key
+            or not are_setup_state_dependencies_up_to_date(
+                cached.dependencies, self.project_compiler
+            )
+        ):
+            del self._cached_execution_states[key]
+            return None
+        self._cached_execution_states.move_to_end(key)
+        execution_state = cached.execution_state
+        # The seed is not used by setups, so a state can be reused by runs with different seeds.
+        return dataclasses.replace(
+            execution_state,
+            config=dataclasses.replace(execution_state.config, seed=testing_seed),
+        )
+
+    @classmethod
+    def _cache_execution_state(
+        cls,
+        test_suite: TestSuite,
+        test_suite_key: Optional[CompilationCacheKey],
+        run_id: Optional[str],
+        execution_state: ContractBasedTestExecutionState,
+        dependencies: SetupStateDependencies,
+    ):
+        if run_id is None or test_suite_key is None:
+            return
+        if run_id != cls._cached_run_id:
+            cls._cached_run_id = run_id
+            cls._cached_execution_states = OrderedDict()
+        cls._cached_execution_states[
+            (test_suite.test_path, test_suite.setup_fn_name)
+        ] = _CachedExecutionState(
+            test_suite_key=test_suite_key,
+            dependencies=dependencies,
+            execution_state=execution_state,
+        )
+        while len(cls._cached_execution_states) > cls.MAX_CACHED_EXECUTION_STATES:
+            cls._cached_execution_states.popitem(last=False)
+
+    async def _get_or_build_execution_state(
+        self,
+        test_suite: TestSuite,
+        test_config: TestConfig,
+    ) -> Optional[Tuple[ContractBasedTestExecutionState, SetupStateDependencies]]:
+        """
+        Returns the state together with compilation keys of contracts compiled during the setup.
+        """
+        setup_state_cache_key = (
+            self._setup_state_cache.build_key(
+                test_suite=test_suite,
+                tests_compiler=self.tests_compiler,
+                project_compiler=self.project_compiler,
+                test_config=test_config,
+                disable_hint_validation_in_user_contracts=self._disable_hint_validation_in_user_contracts,
+            )
+            if self._setup_state_cache is not None and test_suite.setup_fn_name
+            else None
+        )
+        if self._setup_state_cache is not None and setup_state_cache_key:
+            cached = self._setup_state_cache.read(
+                setup_state_cache_key, test_suite, self.project_compiler
+            )
+            if cached:
+                return cached
+
+        compiled_test = self.tests_compiler.compile_contract(
+            test_suite.test_path,
+            add_debug_info=True,
+        )
+        execution_state = await self._build_execution_state(
+            test_contract=compiled_test,
+            test_suite=test_suite,
+            test_config=test_config,
+            contract_path=test_suite.test_path,
+        )
+        if not execution_state:
+            return None
+        dependencies = build_setup_state_dependencies(self.project_compiler)
+        if self._setup_state_cache is not None and setup_state_cache_key:
+            self._setup_state_cache.write(
+                setup_state_cache_key, test_suite, execution_state, dependencies
+            )
+        return execution_state, dependencies
+
     async def _build_execution_state(
         self,
         test_contract: ContractClass,
@@ -199,7 +381,7 @@ class TestRunner:
 
             return execution_state
         except StarkException as ex:
-            self.shared_tests_state.put_result(
+            self._put_broken_test_suite_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -215,23 +397,88 @@ class TestRunner:
         execution_state: ContractBasedTestExecutionState,
     ) -> None:
         for test_case in test_suite.test_cases:
-            test_result = await self._invoke_test_case(test_case, execution_state)
-            self.shared_tests_state.put_result(test_result)
+            # Only test cases with parameters can turn out to be fuzz test cases.
+            is_sharded_test_case = self._fuzz_shard.is_sharded and (
+                has_function_parameters(
+                    execution_state.contract.abi, test_case.test_fn_name
+                )
+            )
+            if self._fuzz_shard.index > 0 and not is_sharded_test_case:
+                continue
+
+            test_case_result = await self._invoke_test_case(test_case, execution_state)
+            if is_sharded_test_case:
+                self.shared_tests_state.put_result(
+                    FuzzShardResult(
+                        file_path=test_case.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        fuzz_shard=self._fuzz_shard,
+                        test_case_result=test_case_result,
+                    )
+                )
+            elif test_case_result is not None:
+                self.shared_tests_state.put_result(test_case_result)
 
     async def _invoke_test_case(
         self, test_case: TestCase, initial_state: ContractBasedTestExecutionState
-    ) -> TestResult:
+    ) -> Optional[TestCaseResult]:
+        """
+        Returns `None` if the runner is not the first shard and the test case is neither a fuzz
+        nor a parameterized test case.
+        """
         state: ContractBasedTestExecutionState = initial_state.fork()
+        state.config.fuzz_shard = self._fuzz_shard
+        is_first_shard = self._fuzz_shard.index == 0
 
         if test_case.setup_fn_name:
             setup_case_result = await run_setup_case(test_case, state)
             if isinstance(setup_case_result, BrokenSetupCaseResult):
-                return setup_case_result.into_broken_test_case_result()
+                return (
+                    setup_case_result.into_broken_test_case_result()
+                    if is_first_shard
+                    else None
+                )
             if isinstance(setup_case_result, SkippedSetupCaseResult):
-                return setup_case_result.into_skipped_test_case_result()
+                return (
+                    setup_case_result.into_skipped_test_case_result()
+                    if is_first_shard
+                    else None
+                )
 
         state.determine_test_mode(test_case)
+        if not is_first_shard and state.config.mode not in (
+            TestMode.FUZZ,
+            TestMode.PARAMETERIZED,
+        ):
+            return None
+        if state.config.mode is TestMode.FUZZ:
+            state.config.fuzz_examples_database_path = (
+                self._fuzz_examples_database.get_path(
+                    test_path=test_case.test_path,
+                    test_fn_name=test_case.test_fn_name,
+                    abi=state.contract.abi,
+                )
+            )
+            if state.config.fuzz_time_budget is None:
+                state.config.fuzz_time_budget = self._fuzz_time_budget
 
         test_case_runner_factory = TestCaseRunnerFactory(state)
         test_case_runner = test_case_runner_factory.make(test_case)
         return await test_case_runner.run()
+
+    def _put_broken_test_suite_result(
+        self, broken_test_suite_result: BrokenTestSuiteResult
+    ) -> None:
+        if self._fuzz_shard.index == 0:
+            self.shared_tests_state.put_result(broken_test_suite_result)
+            return
+        # The first shard reports the broken test suite, other shards only mark their shares as done.
+        for test_case_name in broken_test_suite_result.test_case_names:
+            self.shared_tests_state.put_result(
+                FuzzShardResult(
+                    file_path=broken_test_suite_result.file_path,
+                    test_case_name=test_case_name,
+                    fuzz_shard=self._fuzz_shard,
+                    test_case_result=None,
+                )
+            )
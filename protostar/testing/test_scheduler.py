@@ -1,18 +1,22 @@
+import math
 import multiprocessing
 import signal
 import dataclasses
+import uuid
+from multiprocessing.pool import AsyncResult
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import Callable, List, Optional
 
+from typing_extensions import Protocol
+
+from .fuzzing.fuzz_shard import FuzzShard
 from .test_results import TestResult
 from .test_collector import TestCollector
 from .test_runner import TestRunner
 from .test_shared_tests_state import SharedTestsState
+from .test_suite import TestSuite
 from .testing_seed import Seed
 
-if TYPE_CHECKING:
-    from protostar.commands.test.testing_live_logger import TestingLiveLogger
-
 
 def make_path_relative_if_possible(test_result: TestResult, path: Path) -> TestResult:
     try:
@@ -26,10 +30,92 @@ def make_path_relative_if_possible(test_result: TestResult, path: Path) -> TestR
     return test_result
 
 
+TASKS_PER_PROCESS = 4
+"""
+How many tasks per worker process the scheduler aims for.
+More tasks balance the load better, but each task of a split suite pays for its setup separately.
+"""
+
+
+def split_test_suites_into_tasks(
+    test_suites: List[TestSuite], processes_count: int
+) -> List[TestSuite]:
+    """
+    Splits test suites into chunks of test cases, so idle workers can take over test cases of large suites.
+    Chunks of the largest suites are scheduled first to shorten the tail of the run.
+    """
+    test_cases_count = sum(len(test_suite.test_cases) for test_suite in test_suites)
+    chunk_size = max(
+        1, math.ceil(test_cases_count / (processes_count * TASKS_PER_PROCESS))
+    )
+    largest_first = sorted(
+        test_suites, key=lambda test_suite: len(test_suite.test_cases), reverse=True
+    )
+    return [
+        chunk for test_suite in largest_first for chunk in test_suite.split(chunk_size)
+    ]
+
+
+def get_fuzz_shards(test_suite: TestSuite, fuzz_shards_count: int) -> List[FuzzShard]:
+    """
+    Only tasks with parameterized test cases are sharded, other test cases run once anyway.
+    Cairo 1 test cases don't accept parameters, so Cairo 1 tasks are never sharded.
+    """
+    if not any(test_case.has_parameters for test_case in test_suite.test_cases):
+        return [FuzzShard()]
+    return [
+        FuzzShard(index=shard_index, count=fuzz_shards_count)
+        for shard_index in range(fuzz_shards_count)
+    ]
+
+
+class TestResultsConsumerProtocol(Protocol):
+    def log(
+        self,
+        shared_tests_state: SharedTestsState,
+        test_collector_result: "TestCollector.Result",
+    ) -> None:
+        ...
+
+
+class TestWorkerPool:
+    """
+    Worker processes attached to a results channel.
+    The pool can serve many test runs, e.g. when it is kept warm by the test server.
+    """
+
+    def __init__(self, processes_count: Optional[int] = None):
+        self.processes_count = processes_count or multiprocessing.cpu_count()
+        self.shared_tests_state = SharedTestsState()
+        self._pool = multiprocessing.Pool(
+            processes=self.processes_count,
+            initializer=_init_worker,
+            initargs=(self.shared_tests_state,),
+        )
+        self._terminated = False
+
+    @property
+    def terminated(self) -> bool:
+        return self._terminated
+
+    def map_async(
+        self,
+        worker: Callable[[TestRunner.WorkerArgs], None],
+        setups: List[TestRunner.WorkerArgs],
+    ) -> AsyncResult:
+        # Tasks are handed out one by one, so a worker that finished early takes the next pending task.
+        return self._pool.map_async(worker, setups, chunksize=1)
+
+    def terminate(self) -> None:
+        self._terminated = True
+        self._pool.terminate()
+        self._pool.join()
+
+
 class TestScheduler:
     def __init__(
         self,
-        live_logger: "TestingLiveLogger",
+        live_logger: TestResultsConsumerProtocol,
         worker: Callable[
             [TestRunner.WorkerArgs],
             None,
@@ -52,11 +138,32 @@ class TestScheduler:
         active_profile_name: Optional[str],
         gas_estimation_enabled: bool,
         on_exit_first: Callable[[], None],
+        worker_pool: Optional[TestWorkerPool] = None,
+        run_id: Optional[str] = None,
+        fuzz_shards_count: int = 1,
+        fuzz_time_budget: Optional[float] = None,
+        cache_setup_states: bool = False,
     ):
-        with multiprocessing.Manager() as manager:
-            shared_tests_state = SharedTestsState(
-                test_collector_result=test_collector_result, manager=manager
-            )
+        """
+        Runs tests in the given worker pool, or in a pool created for this run only.
+        Workers reuse post-setup states of test suites within a run with the same `run_id`.
+        A given pool is terminated if the run is interrupted.
+        With `fuzz_shards_count` greater than 1, each task with parameterized test cases is scheduled
+        that many times, and examples of each fuzz test case are split between the copies.
+        """
+        # A test case was broken
+        if exit_first and len(test_collector_result.broken_test_suites) > 0:
+            on_exit_first()
+            return
+
+        owns_worker_pool = worker_pool is None
+        interrupted = True
+        try:
+            if worker_pool is None:
+                worker_pool = TestWorkerPool()
+            shared_tests_state = worker_pool.shared_tests_state
+            shared_tests_state.reset(test_collector_result)
+            run_id = run_id or uuid.uuid4().hex
             setups: List[TestRunner.WorkerArgs] = [
                 TestRunner.WorkerArgs(
                     test_suite,
@@ -70,35 +177,41 @@ class TestScheduler:
                     active_profile_name=active_profile_name,
                     cwd=cwd,
                     gas_estimation_enabled=gas_estimation_enabled,
+                    run_id=run_id,
+                    fuzz_shard=fuzz_shard,
+                    fuzz_time_budget=fuzz_time_budget,
+                    cache_setup_states=cache_setup_states,
                 )
-                for test_suite in test_collector_result.test_suites
+                for test_suite in split_test_suites_into_tasks(
+                    test_collector_result.test_suites, worker_pool.processes_count
+                )
+                for fuzz_shard in get_fuzz_shards(test_suite, fuzz_shards_count)
             ]
 
-            # A test case was broken
+            results = worker_pool.map_async(self._worker, setups)
+            self._live_logger.log(
+                shared_tests_state,
+                test_collector_result,
+            )
             if exit_first and shared_tests_state.any_failed_or_broken():
-                on_exit_first()
+                worker_pool.terminate()
                 return
 
-            try:
-                with multiprocessing.Pool(
-                    processes=multiprocessing.cpu_count(),
-                    initializer=_init_worker,
-                ) as pool:
-                    results = pool.map_async(self._worker, setups)
-                    self._live_logger.log(
-                        shared_tests_state,
-                        test_collector_result,
-                    )
-                    if exit_first and shared_tests_state.any_failed_or_broken():
-                        pool.terminate()
-                        return
-
-                    results.get()
-            except KeyboardInterrupt:
-                return
+            results.get()
+            interrupted = False
+        except KeyboardInterrupt:
+            return
+        finally:
+            if (
+                worker_pool is not None
+                and not worker_pool.terminated
+                and (owns_worker_pool or interrupted)
+            ):
+                worker_pool.terminate()
 
 
 # Note: This function has to be top-level function, because it is being pickled by multiprocessing.
-def _init_worker():
+def _init_worker(shared_tests_state: SharedTestsState):
     # Prevent showing a stacktrace on CMD/CTRL+C.
     signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shared_tests_state.attach_to_worker()
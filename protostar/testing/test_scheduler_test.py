@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from .fuzzing.fuzz_shard import FuzzShard
+from .test_scheduler import get_fuzz_shards, split_test_suites_into_tasks
+from .test_suite import Cairo1TestSuite, TestCase, TestSuite
+
+
+def make_test_suite(name: str, test_cases_count: int) -> TestSuite:
+    test_path = Path(f"{name}_test.cairo")
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=f"test_{i}")
+            for i in range(test_cases_count)
+        ],
+        setup_fn_name="__setup__",
+    )
+
+
+def test_splitting_large_test_suite_into_chunks():
+    large_suite = make_test_suite("large", 30)
+    small_suite = make_test_suite("small", 2)
+
+    tasks = split_test_suites_into_tasks([small_suite, large_suite], processes_count=2)
+
+    assert [len(task.test_cases) for task in tasks] == [4, 4, 4, 4, 4, 4, 4, 2, 2]
+    assert all(task.setup_fn_name == "__setup__" for task in tasks)
+    assert [
+        test_case for task in tasks[:-1] for test_case in task.test_cases
+    ] == large_suite.test_cases
+    assert tasks[-1] is small_suite
+
+
+def test_splitting_into_single_test_cases_when_processes_outnumber_them():
+    suites = [make_test_suite("a", 3), make_test_suite("b", 3)]
+
+    tasks = split_test_suites_into_tasks(suites, processes_count=8)
+
+    assert [len(task.test_cases) for task in tasks] == [1, 1, 1, 1, 1, 1]
+
+
+def test_splitting_cairo1_test_suite_into_chunks_compiled_for_all_test_cases():
+    test_suite = make_test_suite("large", 6)
+    cairo1_test_suite = Cairo1TestSuite.from_test_suite(
+        test_suite, sierra_output="sierra"
+    )
+
+    tasks = split_test_suites_into_tasks([cairo1_test_suite], processes_count=1)
+
+    assert [len(task.test_cases) for task in tasks] == [2, 2, 2]
+    for task in tasks:
+        assert isinstance(task, Cairo1TestSuite)
+        assert task.sierra_output == "sierra"
+        assert task.compiled_test_fn_names == test_suite.collect_test_case_names()
+
+
+def test_sharding_only_tasks_with_parameterized_test_cases():
+    test_suite = make_test_suite("fuzz", 4)
+    plain_task, fuzz_task = test_suite.split(chunk_size=2)
+    fuzz_task.test_cases[0].has_parameters = True
+
+    assert get_fuzz_shards(plain_task, fuzz_shards_count=3) == [FuzzShard()]
+    assert get_fuzz_shards(fuzz_task, fuzz_shards_count=3) == [
+        FuzzShard(index=0, count=3),
+        FuzzShard(index=1, count=3),
+        FuzzShard(index=2, count=3),
+    ]
@@ -1,29 +1,224 @@
 import ctypes
-from multiprocessing.managers import SyncManager
+import multiprocessing
+import threading
+from collections import deque
+from multiprocessing.context import get_spawning_popen
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from typing_extensions import Protocol
+
+from protostar.cairo.hint_code_cache import HintCodeCacheStats, hint_code_cache
 
 from .test_collector import TestCollector
-from .test_results import AcceptableResult, TestResult
+from .test_results import AcceptableResult, FuzzShardResult, TestResult
+
+_worker_shared_tests_state: Optional["SharedTestsState"] = None
+
+
+def _get_worker_shared_tests_state() -> "SharedTestsState":
+    assert (
+        _worker_shared_tests_state is not None
+    ), "Shared tests state was not attached to the worker process."
+    return _worker_shared_tests_state
+
+
+def _restore_shared_tests_state(
+    results_queue: Any,
+    any_failed_or_broken_shared_value: Any,
+    hint_code_cache_stats_shared_array: Any,
+) -> "SharedTestsState":
+    shared_tests_state = SharedTestsState.__new__(SharedTestsState)
+    shared_tests_state._init_channel(  # pylint: disable=protected-access
+        results_queue,
+        any_failed_or_broken_shared_value,
+        hint_code_cache_stats_shared_array,
+    )
+    return shared_tests_state
+
+
+class FuzzShardResultsMerger:
+    """
+    Collects results of shards of fuzz test cases until all shards of a test case report.
+    Failing rows of a parameterized test case are merged from all shards. Other failures of a shard
+    are reported immediately, and results of remaining shards are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._pending_shard_results: Dict[Tuple[Path, str], List[FuzzShardResult]] = {}
+        self._reported_test_cases: Set[Tuple[Path, str]] = set()
+
+    def add(self, shard_result: FuzzShardResult) -> Optional[TestResult]:
+        test_case_id = (shard_result.file_path, shard_result.test_case_name)
+        if test_case_id in self._reported_test_cases:
+            return None
+
+        if not shard_result.is_acceptable and shard_result.failed_examples is None:
+            self._reported_test_cases.add(test_case_id)
+            self._pending_shard_results.pop(test_case_id, None)
+            return shard_result.test_case_result
+
+        shard_results = self._pending_shard_results.setdefault(test_case_id, [])
+        shard_results.append(shard_result)
+        if len(shard_results) < shard_result.fuzz_shard.count:
+            return None
+        self._reported_test_cases.add(test_case_id)
+        del self._pending_shard_results[test_case_id]
+        return FuzzShardResult.merge(shard_results)
+
+
+class TestResultsSourceProtocol(Protocol):
+    def get_result(self) -> TestResult:
+        ...
+
+    def any_failed_or_broken(self) -> bool:
+        ...
+
+    def get_hint_code_cache_stats(self) -> HintCodeCacheStats:
+        ...
 
 
 class SharedTestsState:
+    """
+    Channel for sending test results from worker processes to the main process.
+
+    Results are sent in batches through a pipe-backed queue, and the failure flag lives in shared memory,
+    so neither sending results nor checking the flag requires a round trip to a manager process.
+    Hint code cache counts of workers are added up in shared memory before each result is sent,
+    so they cover all results received by the main process.
+
+    The queue and the flag can only be inherited by worker processes, so the instance must be attached to
+    each worker with `attach_to_worker` (e.g. in a pool initializer). When pickled to a worker afterwards,
+    for example as a part of pool task arguments, it resolves to the attached instance.
+    Workers attached once can serve many test runs, as long as `reset` is called before each of them.
+    """
+
+    MAX_BATCH_SIZE = 64
+    MAX_BATCH_DELAY = 0.1
+    """
+    Seconds a result can wait in a batch before the batch is sent by a timer thread,
+    even if the worker is busy running the next test case.
+    """
+
     def __init__(
         self,
-        test_collector_result: "TestCollector.Result",
-        manager: SyncManager,
+        test_collector_result: Optional["TestCollector.Result"] = None,
+    ) -> None:
+        self._init_channel(
+            results_queue=multiprocessing.Queue(),
+            any_failed_or_broken_shared_value=multiprocessing.RawValue(
+                ctypes.c_bool, False
+            ),
+            hint_code_cache_stats_shared_array=multiprocessing.Array(
+                ctypes.c_longlong, 2
+            ),
+        )
+        if test_collector_result is not None:
+            self.reset(test_collector_result)
+
+    def _init_channel(
+        self,
+        results_queue: Any,
+        any_failed_or_broken_shared_value: Any,
+        hint_code_cache_stats_shared_array: Any,
     ) -> None:
-        self._shared_queue = manager.Queue()
-        self._any_failed_or_broken_shared_value = manager.Value(
-            ctypes.c_bool,
-            (len(test_collector_result.broken_test_suites) > 0),
+        self._results_queue = results_queue
+        self._any_failed_or_broken_shared_value = any_failed_or_broken_shared_value
+        self._hint_code_cache_stats_shared_array = hint_code_cache_stats_shared_array
+        self._received_results: Deque[TestResult] = deque()
+        self._fuzz_shard_results_merger = FuzzShardResultsMerger()
+        self._pending_results: List[TestResult] = []
+        self._pending_results_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def __reduce__(self):
+        if get_spawning_popen() is None:
+            return (_get_worker_shared_tests_state, ())
+        return (
+            _restore_shared_tests_state,
+            (
+                self._results_queue,
+                self._any_failed_or_broken_shared_value,
+                self._hint_code_cache_stats_shared_array,
+            ),
         )
 
+    def attach_to_worker(self) -> None:
+        global _worker_shared_tests_state  # pylint: disable=global-statement
+        _worker_shared_tests_state = self
+
+    def reset(self, test_collector_result: "TestCollector.Result") -> None:
+        self._received_results.clear()
+        self._fuzz_shard_results_merger = FuzzShardResultsMerger()
+        self._any_failed_or_broken_shared_value.value = (
+            len(test_collector_result.broken_test_suites) > 0
+        )
+        with self._hint_code_cache_stats_shared_array.get_lock():
+            self._hint_code_cache_stats_shared_array[:] = [0, 0]
+
     def get_result(self) -> TestResult:
-        return self._shared_queue.get(block=True, timeout=20000)
+        """
+        Returns the next test result. Results of shards of a fuzz test case are returned as a single result.
+        """
+        while True:
+            if not self._received_results:
+                self._received_results.extend(
+                    self._results_queue.get(block=True, timeout=20000)
+                )
+            test_result = self._received_results.popleft()
+            if not isinstance(test_result, FuzzShardResult):
+                return test_result
+            merged_test_result = self._fuzz_shard_results_merger.add(test_result)
+            if merged_test_result is not None:
+                return merged_test_result
 
     def put_result(self, item: TestResult) -> None:
-        if not isinstance(item, AcceptableResult):
+        self._add_hint_code_cache_stats(hint_code_cache.pop_stats())
+        with self._pending_results_lock:
+            self._pending_results.append(item)
+            pending_results_count = len(self._pending_results)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.MAX_BATCH_DELAY, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if not (
+            item.is_acceptable
+            if isinstance(item, FuzzShardResult)
+            else isinstance(item, AcceptableResult)
+        ):
             self._any_failed_or_broken_shared_value.value = True
-        self._shared_queue.put(item)
+            self.flush()
+        elif pending_results_count >= self.MAX_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._pending_results_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._pending_results:
+                self._results_queue.put(self._pending_results)
+                self._pending_results = []
 
     def any_failed_or_broken(self) -> bool:
         return self._any_failed_or_broken_shared_value.value
+
+    def get_hint_code_cache_stats(self) -> HintCodeCacheStats:
+        with self._hint_code_cache_stats_shared_array.get_lock():
+            compilations_count, saved_compilations_count = list(
+                self._hint_code_cache_stats_shared_array
+            )
+        return HintCodeCacheStats(
+            compilations_count=compilations_count,
+            saved_compilations_count=saved_compilations_count,
+        )
+
+    def _add_hint_code_cache_stats(self, stats: HintCodeCacheStats) -> None:
+        if stats == HintCodeCacheStats():
+            return
+        with self._hint_code_cache_stats_shared_array.get_lock():
+            self._hint_code_cache_stats_shared_array[0] += stats.compilations_count
+            self._hint_code_cache_stats_shared_array[
+                1
+            ] += stats.saved_compilations_count
@@ -0,0 +1,181 @@
+from pathlib import Path
+
+from protostar.cairo.hint_code_cache import HintCodeCacheStats, hint_code_cache
+
+from .fuzzing.failed_examples_exception_metadata import (
+    FailedExamplesExceptionMetadata,
+)
+from .fuzzing.fuzz_shard import FuzzShard
+from .test_collector import TestCollector
+from .test_environment_exceptions import ReportedException
+from .test_results import (
+    FailedFuzzTestCaseResult,
+    FailedTestCaseResult,
+    FuzzShardResult,
+    PassedFuzzTestCaseResult,
+    PassedTestCaseResult,
+)
+from .test_shared_tests_state import SharedTestsState
+
+
+def create_shared_tests_state() -> SharedTestsState:
+    return SharedTestsState(
+        test_collector_result=TestCollector.Result(test_suites=[]),
+    )
+
+
+def create_passed_result(test_case_name: str) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=Path("test_file.cairo"),
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=0.0,
+        execution_resources=None,
+    )
+
+
+def test_results_are_received_after_flush_in_order():
+    shared_tests_state = create_shared_tests_state()
+    shared_tests_state.MAX_BATCH_DELAY = 60.0
+
+    shared_tests_state.put_result(create_passed_result("test_a"))
+    shared_tests_state.put_result(create_passed_result("test_b"))
+    shared_tests_state.flush()
+
+    assert shared_tests_state.get_result().test_case_name == "test_a"
+    assert shared_tests_state.get_result().test_case_name == "test_b"
+    assert not shared_tests_state.any_failed_or_broken()
+
+
+def test_results_are_sent_after_delay_without_next_result():
+    shared_tests_state = create_shared_tests_state()
+    shared_tests_state.MAX_BATCH_DELAY = 0.01
+
+    shared_tests_state.put_result(create_passed_result("test_a"))
+
+    assert shared_tests_state.get_result().test_case_name == "test_a"
+
+
+def test_hint_code_cache_stats_are_added_up_with_results():
+    shared_tests_state = create_shared_tests_state()
+    shared_tests_state.MAX_BATCH_DELAY = 60.0
+    hint_code_cache.pop_stats()
+
+    hint_code_cache.compilations_count = 2
+    hint_code_cache.saved_compilations_count = 3
+    shared_tests_state.put_result(create_passed_result("test_a"))
+    hint_code_cache.saved_compilations_count = 5
+    shared_tests_state.put_result(create_passed_result("test_b"))
+
+    assert shared_tests_state.get_hint_code_cache_stats() == HintCodeCacheStats(
+        compilations_count=2, saved_compilations_count=8
+    )
+    shared_tests_state.flush()
+
+
+def test_failed_result_is_sent_immediately_and_sets_flag():
+    shared_tests_state = create_shared_tests_state()
+    shared_tests_state.MAX_BATCH_DELAY = 60.0
+
+    shared_tests_state.put_result(create_passed_result("test_a"))
+    shared_tests_state.put_result(
+        FailedTestCaseResult(
+            file_path=Path("test_file.cairo"),
+            test_case_name="test_b",
+            captured_stdout={},
+            execution_time=0.0,
+            exception=ReportedException(),
+        )
+    )
+
+    assert shared_tests_state.any_failed_or_broken()
+    assert shared_tests_state.get_result().test_case_name == "test_a"
+    assert shared_tests_state.get_result().test_case_name == "test_b"
+
+
+def create_fuzz_shard_result(
+    shard_index: int,
+    fuzz_runs_count: int,
+    test_case_name: str = "test_fuzz",
+    shards_count: int = 2,
+) -> FuzzShardResult:
+    return FuzzShardResult(
+        file_path=Path("test_file.cairo"),
+        test_case_name=test_case_name,
+        fuzz_shard=FuzzShard(index=shard_index, count=shards_count),
+        test_case_result=PassedFuzzTestCaseResult(
+            file_path=Path("test_file.cairo"),
+            test_case_name=test_case_name,
+            captured_stdout={("test", 1): f"shard {shard_index}"},
+            execution_time=float(shard_index),
+            execution_resources=None,
+            fuzz_runs_count=fuzz_runs_count,
+            fuzz_stats=None,
+        ),
+    )
+
+
+def test_fuzz_shard_results_are_received_merged():
+    shared_tests_state = create_shared_tests_state()
+
+    shared_tests_state.put_result(create_fuzz_shard_result(1, fuzz_runs_count=3))
+    shared_tests_state.put_result(create_passed_result("test_a"))
+    shared_tests_state.put_result(create_fuzz_shard_result(0, fuzz_runs_count=4))
+    shared_tests_state.flush()
+
+    assert shared_tests_state.get_result().test_case_name == "test_a"
+    merged_result = shared_tests_state.get_result()
+    assert isinstance(merged_result, PassedFuzzTestCaseResult)
+    assert merged_result.fuzz_runs_count == 7
+    assert merged_result.execution_time == 1.0
+    assert merged_result.captured_stdout == {
+        ("test", 1): "shard 0",
+        ("test", 5): "shard 1",
+    }
+
+
+def create_failed_rows_shard_result(
+    shard_index: int, failed_row: int
+) -> FuzzShardResult:
+    exception = ReportedException()
+    exception.metadata.append(
+        FailedExamplesExceptionMetadata(
+            failed_examples=((failed_row, {"a": failed_row}),), examples_count=4
+        )
+    )
+    return FuzzShardResult(
+        file_path=Path("test_file.cairo"),
+        test_case_name="test_rows",
+        fuzz_shard=FuzzShard(index=shard_index, count=3),
+        test_case_result=FailedFuzzTestCaseResult(
+            file_path=Path("test_file.cairo"),
+            test_case_name="test_rows",
+            captured_stdout={},
+            execution_time=0.0,
+            exception=exception,
+            fuzz_runs_count=2,
+            fuzz_stats=None,
+        ),
+    )
+
+
+def test_failing_rows_of_all_shards_are_received_merged():
+    shared_tests_state = create_shared_tests_state()
+
+    shared_tests_state.put_result(create_failed_rows_shard_result(1, failed_row=2))
+    shared_tests_state.put_result(create_failed_rows_shard_result(0, failed_row=4))
+    shared_tests_state.put_result(
+        create_fuzz_shard_result(
+            2, fuzz_runs_count=1, test_case_name="test_rows", shards_count=3
+        )
+    )
+    shared_tests_state.flush()
+
+    merged_result = shared_tests_state.get_result()
+    assert isinstance(merged_result, FailedFuzzTestCaseResult)
+    assert merged_result.fuzz_runs_count == 5
+    assert merged_result.exception.get_metadata_by_type(
+        FailedExamplesExceptionMetadata
+    ) == FailedExamplesExceptionMetadata(
+        failed_examples=((2, {"a": 2}), (4, {"a": 4})), examples_count=4
+    )
@@ -7,11 +7,16 @@ from protostar.cairo.cairo_function_executor import Offset
 
 class TestCase:
     def __init__(
-        self, test_path: Path, test_fn_name: str, setup_fn_name: Optional[str] = None
+        self,
+        test_path: Path,
+        test_fn_name: str,
+        setup_fn_name: Optional[str] = None,
+        has_parameters: bool = False,
     ):
         self.test_path = test_path
         self.test_fn_name = test_fn_name
         self.setup_fn_name = setup_fn_name
+        self.has_parameters = has_parameters
 
     def __eq__(self, other: Self) -> bool:
         return (
@@ -52,6 +57,22 @@ class TestSuite:
     def collect_test_case_names(self) -> List[str]:
         return [tc.test_fn_name for tc in self.test_cases]
 
+    def split(self, chunk_size: int) -> List["TestSuite"]:
+        """
+        Splits the suite into suites sharing the setup hook, each containing at most `chunk_size` test cases.
+        """
+        assert chunk_size > 0, "Chunk size must be positive."
+        if len(self.test_cases) <= chunk_size:
+            return [self]
+        return [
+            TestSuite(
+                test_path=self.test_path,
+                test_cases=self.test_cases[start : start + chunk_size],
+                setup_fn_name=self.setup_fn_name,
+            )
+            for start in range(0, len(self.test_cases), chunk_size)
+        ]
+
 
 class Cairo1TestSuite(TestSuite):
     def __init__(
@@ -60,10 +81,37 @@ class Cairo1TestSuite(TestSuite):
         test_cases: TestCases,
         sierra_output: str,
         setup_fn_name: Optional[str] = None,
+        compiled_test_fn_names: Optional[List[str]] = None,
     ):
+        """
+        `compiled_test_fn_names` are test functions the suite is compiled to CASM for,
+        all test cases of the suite by default.
+        """
         super().__init__(test_path, [], setup_fn_name)
         self.test_cases = test_cases
         self.sierra_output = sierra_output
+        self.compiled_test_fn_names = (
+            compiled_test_fn_names
+            if compiled_test_fn_names is not None
+            else self.collect_test_case_names()
+        )
+
+    def split(self, chunk_size: int) -> List[TestSuite]:
+        """
+        Chunks are compiled for all test cases of the suite, so they share the compiled program.
+        """
+        return [
+            chunk
+            if chunk is self
+            else Cairo1TestSuite(
+                test_path=chunk.test_path,
+                test_cases=chunk.test_cases,
+                sierra_output=self.sierra_output,
+                setup_fn_name=chunk.setup_fn_name,
+                compiled_test_fn_names=self.compiled_test_fn_names,
+            )
+            for chunk in super().split(chunk_size)
+        ]
 
     @classmethod
     def from_test_suite(cls, test_suite: TestSuite, sierra_output: str) -> Self:
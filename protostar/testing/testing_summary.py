@@ -1,7 +1,8 @@
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from protostar.cairo.hint_code_cache import HintCodeCacheStats
 from protostar.protostar_exception import ProtostarExceptionSilent
 from protostar.testing.test_collector import TestCollector
 
@@ -41,6 +42,7 @@ class TestingSummary:
         self.broken: List[BrokenTestCaseResult] = []
         self.broken_suites: List[BrokenTestSuiteResult] = []
         self.explicitly_skipped: List[SkippedTestCaseResult] = []
+        self.hint_code_cache_stats: Optional[HintCodeCacheStats] = None
         self.extend(initial_test_results)
 
     def extend(self, test_results: List[TestResult]):
@@ -0,0 +1,86 @@
+# pylint: disable=protected-access
+"""
+Compares loading CASM of Cairo 1 test suites with the current loader and with
+the `IntAsHex`-based loader it replaced.
+
+Usage: python ./scripts/benchmark_casm_loader.py [--casm-path CASM_JSON] [--words N]
+"""
+import argparse
+import json
+import random
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from starkware.starkware_utils.marshmallow_dataclass_fields import IntAsHex
+
+from protostar.cairo.cairo1_test_suite_parser import (
+    ProtostarCasm,
+    build_instruction_pc_to_hint,
+    parse_hex_words,
+)
+
+PRIME = 2**251 + 17 * 2**192 + 1
+
+
+def build_synthetic_casm_json(words_count: int) -> dict:
+    rng = random.Random(0)
+    return {
+        "prime": hex(PRIME),
+        "bytecode": [hex(rng.randrange(PRIME)) for _ in range(words_count)],
+        "hints": [
+            [pc, [f"memory[ap] = segments.add()  # {pc}"]]
+            for pc in range(0, words_count, 20)
+        ],
+        "test_entry_points": [{"name": "test_benchmark", "offset": 0}],
+    }
+
+
+def load_with_int_as_hex(casm_json: dict):
+    IntAsHex()._deserialize(casm_json["prime"], None, None)
+    [IntAsHex()._deserialize(v, None, None) for v in casm_json["bytecode"]]
+    build_instruction_pc_to_hint(casm_json)
+
+
+def load_with_parse_hex_words(casm_json: dict):
+    int(casm_json["prime"], 16)
+    parse_hex_words(casm_json["bytecode"])
+    build_instruction_pc_to_hint(casm_json)
+
+
+def measure(name: str, func: Callable[[], None], repeat: int) -> float:
+    best_time = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"{name:<28}{best_time * 1000:>10.2f}ms")
+    return best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--casm-path", type=Path, default=None)
+    parser.add_argument("--words", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    casm_json = (
+        json.loads(args.casm_path.read_text("utf-8"))
+        if args.casm_path
+        else build_synthetic_casm_json(args.words)
+    )
+    print(f"bytecode words: {len(casm_json['bytecode'])}")
+
+    int_as_hex_time = measure(
+        "IntAsHex", lambda: load_with_int_as_hex(casm_json), args.repeat
+    )
+    parse_hex_words_time = measure(
+        "parse_hex_words", lambda: load_with_parse_hex_words(casm_json), args.repeat
+    )
+    measure(
+        "ProtostarCasm.from_json",
+        lambda: ProtostarCasm.from_json(casm_json),
+        args.repeat,
+    )
+    print(f"speedup: {int_as_hex_time / parse_hex_words_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -211,8 +211,14 @@ class ProtostarFixture:
         args.profiling = False
         args.max_steps = None
         args.estimate_gas = estimate_gas
-
-        return await self._test_command.run(args)
+        args.server = False
+        args.fuzz_shards = 1
+        args.fuzz_time_budget = None
+        args.cache_setup_states = False
+
+        summary = await self._test_command.run(args)
+        assert summary is not None
+        return summary
 
     def init_sync(self, project_name: str):
         args = Namespace()
@@ -51,6 +51,10 @@ class RunTestRunnerFixture(Protocol):
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        fuzz_shards_count: int = 1,
+        fuzz_time_budget: Optional[float] = None,
+        cache_setup_states: bool = False,
+        project_root_path: Optional[Path] = None,
     ) -> TestingSummary:
         ...
 
@@ -75,6 +79,10 @@ def run_test_runner_fixture(
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        fuzz_shards_count: int = 1,
+        fuzz_time_budget: Optional[float] = None,
+        cache_setup_states: bool = False,
+        project_root_path: Optional[Path] = None,
     ) -> TestingSummary:
         protostar_directory_mock = session_mocker.MagicMock()
         protostar_directory_mock.protostar_test_only_cairo_packages_path = Path()
@@ -109,7 +117,7 @@ def run_test_runner_fixture(
         )
 
         return await TestCommand(
-            project_root_path=Path(),
+            project_root_path=project_root_path or Path(),
             protostar_directory=protostar_directory_mock,
             project_cairo_path_builder=project_cairo_path_builder,
             log_color_provider=log_color_provider,
@@ -125,6 +133,9 @@ def run_test_runner_fixture(
             disable_hint_validation=disable_hint_validation,
             cairo_path=cairo_path or [],
             messenger=messenger_factory.human(),
+            fuzz_shards_count=fuzz_shards_count,
+            fuzz_time_budget=fuzz_time_budget,
+            cache_setup_states=cache_setup_states,
         )
 
     return run_test_runner
@@ -0,0 +1,35 @@
+%lang starknet
+
+from starkware.cairo.common.math_cmp import is_le
+
+@external
+func setup_coverage_guided_pass() {
+    %{ coverage_guided_fuzzing() %}
+    %{ max_examples(10) %}
+    %{ given(a = strategy.felts()) %}
+    return ();
+}
+
+@external
+func test_coverage_guided_pass{syscall_ptr: felt*, range_check_ptr}(a) {
+    assert a * 2 = a + a;
+    return ();
+}
+
+@external
+func setup_coverage_guided_fails() {
+    %{ coverage_guided_fuzzing() %}
+    %{ max_examples(20) %}
+    %{ given(a = strategy.integers(0, 100)) %}
+    return ();
+}
+
+@external
+func test_coverage_guided_fails{syscall_ptr: felt*, range_check_ptr}(a) {
+    let is_small = is_le(a, 50);
+    if (is_small == 1) {
+        return ();
+    }
+    %{ assert ids.a < 90 %}
+    return ();
+}
@@ -1,5 +1,13 @@
+import itertools
 from pathlib import Path
+from typing import Dict, Optional
 
+import pytest
+
+from protostar.testing.fuzzing import fuzz_time_budget
+from protostar.testing.fuzzing.failed_examples_exception_metadata import (
+    FailedExamplesExceptionMetadata,
+)
 from protostar.testing.test_results import PassedFuzzTestCaseResult
 from protostar.testing.test_config import TestConfig
 from tests.integration.conftest import (
@@ -24,6 +32,72 @@ async def test_basic(run_test_runner: RunTestRunnerFixture):
     assert testing_summary.testing_seed == seed
 
 
+async def test_sharded_fuzzing(run_test_runner: RunTestRunnerFixture):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "basic_test.cairo", seed=10, fuzz_shards_count=3
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_fuzz_pass"],
+        expected_failed_test_cases_names=["test_fuzz_fails"],
+    )
+    [result] = testing_summary.passed
+    assert isinstance(result, PassedFuzzTestCaseResult)
+    assert result.fuzz_runs_count is not None
+    # Each shard runs at most 2 of 5 examples, so runs of more than one shard were merged.
+    assert 2 < result.fuzz_runs_count <= 5
+    assert result.fuzz_stats is not None
+    assert len(result.fuzz_stats.example_times) == result.fuzz_runs_count
+
+
+async def test_coverage_guided_fuzzing(run_test_runner: RunTestRunnerFixture):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "coverage_guided_test.cairo", seed=10
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_coverage_guided_pass"],
+        expected_failed_test_cases_names=["test_coverage_guided_fails"],
+    )
+
+
+async def test_time_budget(
+    run_test_runner: RunTestRunnerFixture, monkeypatch: pytest.MonkeyPatch
+):
+    # Each reading of the fake clock moves it one second forward.
+    fake_clock = itertools.count()
+    monkeypatch.setattr(fuzz_time_budget, "perf_counter", lambda: next(fake_clock))
+
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "time_budget_test.cairo", seed=10
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_time_budget",
+            "test_max_examples_before_time_budget",
+            "test_examples_with_time_budget",
+            "test_given_with_examples_and_time_budget",
+        ],
+    )
+    fuzz_runs_counts: Dict[str, Optional[int]] = {
+        result.test_case_name: result.fuzz_runs_count
+        for result in testing_summary.passed
+        if isinstance(result, PassedFuzzTestCaseResult)
+    }
+    # The budget of 3 seconds runs out at the third check, before the third generated example.
+    # Explicit examples are run without checking the budget.
+    assert fuzz_runs_counts == {
+        "test_time_budget": 2,
+        "test_max_examples_before_time_budget": 5,
+        "test_examples_with_time_budget": 3,
+        "test_given_with_examples_and_time_budget": 5,
+    }
+
+
 async def test_non_felt_parameter(run_test_runner: RunTestRunnerFixture):
     testing_summary = await run_test_runner(
         Path(__file__).parent / "non_felt_parameter_test.cairo"
@@ -46,6 +120,9 @@ async def test_state_is_isolated(run_test_runner: RunTestRunnerFixture):
         testing_summary,
         expected_passed_test_cases_names=[
             "test_storage_var",
+            "test_block_timestamp",
+            "test_mock_call",
+            "test_expect_call",
         ],
         expected_failed_test_cases_names=[],
     )
@@ -98,6 +175,22 @@ async def test_max_examples_in_setup_case(
     assert result.fuzz_runs_count <= 5
 
 
+async def test_shards_outnumbering_max_examples(
+    run_test_runner: RunTestRunnerFixture,
+):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "max_examples_in_setup_case_test.cairo",
+        seed=3,
+        fuzz_shards_count=8,
+    )
+
+    [result] = testing_summary.passed
+    assert isinstance(result, PassedFuzzTestCaseResult)
+    assert result.fuzz_runs_count is not None
+    # Only 5 of 8 shards have an example to run.
+    assert result.fuzz_runs_count <= 5
+
+
 async def test_max_examples_invalid_arguments(
     run_test_runner: RunTestRunnerFixture,
 ):
@@ -125,6 +218,58 @@ async def test_should_not_share_state(
     )
 
 
+async def test_parameterized_rows_are_run_after_failure(
+    run_test_runner: RunTestRunnerFixture,
+):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "parameterized_rows_test.cairo"
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_all_rows_pass"],
+        expected_failed_test_cases_names=["test_some_rows_fail"],
+    )
+    [failed] = testing_summary.failed
+    metadata = failed.exception.get_metadata_by_type(FailedExamplesExceptionMetadata)
+    assert metadata is not None
+    assert metadata.failed_examples == ((2, {"a": 5}), (4, {"a": 6}))
+    assert metadata.examples_count == 4
+
+
+async def test_sharded_parameterized_rows(run_test_runner: RunTestRunnerFixture):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "parameterized_rows_test.cairo",
+        fuzz_shards_count=2,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_all_rows_pass"],
+        expected_failed_test_cases_names=["test_some_rows_fail"],
+    )
+    [result] = testing_summary.passed
+    assert isinstance(result, PassedFuzzTestCaseResult)
+    # Each shard runs 2 of 4 rows.
+    assert result.fuzz_runs_count == 4
+
+
+async def test_failing_rows_of_all_shards_are_reported(
+    run_test_runner: RunTestRunnerFixture,
+):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "parameterized_rows_test.cairo",
+        fuzz_shards_count=3,
+    )
+
+    [failed] = testing_summary.failed
+    metadata = failed.exception.get_metadata_by_type(FailedExamplesExceptionMetadata)
+    assert metadata is not None
+    # Failing rows 2 and 4 are run by the second and the first shard.
+    assert metadata.failed_examples == ((2, {"a": 5}), (4, {"a": 6}))
+    assert metadata.examples_count == 4
+
+
 async def test_parameterized_with_examples_tests(
     run_test_runner: RunTestRunnerFixture,
 ):
@@ -0,0 +1,37 @@
+%lang starknet
+
+from starkware.cairo.common.math import assert_le
+
+@external
+func setup_all_rows_pass() {
+    %{
+        example(a=1)
+        example(a=2)
+        example(a=3)
+        example(a=4)
+    %}
+    return ();
+}
+
+@external
+func test_all_rows_pass{syscall_ptr: felt*, range_check_ptr}(a: felt) {
+    assert_le(a, 4);
+    return ();
+}
+
+@external
+func setup_some_rows_fail() {
+    %{
+        example(a=1)
+        example(a=5)
+        example(a=2)
+        example(a=6)
+    %}
+    return ();
+}
+
+@external
+func test_some_rows_fail{syscall_ptr: felt*, range_check_ptr}(a: felt) {
+    assert_le(a, 4);
+    return ();
+}
@@ -1,6 +1,8 @@
 %lang starknet
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math import assert_not_equal
+from starkware.starknet.common.syscalls import get_block_timestamp
 
 @storage_var
 func balance() -> (res: felt) {
@@ -23,3 +25,91 @@ func test_storage_var{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_chec
 
     return ();
 }
+
+@external
+func setup_block_timestamp() {
+    %{ max_examples(3) %}
+    %{ given(a = strategy.felts()) %}
+    return ();
+}
+
+@external
+func test_block_timestamp{syscall_ptr: felt*}(a) {
+    let (timestamp) = get_block_timestamp();
+    assert_not_equal(timestamp, 321);
+
+    %{ warp(321) %}
+
+    return ();
+}
+
+@contract_interface
+namespace MockedContract {
+    func increase_balance(amount: felt) {
+    }
+
+    func get_balance() -> (res: felt) {
+    }
+
+    func get_number() -> (res: felt) {
+    }
+}
+
+@external
+func setup_mock_call() {
+    %{
+        max_examples(3)
+        given(a = strategy.felts())
+        context.contract_address = deploy_contract("./tests/integration/fuzzing/mocked_contract.cairo").contract_address
+        mock_call(context.contract_address, "get_balance", [42])
+    %}
+    return ();
+}
+
+@external
+func test_mock_call{syscall_ptr: felt*, range_check_ptr}(a) {
+    tempvar contract_address;
+    %{ ids.contract_address = context.contract_address %}
+
+    let (balance) = MockedContract.get_balance(contract_address);
+    assert balance = 42;
+
+    %{ mock_call(ids.contract_address, "get_number", [7]) %}
+    let (number) = MockedContract.get_number(contract_address);
+    assert number = 7;
+
+    %{ stop_mock = mock_call(ids.contract_address, "increase_balance", []) %}
+    MockedContract.increase_balance(contract_address, 1);
+    %{ stop_mock() %}
+
+    return ();
+}
+
+@external
+func setup_expect_call() {
+    %{
+        max_examples(3)
+        given(a = strategy.felts())
+        context.contract_address = deploy_contract("./tests/integration/fuzzing/mocked_contract.cairo").contract_address
+    %}
+    return ();
+}
+
+@external
+func test_expect_call{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(a) {
+    tempvar contract_address;
+    %{ ids.contract_address = context.contract_address %}
+
+    %{
+        expect_call(ids.contract_address, "increase_balance", [1])
+        stop_expecting = expect_call(ids.contract_address, "increase_balance", [2])
+    %}
+    MockedContract.increase_balance(contract_address, 1);
+    MockedContract.increase_balance(contract_address, 2);
+    %{ stop_expecting() %}
+
+    let (balance) = MockedContract.get_balance(contract_address);
+    assert balance = 3;
+
+    return ();
+}
@@ -0,0 +1,61 @@
+%lang starknet
+
+@external
+func setup_time_budget() {
+    %{ max_examples(100) %}
+    %{ fuzz_time_budget(3) %}
+    %{ given(a = strategy.felts()) %}
+    return ();
+}
+
+@external
+func test_time_budget{syscall_ptr: felt*, range_check_ptr}(a) {
+    assert a * 2 = a + a;
+    return ();
+}
+
+@external
+func setup_max_examples_before_time_budget() {
+    %{ max_examples(5) %}
+    %{ fuzz_time_budget(1000) %}
+    %{ given(a = strategy.felts()) %}
+    return ();
+}
+
+@external
+func test_max_examples_before_time_budget{syscall_ptr: felt*, range_check_ptr}(a) {
+    assert a * 2 = a + a;
+    return ();
+}
+
+@external
+func setup_examples_with_time_budget() {
+    %{ fuzz_time_budget(1) %}
+    %{ example(a=1) %}
+    %{ example(a=2) %}
+    %{ example(a=3) %}
+    return ();
+}
+
+@external
+func test_examples_with_time_budget{syscall_ptr: felt*, range_check_ptr}(a) {
+    assert a * 2 = a + a;
+    return ();
+}
+
+@external
+func setup_given_with_examples_and_time_budget() {
+    %{ max_examples(100) %}
+    %{ fuzz_time_budget(3) %}
+    %{ given(a = strategy.felts()) %}
+    %{ example(a=1) %}
+    %{ example(a=2) %}
+    %{ example(a=3) %}
+    return ();
+}
+
+@external
+func test_given_with_examples_and_time_budget{syscall_ptr: felt*, range_check_ptr}(a) {
+    assert a * 2 = a + a;
+    return ();
+}
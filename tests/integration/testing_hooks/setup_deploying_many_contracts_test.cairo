@@ -0,0 +1,43 @@
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@contract_interface
+namespace BasicContract {
+    func increase_balance(amount: felt) {
+    }
+
+    func get_balance() -> (res: felt) {
+    }
+}
+
+@external
+func __setup__() {
+    %{
+        context.first_address = deploy_contract("./tests/integration/testing_hooks/basic_contract.cairo").contract_address
+        context.second_address = deploy_contract("./tests/integration/testing_hooks/basic_contract.cairo").contract_address
+    %}
+    return ();
+}
+
+@external
+func test_abi_of_first_contract_is_available{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr
+}() {
+    tempvar first_address;
+    tempvar second_address;
+
+    %{
+        ids.first_address = context.first_address
+        ids.second_address = context.second_address
+        mock_call(context.first_address, "get_balance", {"res": 42})
+        mock_call(context.second_address, "get_balance", {"res": 21})
+    %}
+
+    let (first_result) = BasicContract.get_balance(first_address);
+    let (second_result) = BasicContract.get_balance(second_address);
+
+    assert first_result = 42;
+    assert second_result = 21;
+
+    return ();
+}
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 
 from tests.integration.conftest import (
     RunTestRunnerFixture,
@@ -20,6 +21,49 @@ async def test_testing_hooks(run_test_runner: RunTestRunnerFixture):
     )
 
 
+async def test_testing_hooks_with_state_cached_after_setup(
+    run_test_runner: RunTestRunnerFixture, tmp_path: Path
+):
+    # The project root starts without `.protostar_cache`, so the first run stores the state
+    # and the second one reads it without storing it again.
+    setup_states_path = tmp_path / ".protostar_cache" / "setup_states"
+    entry_modification_times: List[int] = []
+    for _ in range(2):
+        testing_summary = await run_test_runner(
+            Path(__file__).parent / "testing_hooks_test.cairo",
+            cache_setup_states=True,
+            project_root_path=tmp_path,
+        )
+
+        [entry_path] = setup_states_path.iterdir()
+        entry_modification_times.append(entry_path.stat().st_mtime_ns)
+
+        assert_cairo_test_cases(
+            testing_summary,
+            expected_passed_test_cases_names=[
+                "test_contract_was_deployed_in_setup",
+            ],
+            expected_failed_test_cases_names=[],
+        )
+    assert entry_modification_times[0] == entry_modification_times[1]
+
+
+async def test_contracts_deployed_in_setup_keep_abis(
+    run_test_runner: RunTestRunnerFixture,
+):
+    testing_summary = await run_test_runner(
+        Path(__file__).parent / "setup_deploying_many_contracts_test.cairo"
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_abi_of_first_contract_is_available",
+        ],
+        expected_failed_test_cases_names=[],
+    )
+
+
 async def test_setup_case(run_test_runner: RunTestRunnerFixture):
     testing_summary = await run_test_runner(
         Path(__file__).parent / "setup_case_test.cairo"